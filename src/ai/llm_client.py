@@ -10,6 +10,12 @@ import hashlib
 import json
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+# clean_code runs on every LLM response: patterns are compiled once
+_THOUGHT_LINE_RE = re.compile(r'^Thought:.*$', re.MULTILINE)
+_TOOL_TAG_RE = re.compile(r'<tool[^>]*>(.*?)</tool>', re.DOTALL)
+_FENCE_OPEN_RE = re.compile(r'^```(?:python)?\s*')
+_FENCE_CLOSE_RE = re.compile(r'\s*```$')
+
 class LLMClient:
     """
     Client for interacting with the OpenAI API (or compatible APIs like OpenRouter) 
@@ -92,20 +98,20 @@ class LLMClient:
         """
         # 1. Strip "Thought:" lines (Non-greedy match to avoid eating code)
         # Remove lines starting with "Thought:" followed by anything until newline
-        cleaned = re.sub(r'^Thought:.*$', '', response, flags=re.MULTILINE).strip()
+        cleaned = _THOUGHT_LINE_RE.sub('', response).strip()
 
         # 2. Unwrap XML Tool Tags (if present)
         # Regex to extract content inside <tool ...> CONTENT </tool>
         # We use re.DOTALL to let . match newlines
-        tool_match = re.search(r'<tool[^>]*>(.*?)</tool>', cleaned, re.DOTALL)
+        tool_match = _TOOL_TAG_RE.search(cleaned)
         if tool_match:
             cleaned = tool_match.group(1).strip()
 
         # 3. Existing Markdown cleaning...
         # Remove ```python or ``` at the start
-        cleaned = re.sub(r'^```(?:python)?\s*', '', cleaned.strip())
+        cleaned = _FENCE_OPEN_RE.sub('', cleaned.strip())
         # Remove ``` at the end
-        cleaned = re.sub(r'\s*```$', '', cleaned)
+        cleaned = _FENCE_CLOSE_RE.sub('', cleaned)
         
         # Normalize Math Operators (Unicode -> ASCII)
         cleaned = cleaned.replace("≠", "!=")
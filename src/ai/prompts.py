@@ -64,6 +64,26 @@ FINANCIAL_ABSA_PROMPT = (
     "3. Be specific in lists."
 )
 
+# Multi-text variant of FINANCIAL_ABSA_PROMPT: one request for a numbered list of texts
+FINANCIAL_ABSA_BATCH_PROMPT = (
+    "You are a sophisticated financial sentiment analyst. Perform Aspect-Based Sentiment Analysis (ABSA) on each of the numbered texts below.\n"
+    "Identify specific entities (e.g., companies, sectors) and their associated attributes (e.g., revenue, legal, products).\n"
+    "For each entity-attribute pair, determine the sentiment polarity.\n\n"
+    "Input Texts:\n{texts}\n\n"
+    "Output MUST be a valid JSON array with exactly {count} objects, one per input text and in the same order:\n"
+    "[\n"
+    "  {{\n"
+    "    \"Overall_Sentiment\": \"Positive\" | \"Negative\" | \"Neutral\" | \"Mixed\",\n"
+    "    \"Positive_Aspect\": [\"List of specific positive attributes found\"],\n"
+    "    \"Negative_Aspect\": [\"List of specific negative attributes found\"]\n"
+    "  }}\n"
+    "]\n\n"
+    "Constraints:\n"
+    "1. Do not use Markdown formatting (no ```json code blocks).\n"
+    "2. Return RAW JSON only.\n"
+    "3. Be specific in lists."
+)
+
 
 # NOTE: Strategy generation prompts have been moved to src/ai/prompts_agent.py
 # SYSTEM_PROMPT has been deprecated and removed to prevent "Split Brain" issues.
@@ -0,0 +1,114 @@
+import json
+import sqlite3
+import hashlib
+import time
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+from src.config.settings import settings
+
+class ResponseCache:
+    """
+    Persistent key/value store for LLM results (translations, sentiment scores) and fetched news feeds.
+    Keys are content hashes (see make_key), values are JSON-serializable.
+    Backed by a single SQLite file; safe to share between threads.
+    Bounded LRU: beyond `max_entries` rows the least recently read or written entries are evicted.
+    """
+    def __init__(self, path: str, max_entries: Optional[int] = None):
+        self.path = str(path)
+        self.max_entries = settings.RESPONSE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=settings.DEFAULT_TIMEOUT, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            # Caches created before the LRU bound have no access stamp: they count as least recent
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "accessed" not in columns:
+                self._conn.execute("ALTER TABLE responses ADD COLUMN accessed INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)")
+            self._conn.commit()
+            # Upper bound on the row count (replaced keys are counted again); recounted when eviction runs
+            self._rows = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(namespace: str, *parts: str) -> str:
+        """sha1 over the namespace and the content parts (order-sensitive)."""
+        digest = hashlib.sha1(namespace.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\x00")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, object]:
+        """Returns {key: value} for the keys that are cached."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        found = {}
+        try:
+            with self._lock:
+                # Stay well below SQLite's host-parameter limit
+                for i in range(0, len(keys), 500):
+                    chunk = keys[i:i + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, value FROM responses WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    ).fetchall()
+                    found.update((key, json.loads(value)) for key, value in rows)
+                if found:
+                    now = time.time_ns()
+                    self._conn.executemany("UPDATE responses SET accessed = ? WHERE key = ?", [(now, key) for key in found])
+                    self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache read failed: {e}")
+        return found
+
+    def set_many(self, items: Dict[str, object]) -> None:
+        if not items:
+            return
+        try:
+            with self._lock:
+                now = time.time_ns()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO responses (key, value, accessed) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value, ensure_ascii=False), now) for key, value in items.items()]
+                )
+                self._rows += len(items)
+                if self._rows > self.max_entries:
+                    self._evict()
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache write failed: {e}")
+
+    def _evict(self) -> None:
+        """Deletes the least recently used rows beyond max_entries (caller holds the lock)."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self.max_entries,)
+        )
+        self._rows = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+@lru_cache(maxsize=4)
+def _open_cache(path: str) -> Optional[ResponseCache]:
+    try:
+        return ResponseCache(path)
+    except sqlite3.Error as e:
+        logging.getLogger(__name__).warning(f"Response cache unavailable ({path}): {e}")
+        return None
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Shared cache at settings.LLM_CACHE_PATH, or None when settings.LLM_RESPONSE_CACHE is off.
+    """
+    if not settings.LLM_RESPONSE_CACHE:
+        return None
+    return _open_cache(str(settings.LLM_CACHE_PATH))
+
+def get_news_cache() -> Optional[ResponseCache]:
+    """
+    Shared feed cache at settings.NEWS_CACHE_PATH, or None when settings.NEWS_DISK_CACHE is off.
+    """
+    if not settings.NEWS_DISK_CACHE:
+        return None
+    return _open_cache(str(settings.NEWS_CACHE_PATH))
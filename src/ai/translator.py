@@ -2,6 +2,7 @@ from typing import List, Optional
 import hashlib
 from functools import lru_cache
 from src.ai.llm_client import LLMClient
+from src.ai.response_cache import ResponseCache, get_response_cache
 import logging
 
 class TextTranslator:
@@ -9,8 +10,9 @@ class TextTranslator:
     A lightweight translation layer using LLM to convert non-English text to English.
     Designed for financial context preservation.
     """
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    def __init__(self, llm_client: Optional[LLMClient] = None, cache: Optional[ResponseCache] = None):
         self.llm_client = llm_client if llm_client else LLMClient()
+        self.cache = cache if cache is not None else get_response_cache()
         self.logger = logging.getLogger(__name__)
 
     @lru_cache(maxsize=1024)
@@ -24,6 +26,7 @@ class TextTranslator:
     def translate_batch(self, texts: List[str]) -> List[str]:
         """
         Translates a list of texts to English in a single batch to save tokens.
+        Texts translated before (response cache) are not sent again.
         
         Args:
             texts (List[str]): List of strings to translate.
@@ -33,7 +36,34 @@ class TextTranslator:
         """
         if not texts:
             return []
-            
+        
+        if self.cache is None:
+            translated = self._translate_remote(texts)
+            return translated if translated is not None else texts
+        
+        keys = [ResponseCache.make_key("translation", t) for t in texts]
+        cached = self.cache.get_many(keys)
+        
+        misses = list(dict.fromkeys(t for t, k in zip(texts, keys) if k not in cached))
+        if misses:
+            translated = self._translate_remote(misses)
+            if translated is None:
+                # Fail open for the misses; failures are not cached
+                translated = misses
+            else:
+                new_entries = {ResponseCache.make_key("translation", t): tr for t, tr in zip(misses, translated)}
+                self.cache.set_many(new_entries)
+                cached.update(new_entries)
+            fallback = dict(zip(misses, translated))
+        else:
+            fallback = {}
+        
+        return [cached[k] if k in cached else fallback[t] for t, k in zip(texts, keys)]
+
+    def _translate_remote(self, texts: List[str]) -> Optional[List[str]]:
+        """
+        One LLM request for `texts`. Returns None if the translation failed.
+        """
         # Filter empty strings but keep track of indices to restore them if needed
         # For simplicity, we'll just send everything.
         
@@ -74,10 +104,10 @@ class TextTranslator:
                     f"Translation count mismatch! Input: {len(texts)}, Output: {len(cleaned_lines)}. "
                     "Returning originals for safety."
                 )
-                return texts
+                return None
                 
             return cleaned_lines
             
         except Exception as e:
             self.logger.error(f"Translation failed: {e}")
-            return texts # Fail open: return original text
+            return None # Caller fails open: original text
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
+from typing import Optional
 
 from src.config.settings import settings
 
@@ -31,15 +33,20 @@ def calculate_max_drawdown(equity_curve: pd.Series) -> float:
     drawdown = (equity_curve - cummax) / cummax
     return drawdown.min()
 
-def calculate_sharpe_ratio(returns: pd.Series, risk_free_rate: float = settings.RISK_FREE_RATE) -> float:
+def calculate_sharpe_ratio(returns, risk_free_rate: float = settings.RISK_FREE_RATE) -> float:
     """
     Calculate Sharpe Ratio.
     (Daily_Returns.mean() - Risk_Free_Rate_Daily) / Daily_Returns.std() * sqrt(252)
+    
+    Accepts a pd.Series or a 1-D ndarray. NaNs are skipped and std uses ddof=1 (pandas semantics).
     """
-    if returns.empty:
+    returns = np.asarray(returns, dtype=np.float64)
+    returns = returns[~np.isnan(returns)]
+    if returns.size < 2:
         return 0.0
         
-    std = returns.std()
+    with np.errstate(invalid='ignore'):  # inf returns -> NaN std, handled below
+        std = returns.std(ddof=1)
     if np.isnan(std) or std < 1e-9:
         return 0.0
     
@@ -50,8 +57,7 @@ def calculate_sharpe_ratio(returns: pd.Series, risk_free_rate: float = settings.
     # If input is 0.02 (annual), daily is approx 0.02/252.
     
     rf_daily = risk_free_rate / 252
-    excess_returns = returns - rf_daily
-    return np.sqrt(252) * (excess_returns.mean() / returns.std())
+    return float(np.sqrt(252) * ((returns.mean() - rf_daily) / std))
 
 def calculate_win_rate(trades_pnl: pd.Series) -> float:
     """
@@ -69,7 +75,14 @@ def calculate_win_rate(trades_pnl: pd.Series) -> float:
     winning_trades = (trades_pnl > 0).sum()
     return winning_trades / total_trades
 
-def calculate_round_trip_returns(trades: list, commission_rate: float = 0.0) -> list:
+@dataclass(slots=True)
+class _QueueEntry:
+    """Open lot waiting to be matched in the FIFO queues (attribute access instead of dict hashing)."""
+    price: float
+    qty: float
+    entry_equity: float
+
+def calculate_round_trip_returns(trades: list, commission_rate: float = 0.0) -> np.ndarray:
     """
     Calculate round-trip trade returns using FIFO matching.
     
@@ -78,13 +91,17 @@ def calculate_round_trip_returns(trades: list, commission_rate: float = 0.0) ->
         commission_rate: Commission rate per trade (e.g., 0.001 for 0.1%).
         
     Returns:
-        List of float returns (percentage, e.g., 0.05 for 5%).
+        1-D float64 array of returns (percentage, e.g., 0.05 for 5%).
     """
     import collections
     
     buy_queue = collections.deque()   # Waiting for SELL (Longs)
     sell_queue = collections.deque()  # Waiting for BUY (Shorts)
-    returns = []
+    
+    # Each match either exhausts the incoming trade or pops a queued entry,
+    # and every trade enqueues at most one entry, so 2 * N bounds the output.
+    returns = np.empty(2 * len(trades), dtype=np.float64)
+    k = 0
     
     for t in trades:
         if t.type == 'BUY':
@@ -93,39 +110,35 @@ def calculate_round_trip_returns(trades: list, commission_rate: float = 0.0) ->
             # 1. Check if we need to cover any Short positions (Short Cover)
             while qty_to_buy > 0 and sell_queue:
                 matched_short = sell_queue[0]
-                matched_qty = min(qty_to_buy, matched_short['qty'])
+                matched_qty = min(qty_to_buy, matched_short.qty)
                 
                 # Calculate Short Return
                 # Profit = (Short_Entry_Price - Buy_Cover_Price) * Qty
-                if matched_short['entry_equity'] > 0:
-                    gross_pnl = (matched_short['price'] - t.entry_price) * matched_qty
-                    
-                    total_commission = (matched_short['price'] * matched_qty * commission_rate) + \
-                                       (t.entry_price * matched_qty * commission_rate)
-                                       
-                    net_pnl = gross_pnl - total_commission
-                    ret = net_pnl / matched_short['entry_equity']
-                    returns.append(ret)
+                if matched_short.entry_equity > 0:
+                    # Commission on both legs: (entry + exit) * qty * rate
+                    cq = matched_qty * commission_rate
+                    net_pnl = (matched_short.price - t.entry_price) * matched_qty - \
+                              (matched_short.price + t.entry_price) * cq
+                    ret = net_pnl / matched_short.entry_equity
+                    returns[k] = ret
+                    k += 1
                 else:
                     # Legacy fallback
-                    if matched_short['price'] > 0:
-                        ret = (matched_short['price'] - t.entry_price) / matched_short['price']
-                        returns.append(ret)
+                    if matched_short.price > 0:
+                        ret = (matched_short.price - t.entry_price) / matched_short.price
+                        returns[k] = ret
+                        k += 1
                 
                 # Update state
                 qty_to_buy -= matched_qty
-                matched_short['qty'] -= matched_qty
+                matched_short.qty -= matched_qty
                 
-                if matched_short['qty'] <= 0:
+                if matched_short.qty <= 0:
                     sell_queue.popleft()
             
             # 2. If quantity remains, it's a new Long Entry
             if qty_to_buy > 0:
-                buy_queue.append({
-                    'price': t.entry_price,
-                    'qty': qty_to_buy,
-                    'entry_equity': getattr(t, 'entry_equity', 0.0)
-                })
+                buy_queue.append(_QueueEntry(t.entry_price, qty_to_buy, getattr(t, 'entry_equity', 0.0)))
 
         elif t.type == 'SELL':
             qty_to_sell = t.quantity
@@ -133,43 +146,40 @@ def calculate_round_trip_returns(trades: list, commission_rate: float = 0.0) ->
             # 1. Check if we need to close any Long positions (Long Exit)
             while qty_to_sell > 0 and buy_queue:
                 matched_buy = buy_queue[0]
-                matched_qty = min(qty_to_sell, matched_buy['qty'])
+                matched_qty = min(qty_to_sell, matched_buy.qty)
                 
                 # Calculate Long Return
                 # Profit = (Sell_Price - Buy_Entry_Price) * Qty
-                if matched_buy['entry_equity'] > 0:
-                    gross_pnl = (t.entry_price - matched_buy['price']) * matched_qty
-                    
-                    total_commission = (matched_buy['price'] * matched_qty * commission_rate) + \
-                                       (t.entry_price * matched_qty * commission_rate)
-                                       
-                    net_pnl = gross_pnl - total_commission
-                    ret = net_pnl / matched_buy['entry_equity']
-                    returns.append(ret)
+                if matched_buy.entry_equity > 0:
+                    # Commission on both legs: (entry + exit) * qty * rate
+                    cq = matched_qty * commission_rate
+                    net_pnl = (t.entry_price - matched_buy.price) * matched_qty - \
+                              (matched_buy.price + t.entry_price) * cq
+                    ret = net_pnl / matched_buy.entry_equity
+                    returns[k] = ret
+                    k += 1
                 else:
                     # Legacy fallback
-                    if matched_buy['price'] > 0:
-                        ret = (t.entry_price - matched_buy['price']) / matched_buy['price']
-                        returns.append(ret)
+                    if matched_buy.price > 0:
+                        ret = (t.entry_price - matched_buy.price) / matched_buy.price
+                        returns[k] = ret
+                        k += 1
                 
                 # Update state
                 qty_to_sell -= matched_qty
-                matched_buy['qty'] -= matched_qty
+                matched_buy.qty -= matched_qty
                 
-                if matched_buy['qty'] <= 0:
+                if matched_buy.qty <= 0:
                     buy_queue.popleft()
             
             # 2. If quantity remains, it's a new Short Entry
             if qty_to_sell > 0:
-                sell_queue.append({
-                    'price': t.entry_price,
-                    'qty': qty_to_sell,
-                    'entry_equity': getattr(t, 'entry_equity', 0.0)
-                })
+                sell_queue.append(_QueueEntry(t.entry_price, qty_to_sell, getattr(t, 'entry_equity', 0.0)))
                     
-    return returns
+    return returns[:k]
 
-def calculate_metrics(equity_curve: pd.DataFrame, trades: list, initial_capital: float) -> dict:
+def calculate_metrics(equity_curve: pd.DataFrame, trades: list, initial_capital: float,
+                      trade_returns: Optional[np.ndarray] = None) -> dict:
     """
     Calculate standard performance metrics.
     
@@ -177,6 +187,8 @@ def calculate_metrics(equity_curve: pd.DataFrame, trades: list, initial_capital:
         equity_curve: DataFrame with 'equity', 'position_value' columns and datetime index.
         trades: List of Trade objects.
         initial_capital: Starting capital.
+        trade_returns: Pre-computed output of calculate_round_trip_returns(trades).
+                       If given, the FIFO matching pass is skipped.
         
     Returns:
         Dictionary of metrics.
@@ -203,7 +215,13 @@ def calculate_metrics(equity_curve: pd.DataFrame, trades: list, initial_capital:
     max_dd = calculate_max_drawdown(equity_curve['equity'])
     
     # Sharpe
-    daily_returns = equity_curve['equity'].pct_change().fillna(0)
+    # Equivalent to pct_change().fillna(0) without the intermediate Series
+    eq = equity_curve['equity'].to_numpy(dtype=np.float64)
+    daily_returns = np.empty_like(eq)
+    daily_returns[0] = 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(eq[1:], eq[:-1], out=daily_returns[1:])
+    daily_returns[1:] -= 1.0
     sharpe = calculate_sharpe_ratio(daily_returns)
     
     # Win Rate
@@ -211,14 +229,21 @@ def calculate_metrics(equity_curve: pd.DataFrame, trades: list, initial_capital:
     # The UI uses round_trip for win rate, let's stick to simple trade PnL if possible or reuse calculate_win_rate
     # But calculate_win_rate takes a Series of PnL.
     # Let's use calculate_round_trip_returns to be consistent with UI.
-    trade_returns = calculate_round_trip_returns(trades)
-    win_rate = len([r for r in trade_returns if r > 0]) / len(trade_returns) if trade_returns else 0.0
+    if trade_returns is None:
+        trade_returns = calculate_round_trip_returns(trades)
+    else:
+        trade_returns = np.asarray(trade_returns, dtype=np.float64)
+    win_rate = float((trade_returns > 0).mean()) if trade_returns.size else 0.0
     
     # Avg Exposure
     # Exposure = Abs(Position Value) / Equity
     if 'position_value' in equity_curve.columns:
-        exposure_series = equity_curve['position_value'].abs() / equity_curve['equity']
-        avg_exposure = exposure_series.mean()
+        # np.abs allocates a fresh array, reused in place as the ratio buffer
+        exposure = np.abs(equity_curve['position_value'].to_numpy(dtype=np.float64))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(exposure, eq, out=exposure)
+        exposure = exposure[~np.isnan(exposure)]  # Series.mean() skips NaN
+        avg_exposure = float(exposure.mean()) if exposure.size else np.nan
     else:
         avg_exposure = 0.0
         
@@ -1,10 +1,37 @@
 
 import json
 import logging
-import re
 from typing import List, Dict, Optional
 from src.ai.llm_client import LLMClient
-from src.ai.prompts import FINANCIAL_ABSA_PROMPT
+from src.ai.prompts import FINANCIAL_ABSA_PROMPT, FINANCIAL_ABSA_BATCH_PROMPT
+from src.config.settings import settings
+
+# Prefer orjson (C parser) when installed, fall back to stdlib json otherwise.
+# Both decode errors subclass ValueError.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Incremental decoder for the first complete JSON value (stops at its closing bracket)
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json(text: str, open_char: str, close_char: str):
+    """
+    Parses the JSON object/array embedded in an LLM response.
+    Fast path: the first `open_char` to the last `close_char` (same span as a greedy regex search).
+    If that span does not parse (e.g. commentary with brackets after the JSON), decode the first
+    complete value starting at `open_char` instead. Raises ValueError when neither works.
+    """
+    start = text.find(open_char)
+    end = text.rfind(close_char)
+    if start < 0 or end <= start:
+        return _json_loads(text)
+    try:
+        return _json_loads(text[start:end + 1])
+    except ValueError:
+        return _JSON_DECODER.raw_decode(text, start)[0]
 
 class ABSAAnalyzer:
     """
@@ -45,15 +72,9 @@ class ABSAAnalyzer:
             # Parse JSON
             try:
                 # Attempt to find JSON object pattern just in case
-                match = re.search(r'\{.*\}', cleaned_response, re.DOTALL)
-                if match:
-                    json_str = match.group(0)
-                else:
-                    json_str = cleaned_response
-                    
-                data = json.loads(json_str)
+                data = _extract_json(cleaned_response, '{', '}')
                 return data
-            except json.JSONDecodeError:
+            except ValueError:
                 self.logger.warning(f"ABSA parsing failed for text: {text[:50]}... Response: {cleaned_response[:50]}")
                 return {"Overall_Sentiment": "Neutral", "Error": "Parse Failure"}
                 
@@ -61,9 +82,56 @@ class ABSAAnalyzer:
             self.logger.error(f"ABSA API Inference failed: {e}")
             return {"Overall_Sentiment": "Neutral", "Error": str(e)}
 
+    def _analyze_chunk(self, texts: List[str]) -> Optional[List[Dict]]:
+        """
+        Analyzes several texts with a single API call.
+        Returns None if the response is not a JSON array with one object per text.
+        """
+        numbered = "\n".join(f"[{i + 1}] {text}" for i, text in enumerate(texts))
+        messages = [
+            {"role": "system", "content": "You are a helpful financial assistant."},
+            {"role": "user", "content": FINANCIAL_ABSA_BATCH_PROMPT.format(texts=numbered, count=len(texts))}
+        ]
+
+        try:
+            response_str = self.llm_client.get_completion(messages=messages, temperature=0.1)
+            cleaned_response = self.llm_client.clean_code(response_str)
+
+            if '[' not in cleaned_response:
+                return None
+            data = _extract_json(cleaned_response, '[', ']')
+        except Exception as e:
+            self.logger.warning(f"Batched ABSA request failed for {len(texts)} texts: {e}")
+            return None
+
+        if not isinstance(data, list) or len(data) != len(texts) or not all(isinstance(d, dict) for d in data):
+            self.logger.warning(f"Batched ABSA response did not match {len(texts)} inputs")
+            return None
+        return data
+
     def analyze_batch(self, texts: List[str]) -> List[Dict]:
         """
-        Sequential analysis for batch input.
-        API calls are sequential unless async is implemented in LLMClient (usually requests is sync).
+        Analysis for batch input: texts are packed into as few API calls as possible
+        (up to settings.LLM_MAX_INPUT_CHARS per call).
+        A chunk whose response cannot be matched back to its texts is re-run one text at a time.
         """
-        return [self.analyze(t) for t in texts]
+        results: List[Dict] = []
+        chunk: List[str] = []
+        chunk_chars = 0
+
+        def flush():
+            if len(chunk) == 1:
+                results.append(self.analyze(chunk[0]))
+            elif chunk:
+                batch = self._analyze_chunk(chunk)
+                results.extend(batch if batch is not None else [self.analyze(t) for t in chunk])
+
+        for text in texts:
+            if chunk and chunk_chars + len(text) > settings.LLM_MAX_INPUT_CHARS:
+                flush()
+                chunk, chunk_chars = [], 0
+            chunk.append(text)
+            chunk_chars += len(text)
+        flush()
+
+        return results
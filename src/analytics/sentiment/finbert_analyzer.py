@@ -4,7 +4,27 @@ from torch.utils.data import DataLoader, Dataset
 from transformers import BertTokenizer, BertForSequenceClassification
 import numpy as np
 import logging
-from typing import List, Dict
+import os
+from typing import List, Dict, Optional
+
+# Optional int8 CPU backend; PyTorch is used without it
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+def quantize_onnx(onnx_path: str, int8_path: str) -> str:
+    """
+    One-time conversion of a FinBERT ONNX export to dynamic int8 (int8 weights, activations quantized at run time).
+    Export the FP32 graph first, e.g.:
+        optimum-cli export onnx --model yiyanghkust/finbert-tone --task text-classification ./finbert_onnx
+        quantize_onnx("./finbert_onnx/model.onnx", "./finbert_onnx/model.int8.onnx")
+    then point settings.FINBERT_ONNX_PATH at the int8 file.
+    """
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
 
 class FinancialTextDataset(Dataset):
     """
@@ -39,21 +59,43 @@ class FinBERTAnalyzer:
     """
     Analyzer using yiyanghkust/finbert-tone for financial sentiment classification.
     """
-    def __init__(self, model_name: str = "yiyanghkust/finbert-tone", batch_size: int = 16, device=None):
+    def __init__(self, model_name: str = "yiyanghkust/finbert-tone", batch_size: int = 16, device=None, onnx_path: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         self.batch_size = batch_size
         self.model_name = model_name
         self.device = device if device else torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.onnx_path = onnx_path
+        self.model = None
+        self.onnx_session = None
         
         self.logger.info(f"Initializing FinBERTAnalyzer with {model_name} on {self.device}")
-        
+        self._load_models()
+
+    def _load_models(self):
+        """
+        Loads the tokenizer and either the int8 ONNX Runtime session (CPU, when `onnx_path` is set)
+        or the PyTorch model.
+        """
         try:
-            self.tokenizer = BertTokenizer.from_pretrained(model_name)
+            self.tokenizer = BertTokenizer.from_pretrained(self.model_name)
+            
+            if self.onnx_path and torch.device(self.device).type == "cpu":
+                if not ONNXRUNTIME_AVAILABLE:
+                    self.logger.warning("onnxruntime is not installed; FinBERT falls back to PyTorch.")
+                elif not os.path.exists(self.onnx_path):
+                    self.logger.warning(f"FinBERT ONNX model not found at {self.onnx_path}; falling back to PyTorch.")
+                else:
+                    options = ort.SessionOptions()
+                    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                    self.onnx_session = ort.InferenceSession(self.onnx_path, options, providers=['CPUExecutionProvider'])
+                    self._onnx_inputs = {i.name for i in self.onnx_session.get_inputs()}
+                    self.logger.info(f"FinBERT running on ONNX Runtime ({self.onnx_path})")
+                    return
             
             # [FIX] Force low_cpu_mem_usage=False to prevent "meta tensor" error if accelerate is present
             # This ensures the model is fully loaded into CPU RAM before moving.
             self.model = BertForSequenceClassification.from_pretrained(
-                model_name, 
+                self.model_name, 
                 num_labels=3, 
                 ignore_mismatched_sizes=True,
                 low_cpu_mem_usage=False
@@ -73,6 +115,9 @@ class FinBERTAnalyzer:
         """
         if not texts:
             return []
+        
+        if self.onnx_session is not None:
+            return self._to_results(self._predict_onnx(texts))
 
         dataset = FinancialTextDataset(texts, self.tokenizer)
         data_loader = DataLoader(dataset, batch_size=self.batch_size, num_workers=0) # Windows likes num_workers=0
@@ -109,6 +154,33 @@ class FinBERTAnalyzer:
             self.logger.error(f"Inference failed: {e}")
             return []
 
+        return self._to_results(probs_list)
+
+    def _predict_onnx(self, texts: List[str]) -> List[List[float]]:
+        """
+        ONNX Runtime forward pass: each batch is padded to its longest text only (not 512), logits softmaxed in numpy.
+        """
+        probs_list = []
+        try:
+            texts = [str(t) for t in texts]
+            for start in range(0, len(texts), self.batch_size):
+                encoding = self.tokenizer(
+                    texts[start:start + self.batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=512,
+                    return_tensors='np',
+                )
+                feed = {name: np.asarray(encoding[name], dtype=np.int64) for name in self._onnx_inputs if name in encoding}
+                logits = self.onnx_session.run(None, feed)[0]
+                exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+                probs_list.extend((exp / exp.sum(axis=1, keepdims=True)).tolist())
+        except Exception as e:
+            self.logger.error(f"Inference failed: {e}")
+            return []
+        return probs_list
+
+    def _to_results(self, probs_list: List[List[float]]) -> List[Dict[str, float]]:
         results = []
         for p in probs_list:
             # Map based on yiyanghkust/finbert-tone
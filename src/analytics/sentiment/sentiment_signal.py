@@ -40,19 +40,16 @@ class SentimentFactorEngine:
             return 0.0
             
         # Extract relevance if available, else default to 1.0
-        relevance_scores = []
-        for item in news_items:
-            # Check for 'relevance' key (e.g. from LLM or metadata)
-            # If not present, check impact tier
-            rel = item.get('relevance_score', 1.0) 
-            relevance_scores.append(rel)
-            
-        avg_relevance = np.mean(relevance_scores) if relevance_scores else 0.0
-        
-        final_signal = sentiment_score * avg_relevance
+        # (e.g. from LLM or metadata; preallocated via count=)
+        relevance_scores = np.fromiter(
+            (item.get('relevance_score', 1.0) for item in news_items),
+            dtype=np.float64,
+            count=len(news_items)
+        )
+        avg_relevance = float(relevance_scores.mean())
         
         # Clamp
-        return max(-1.0, min(1.0, final_signal))
+        return float(np.clip(sentiment_score * avg_relevance, -1.0, 1.0))
 
     def compute_factor_series(self, sentiment_series: pd.Series, relevance_series: pd.Series) -> pd.Series:
         """
@@ -0,0 +1,165 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+# distutils: extra_compile_args = -ffp-contract=off
+"""
+Cython (ahead-of-time compiled) twin of src.backtest.engine_kernels, for environments without Numba.
+
+Same entry points, arguments and return tuple as the Numba kernels. Build in place with:
+    cythonize -i src/backtest/_engine_kernels.pyx
+(-ffp-contract=off keeps the compiler from fusing a*b+c into FMA, so results stay bit-identical
+to the Numba kernel and the pure-Python event loop.)
+"""
+import numpy as np
+from libc.math cimport floor, fabs
+from libc.stdint cimport int8_t, int64_t
+
+# position_sizing_method codes (see src.backtest.engine_kernels)
+SIZING_FIXED_PERCENT = 0
+SIZING_FIXED_AMOUNT = 1
+
+# Trade direction codes
+TRADE_BUY = 0
+TRADE_SELL = 1
+
+cdef tuple _run_loop(const double[::1] opens, const double[::1] closes, const double[::1] strengths,
+                     const double[::1] price_eps, const double[::1] target_qtys,
+                     const double[::1] buy_prices, const double[::1] sell_prices, const double[::1] cap_denoms,
+                     double initial_capital, double commission_rate, double min_commission,
+                     bint long_only, int sizing_method, double sizing_target, double eps, double min_exposure):
+    """
+    Loop body of src.backtest.engine_kernels._run_loop, line for line (see its docstring).
+    """
+    cdef Py_ssize_t n = opens.shape[0]
+    equity_np = np.empty(n, dtype=np.float64)
+    cash_np = np.empty(n, dtype=np.float64)
+    pv_np = np.empty(n, dtype=np.float64)
+
+    # At most one fill per bar
+    trade_bar_np = np.empty(n, dtype=np.int64)
+    trade_price_np = np.empty(n, dtype=np.float64)
+    trade_qty_np = np.empty(n, dtype=np.float64)
+    trade_type_np = np.empty(n, dtype=np.int8)
+    trade_equity_np = np.empty(n, dtype=np.float64)
+    trade_commission_np = np.empty(n, dtype=np.float64)
+
+    cdef double[::1] equity_arr = equity_np
+    cdef double[::1] cash_arr = cash_np
+    cdef double[::1] pv_arr = pv_np
+    cdef int64_t[::1] trade_bar = trade_bar_np
+    cdef double[::1] trade_price = trade_price_np
+    cdef double[::1] trade_qty = trade_qty_np
+    cdef int8_t[::1] trade_type = trade_type_np
+    cdef double[::1] trade_equity = trade_equity_np
+    cdef double[::1] trade_commission = trade_commission_np
+
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n_trades = 0
+    cdef Py_ssize_t n_bars = 0
+    cdef double capital = initial_capital
+    cdef double position = 0.0
+    cdef double price, strength, current_equity, target_qty, delta_qty, quantity
+    cdef double fill_cost, commission, position_value
+    cdef bint is_buy
+
+    for i in range(n):
+        price = opens[i]  # Trade at Open
+        strength = strengths[i]
+
+        # Only evaluate the signal if state change is possible
+        if strength != 0.0 or fabs(position) > eps:
+            if price != 0.0:
+                current_equity = capital + position * price
+
+                # 1. Calculate Target Quantity (only fixed_percent depends on running equity)
+                if sizing_method == SIZING_FIXED_AMOUNT:
+                    target_qty = target_qtys[i]
+                else:
+                    target_qty = (current_equity * sizing_target * strength) / price_eps[i]
+
+                # Minimum Exposure Filter
+                if fabs(target_qty * price) < current_equity * min_exposure:
+                    target_qty = 0.0
+
+                # Long Only Enforce (same NaN semantics as max(0.0, x))
+                if long_only and not target_qty > 0.0:
+                    target_qty = 0.0
+
+                # 2. Calculate Delta
+                delta_qty = target_qty - position
+
+                # 3. Generate & Fill Order
+                if fabs(delta_qty) > eps:
+                    is_buy = delta_qty > 0
+                    quantity = fabs(delta_qty)
+
+                    if is_buy:
+                        if quantity * price > capital:
+                            # Cap quantity by available cash
+                            quantity = floor(capital / cap_denoms[i])
+                    elif long_only:
+                        # Oversell Protection
+                        if position < quantity:
+                            quantity = position
+
+                    if quantity > eps:
+                        if is_buy:
+                            fill_cost = buy_prices[i] * quantity
+                        else:
+                            fill_cost = sell_prices[i] * quantity
+
+                        commission = fill_cost * commission_rate
+                        if min_commission > commission:
+                            commission = min_commission
+
+                        if is_buy:
+                            capital -= fill_cost + commission
+                            position += quantity
+                        else:
+                            capital += fill_cost - commission
+                            position -= quantity
+                            if fabs(position) < eps:
+                                position = 0.0
+
+                        trade_bar[n_trades] = i
+                        trade_price[n_trades] = fill_cost / quantity
+                        trade_qty[n_trades] = quantity
+                        trade_type[n_trades] = TRADE_BUY if is_buy else TRADE_SELL
+                        trade_equity[n_trades] = capital + position * price
+                        trade_commission[n_trades] = commission
+                        n_trades += 1
+
+        # End of Day Accounting
+        position_value = position * closes[i]
+        current_equity = capital + position_value
+        equity_arr[i] = current_equity
+        cash_arr[i] = capital
+        pv_arr[i] = position_value
+        n_bars = i + 1
+
+        if current_equity <= 0:
+            break
+
+    return (equity_np, cash_np, pv_np, n_bars,
+            trade_bar_np, trade_price_np, trade_qty_np, trade_type_np, trade_equity_np, trade_commission_np, n_trades,
+            capital, position)
+
+def run_loop_fixed_percent(opens, closes, strengths, price_eps, buy_prices, sell_prices, cap_denoms,
+                           double initial_capital, double commission_rate, double min_commission,
+                           bint long_only, double sizing_target, double eps, double min_exposure):
+    """
+    run loop for position_sizing_method == "fixed_percent" (see engine_kernels.run_loop_fixed_percent).
+    """
+    # float32 signals are widened exactly; the loop is typed on float64
+    strengths = np.ascontiguousarray(strengths, dtype=np.float64)
+    return _run_loop(opens, closes, strengths, price_eps, price_eps, buy_prices, sell_prices, cap_denoms,
+                     initial_capital, commission_rate, min_commission,
+                     long_only, SIZING_FIXED_PERCENT, sizing_target, eps, min_exposure)
+
+def run_loop_fixed_amount(opens, closes, target_qtys, buy_prices, sell_prices, cap_denoms,
+                          double initial_capital, double commission_rate, double min_commission,
+                          bint long_only, double eps, double min_exposure):
+    """
+    run loop for position_sizing_method == "fixed_amount" (see engine_kernels.run_loop_fixed_amount).
+    """
+    return _run_loop(opens, closes, target_qtys, target_qtys, target_qtys, buy_prices, sell_prices, cap_denoms,
+                     initial_capital, commission_rate, min_commission,
+                     long_only, SIZING_FIXED_AMOUNT, 0.0, eps, min_exposure)
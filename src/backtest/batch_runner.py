@@ -0,0 +1,55 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple, Any, List
+
+import pandas as pd
+
+from src.backtest_engine import BacktestEngine, Trade
+
+def _run_one(job: Tuple[str, pd.DataFrame, pd.Series, Dict[str, Any], Dict[str, Any]]) -> Tuple[str, pd.DataFrame, List[Trade]]:
+    """
+    Worker: runs one instrument in its own BacktestEngine.
+    Top-level (not a closure/lambda) so it pickles under the 'spawn' start method (macOS/Windows).
+    """
+    symbol, data, signals, engine_kwargs, sizing = job
+    engine = BacktestEngine(**engine_kwargs)
+    if sizing:
+        engine.set_position_sizing(**sizing)
+    engine.run(data, signals)
+    return symbol, engine.equity_curve, engine.trades
+
+def run_batch(data_dict: Dict[str, pd.DataFrame], signals_dict: Dict[str, pd.Series],
+              engine_kwargs: Optional[Dict[str, Any]] = None, sizing: Optional[Dict[str, Any]] = None,
+              max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Runs independent single-instrument backtests in parallel, one process per core.
+
+    Args:
+        data_dict: Symbol -> OHLCV DataFrame.
+        signals_dict: Symbol -> signal Series (same contract as BacktestEngine.run).
+        engine_kwargs: BacktestEngine constructor arguments shared by every instrument.
+        sizing: Keyword arguments for BacktestEngine.set_position_sizing (method, target, amount).
+        max_workers: Process count (default: os.cpu_count()).
+
+    Returns:
+        Symbol -> {'equity_curve': DataFrame, 'trades': List[Trade]}
+    """
+    engine_kwargs = engine_kwargs or {}
+    sizing = sizing or {}
+    jobs = [(symbol, data, signals_dict[symbol], engine_kwargs, sizing) for symbol, data in data_dict.items()]
+
+    if not jobs:
+        return {}
+
+    n_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+    if n_workers <= 1:
+        # No point paying process start-up + IPC for a single worker
+        results = map(_run_one, jobs)
+    else:
+        # Amortize IPC by handing each worker several instruments per round-trip
+        chunksize = max(1, len(jobs) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_run_one, jobs, chunksize=chunksize))
+
+    return {symbol: {'equity_curve': equity_curve, 'trades': trades} for symbol, equity_curve, trades in results}
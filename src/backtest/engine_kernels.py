@@ -0,0 +1,180 @@
+import numpy as np
+from numba import njit, types
+
+# position_sizing_method codes (strings cannot cross into the kernel)
+SIZING_FIXED_PERCENT = 0
+SIZING_FIXED_AMOUNT = 1
+
+# Trade direction codes
+TRADE_BUY = 0
+TRADE_SELL = 1
+
+@njit(cache=True, inline='always')
+def _run_loop(opens, closes, strengths, price_eps, target_qtys, buy_prices, sell_prices, cap_denoms,
+              initial_capital, commission_rate, min_commission,
+              long_only, sizing_method, sizing_target, eps, min_exposure):
+    """
+    Numba compiled twin of BacktestEngine's event loop (Signal -> Order -> Fill -> EOD accounting).
+    Inlined into the per-sizing-method entry points below, where sizing_method is a constant.
+
+    Mirrors the event-driven path bar for bar so both produce identical trades and equity:
+    - Signals are already T+1 aligned; execution happens at the Open, accounting at the Close.
+    - Target-Delta sizing, ghost-trade / min-exposure filters, cash cap and long-only guards.
+    - Stops after the first bar whose Close equity is <= 0 (bankruptcy).
+
+    Args:
+        opens, closes (float64 arrays): Aligned per-bar prices.
+        strengths (float64 array): T+1 aligned signals, ghost-filtered (|s| < 0.01 -> 0).
+            Only its zero/non-zero pattern is used for fixed_amount.
+        price_eps (float64 array): fixed_percent sizing divisor, opens + eps.
+        target_qtys (float64 array): fixed_amount target quantities.
+        buy_prices, sell_prices (float64 arrays): Slippage-adjusted fill prices, opens * (1 +/- slippage).
+        cap_denoms (float64 array): Cash-cap divisor for BUYs, opens * (1 + commission_rate).
+        sizing_method (int): SIZING_FIXED_PERCENT or SIZING_FIXED_AMOUNT.
+
+    Returns:
+        Tuple of:
+        - equity, cash, position_value (float64 arrays, valid up to n_bars)
+        - n_bars (int): Number of bars processed (< len(opens) on bankruptcy).
+        - trade_bar (int64), trade_price, trade_qty (float64), trade_type (int8),
+          trade_equity, trade_commission (float64) arrays, valid up to n_trades.
+        - n_trades (int)
+        - capital, position (float): Final portfolio state.
+    """
+    n = opens.shape[0]
+    equity_arr = np.empty(n, dtype=np.float64)
+    cash_arr = np.empty(n, dtype=np.float64)
+    pv_arr = np.empty(n, dtype=np.float64)
+
+    # At most one fill per bar
+    trade_bar = np.empty(n, dtype=np.int64)
+    trade_price = np.empty(n, dtype=np.float64)
+    trade_qty = np.empty(n, dtype=np.float64)
+    trade_type = np.empty(n, dtype=np.int8)
+    trade_equity = np.empty(n, dtype=np.float64)
+    trade_commission = np.empty(n, dtype=np.float64)
+    n_trades = 0
+
+    capital = initial_capital
+    position = 0.0
+    n_bars = 0
+
+    for i in range(n):
+        price = opens[i]  # Trade at Open
+        strength = strengths[i]
+
+        # Only evaluate the signal if state change is possible
+        if strength != 0.0 or abs(position) > eps:
+            if price != 0.0:
+                current_equity = capital + position * price
+
+                # 1. Calculate Target Quantity (only fixed_percent depends on running equity)
+                if sizing_method == SIZING_FIXED_AMOUNT:
+                    target_qty = target_qtys[i]
+                else:
+                    target_qty = (current_equity * sizing_target * strength) / price_eps[i]
+
+                # Minimum Exposure Filter
+                if abs(target_qty * price) < current_equity * min_exposure:
+                    target_qty = 0.0
+
+                # Long Only Enforce (same NaN semantics as max(0.0, x))
+                if long_only and not target_qty > 0.0:
+                    target_qty = 0.0
+
+                # 2. Calculate Delta
+                delta_qty = target_qty - position
+
+                # 3. Generate & Fill Order
+                if abs(delta_qty) > eps:
+                    is_buy = delta_qty > 0
+                    quantity = abs(delta_qty)
+
+                    if is_buy:
+                        if quantity * price > capital:
+                            # Cap quantity by available cash
+                            quantity = float(np.floor(capital / cap_denoms[i]))
+                    elif long_only:
+                        # Oversell Protection
+                        if position < quantity:
+                            quantity = position
+
+                    if quantity > eps:
+                        if is_buy:
+                            fill_cost = buy_prices[i] * quantity
+                        else:
+                            fill_cost = sell_prices[i] * quantity
+
+                        commission = fill_cost * commission_rate
+                        if min_commission > commission:
+                            commission = min_commission
+
+                        if is_buy:
+                            capital -= fill_cost + commission
+                            position += quantity
+                        else:
+                            capital += fill_cost - commission
+                            position -= quantity
+                            if abs(position) < eps:
+                                position = 0.0
+
+                        trade_bar[n_trades] = i
+                        trade_price[n_trades] = fill_cost / quantity
+                        trade_qty[n_trades] = quantity
+                        trade_type[n_trades] = TRADE_BUY if is_buy else TRADE_SELL
+                        trade_equity[n_trades] = capital + position * price
+                        trade_commission[n_trades] = commission
+                        n_trades += 1
+
+        # End of Day Accounting
+        position_value = position * closes[i]
+        current_equity = capital + position_value
+        equity_arr[i] = current_equity
+        cash_arr[i] = capital
+        pv_arr[i] = position_value
+        n_bars = i + 1
+
+        if current_equity <= 0:
+            break
+
+    return (equity_arr, cash_arr, pv_arr, n_bars,
+            trade_bar, trade_price, trade_qty, trade_type, trade_equity, trade_commission, n_trades,
+            capital, position)
+
+# Eager signatures: the entry points compile (or load from the on-disk cache) at import time,
+# so the first backtest does not pay the JIT. Input arrays are typed read-only C-contiguous:
+# pandas' read-only to_numpy() views match, and writable arrays convert implicitly.
+_F8_ARRAY = types.Array(types.float64, 1, 'C', readonly=True)
+_F4_ARRAY = types.Array(types.float32, 1, 'C', readonly=True)
+
+@njit([(_F8_ARRAY, _F8_ARRAY, strengths_t, _F8_ARRAY, _F8_ARRAY, _F8_ARRAY, _F8_ARRAY,
+        types.float64, types.float64, types.float64,
+        types.boolean, types.float64, types.float64, types.float64)
+       for strengths_t in (_F8_ARRAY, _F4_ARRAY)],  # float32: lossless-downcast signals
+      cache=True)
+def run_loop_fixed_percent(opens, closes, strengths, price_eps, buy_prices, sell_prices, cap_denoms,
+                           initial_capital, commission_rate, min_commission,
+                           long_only, sizing_target, eps, min_exposure):
+    """
+    run loop for position_sizing_method == "fixed_percent":
+    target_qty = (equity * sizing_target * strength) / (open + eps), evaluated per bar.
+    """
+    return _run_loop(opens, closes, strengths, price_eps, price_eps, buy_prices, sell_prices, cap_denoms,
+                     initial_capital, commission_rate, min_commission,
+                     long_only, SIZING_FIXED_PERCENT, sizing_target, eps, min_exposure)
+
+@njit([(_F8_ARRAY, _F8_ARRAY, _F8_ARRAY, _F8_ARRAY, _F8_ARRAY, _F8_ARRAY,
+        types.float64, types.float64, types.float64,
+        types.boolean, types.float64, types.float64)],
+      cache=True)
+def run_loop_fixed_amount(opens, closes, target_qtys, buy_prices, sell_prices, cap_denoms,
+                          initial_capital, commission_rate, min_commission,
+                          long_only, eps, min_exposure):
+    """
+    run loop for position_sizing_method == "fixed_amount":
+    target_qtys = (amount * strength) / (open + eps) is fully precomputed (long-only clamp applied).
+    A bar with target 0 and no position cannot trade, so target_qtys also drives the activity check.
+    """
+    return _run_loop(opens, closes, target_qtys, target_qtys, target_qtys, buy_prices, sell_prices, cap_denoms,
+                     initial_capital, commission_rate, min_commission,
+                     long_only, SIZING_FIXED_AMOUNT, 0.0, eps, min_exposure)
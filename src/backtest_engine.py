@@ -1,15 +1,26 @@
 import pandas as pd
-import queue
-import math
+import collections
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict
 from datetime import datetime
 
 from src.config.settings import settings
 from src.core.events import EventType, MarketEvent, SignalEvent, OrderEvent, FillEvent
 from src.execution.execution_handler import ExecutionHandler
 
+# Compiled fast path for run(): the prebuilt Cython extension if present (no JIT warm-up),
+# else the Numba kernels, else the pure-Python event loop
+try:
+    from src.backtest._engine_kernels import run_loop_fixed_percent, run_loop_fixed_amount
+    _KERNEL_AVAILABLE = True
+except ImportError:
+    try:
+        from src.backtest.engine_kernels import run_loop_fixed_percent, run_loop_fixed_amount
+        _KERNEL_AVAILABLE = True
+    except ImportError:
+        _KERNEL_AVAILABLE = False
+
 @dataclass
 class Trade:
     entry_date: pd.Timestamp
@@ -19,6 +30,20 @@ class Trade:
     entry_equity: float = 0.0
     commission: float = 0.0
 
+# Trade direction codes in the packed trade log (same codes as src.backtest.engine_kernels)
+_TRADE_TYPES = ("BUY", "SELL")
+
+def _trade_dtype(date_dtype) -> np.dtype:
+    """Packed trade log record; entry_date takes the dtype of the data index."""
+    return np.dtype([
+        ('entry_date', date_dtype),
+        ('entry_price', 'f8'),
+        ('quantity', 'f8'),
+        ('type', 'i1'),
+        ('entry_equity', 'f8'),
+        ('commission', 'f8'),
+    ])
+
 class BacktestEngine:
     """
     Event-driven Backtest Engine (v2.0).
@@ -32,19 +57,28 @@ class BacktestEngine:
                  long_only: bool = False):
         
         self.initial_capital = float(initial_capital)
-        self.current_capital = float(initial_capital)
+        self.current_capital = self.initial_capital
         self.commission_rate = float(commission_rate)
         self.slippage = float(slippage)
         self.min_commission = float(min_commission)
         self.long_only = long_only
         
         # Event Architecture
-        self.events = queue.Queue()
+        # Single-threaded bus: deque append/popleft avoids queue.Queue's per-call locking
+        self.events = collections.deque()
         self.execution_handler = ExecutionHandler(self.events)
+        self._dispatch = {
+            EventType.MARKET: self._handle_market,
+            EventType.SIGNAL: self._handle_signal,
+            EventType.ORDER: self._handle_order,
+            EventType.FILL: self._handle_fill,
+        }
         
         # State
-        self.trades: List[Trade] = []
-        self._equity_list: List[Dict[str, Any]] = []
+        # Trades are recorded in a packed structured array (see trade_log); `trades` materializes on demand
+        self._trades_buf = np.zeros(0, dtype=_trade_dtype('datetime64[ns]'))
+        self._n_trades = 0
+        self._trades_cache: Optional[List[Trade]] = None
         self.equity_curve: pd.DataFrame = pd.DataFrame()
         self.position = 0.0
         self.latest_prices: Dict[str, float] = {}
@@ -60,33 +94,66 @@ class BacktestEngine:
         elif method == "fixed_amount" and amount is not None:
             self.position_sizing_target = float(amount)
 
-    def _get_current_equity(self, price: float) -> float:
-        return self.current_capital + (self.position * price)
+    @classmethod
+    def run_batch(cls, data_dict: Dict[str, pd.DataFrame], signals_dict: Dict[str, pd.Series],
+                  engine_kwargs: Optional[Dict] = None, sizing: Optional[Dict] = None,
+                  max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Backtests several instruments in parallel (one engine per instrument, one process per core).
+        See src.backtest.batch_runner.run_batch.
+        """
+        from src.backtest.batch_runner import run_batch
+        return run_batch(data_dict, signals_dict, engine_kwargs=engine_kwargs, sizing=sizing, max_workers=max_workers)
+
+    @property
+    def trade_log(self) -> np.ndarray:
+        """
+        Trades as a structured array (entry_date, entry_price, quantity, type, entry_equity, commission).
+        type is 0 for BUY and 1 for SELL. Suited to vectorized downstream metrics.
+        """
+        return self._trades_buf[:self._n_trades]
+
+    @property
+    def trades(self) -> List[Trade]:
+        """
+        Trades as Trade records (materialized from trade_log and cached until the next fill).
+        """
+        if self._trades_cache is None:
+            log = self.trade_log
+            self._trades_cache = [
+                Trade(entry_date=date, entry_price=price, quantity=qty, type=_TRADE_TYPES[code],
+                      entry_equity=equity, commission=commission)
+                for date, price, qty, code, equity, commission in zip(
+                    log['entry_date'], log['entry_price'].tolist(), log['quantity'].tolist(),
+                    log['type'].tolist(), log['entry_equity'].tolist(), log['commission'].tolist())
+            ]
+        return self._trades_cache
+
+    def _reset_trades(self, date_dtype, capacity: int = 0) -> None:
+        self._trades_buf = np.zeros(capacity, dtype=_trade_dtype(date_dtype))
+        self._n_trades = 0
+        self._trades_cache = None
 
     def _process_event(self, event) -> None:
         """
         Main Event Dispatcher.
         """
-        if event.type == EventType.MARKET:
-            # Market Update - Update internal state if needed (usually handled by strategy looking at data)
-            pass
+        self._dispatch[event.type](event)
 
-        elif event.type == EventType.SIGNAL:
-            self._handle_signal(event)
+    def _handle_market(self, event: MarketEvent) -> None:
+        # Market Update - Update internal state if needed (usually handled by strategy looking at data)
+        pass
 
-        elif event.type == EventType.ORDER:
-            # Route to Execution Handler
-            # In a real engine, we might check risk limits here first
-            self.execution_handler.execute_order(
-                event, 
-                self.latest_prices, 
-                event.timestamp, # Use event timestamp? Or market time?
-                self.slippage,
-                self # Passing self as commission model provider logic
-            )
-
-        elif event.type == EventType.FILL:
-            self._handle_fill(event)
+    def _handle_order(self, event: OrderEvent) -> None:
+        # Route to Execution Handler
+        # In a real engine, we might check risk limits here first
+        self.execution_handler.execute_order(
+            event, 
+            self.latest_prices, 
+            event.timestamp, # Use event timestamp? Or market time?
+            self.slippage,
+            self # Passing self as commission model provider logic
+        )
 
     def calculate(self, fill_cost: float, quantity: float) -> float:
         """Commission Calculation Interface for ExecutionHandler."""
@@ -118,7 +185,7 @@ class BacktestEngine:
         if not current_price:
             return
 
-        current_equity = self._get_current_equity(current_price)
+        current_equity = self.current_capital + self.position * current_price
 
         # 1. Calculate Target Quantity
         target_qty = 0.0
@@ -151,8 +218,9 @@ class BacktestEngine:
             if direction == "BUY":
                 est_cost = quantity * current_price
                 if est_cost > self.current_capital:
-                    # Cap quantity
-                    quantity = math.floor(self.current_capital / (current_price * (1+self.commission_rate)))
+                    # Cap quantity. int() truncation == floor for capital > 0 (bankruptcy stops the run
+                    # before capital can go negative on a long book); a non-positive cap is dropped below either way.
+                    quantity = int(self.current_capital / (current_price * (1+self.commission_rate)))
             
             # Oversell Protection
             if direction == "SELL" and self.long_only:
@@ -162,7 +230,7 @@ class BacktestEngine:
                 order = OrderEvent(symbol, "MKT", quantity, direction)
                 # Hack: Attach timestamp to order for logging/exec
                 order.timestamp = timestamp 
-                self.events.put(order)
+                self.events.append(order)
 
     def _handle_fill(self, event: FillEvent) -> None:
         """
@@ -184,14 +252,22 @@ class BacktestEngine:
             if abs(self.position) < settings.EPSILON:
                 self.position = 0.0
 
-        self.trades.append(Trade(
-            entry_date=event.timestamp,
-            entry_price=event.fill_cost / event.quantity, # Avg Price
-            quantity=event.quantity,
-            type=event.direction,
-            entry_equity=self._get_current_equity(self.latest_prices.get(event.symbol, 0)),
-            commission=event.commission
-        ))
+        # Append to the packed trade log (amortized doubling, like list.append)
+        n = self._n_trades
+        if n == len(self._trades_buf):
+            grown = np.zeros(max(16, 2 * n), dtype=self._trades_buf.dtype)
+            grown[:n] = self._trades_buf
+            self._trades_buf = grown
+        self._trades_buf[n] = (
+            event.timestamp,
+            event.fill_cost / event.quantity, # Avg Price
+            event.quantity,
+            0 if event.direction == "BUY" else 1,
+            self.current_capital + self.position * self.latest_prices.get(event.symbol, 0),
+            event.commission
+        )
+        self._n_trades = n + 1
+        self._trades_cache = None
 
     def run(self, data: pd.DataFrame, signals: pd.Series, start_date: Optional[str] = None, end_date: Optional[str] = None) -> None:
         """
@@ -201,82 +277,220 @@ class BacktestEngine:
         # Reset State
         self.current_capital = self.initial_capital
         self.position = 0.0
-        self.trades = []
-        self._equity_list = []
+        self._reset_trades('datetime64[ns]')
         self.equity_curve = pd.DataFrame()
         self.latest_prices = {}
         
         # Pre-process Data
-        df = data.copy()
-        df.columns = [c.lower() for c in df.columns]
+        # [PERFORMANCE] Work on column arrays directly: no DataFrame copy / join of the full OHLCV frame
+        columns = {c.lower(): c for c in data.columns}
+        index = data.index
+        rows = slice(None)
         
-        if start_date:
-            df = df[df.index >= pd.Timestamp(start_date)]
-        if end_date:
-            df = df[df.index <= pd.Timestamp(end_date)]
+        if start_date or end_date:
+            if index.is_monotonic_increasing:
+                # Binary-searched slice on a sorted index instead of full boolean masks
+                rows = index.slice_indexer(pd.Timestamp(start_date) if start_date else None,
+                                           pd.Timestamp(end_date) if end_date else None)
+            else:
+                rows = np.ones(len(index), dtype=bool)
+                if start_date:
+                    rows &= index >= pd.Timestamp(start_date)
+                if end_date:
+                    rows &= index <= pd.Timestamp(end_date)
+            index = index[rows]
             
-        if df.empty:
+        if len(index) == 0:
             print("No data for backtest.")
             return
 
         # Align Signals (Shift logic preserved for safety)
         if isinstance(signals, pd.DataFrame):
-             aligned_signals = signals['signal'].shift(1).fillna(0)
+             signal_series = signals['signal']
              if 'target_size' in signals.columns:
                  # TODO: Support advanced target size passed in signal event
                  pass
         else:
-             aligned_signals = signals.shift(1).fillna(0)
+             signal_series = signals
              
-        # Combine
-        combined = df.join(aligned_signals.rename("signal"), how="left").fillna({"signal": 0})
+        # T+1 shift on the signal's own index, then align to the data rows (missing -> 0)
+        aligned_signals = signal_series.shift(1).reindex(index)
+        
+        # Optimization: Convert to Numpy for fast iteration (avoid iterrows)
+        dates = index.to_numpy()
+        self._reset_trades(dates.dtype)
+        opens = data[columns['open']].to_numpy(dtype=np.float64)[rows]
+        closes = data[columns['close']].to_numpy(dtype=np.float64)[rows]
+        signals_arr = aligned_signals.to_numpy(dtype=np.float64, na_value=0.0)
         
+        if _KERNEL_AVAILABLE:
+            self._run_kernel(dates, opens, closes, signals_arr)
+        else:
+            self._run_events(dates, opens, closes, signals_arr)
+
+    def _run_kernel(self, dates: np.ndarray, opens: np.ndarray, closes: np.ndarray, signals_arr: np.ndarray) -> None:
+        """
+        Runs the Numba compiled twin of the event loop and materializes Trades / equity records.
+        """
+        # Kernels are compiled for C-contiguous input (no-op for the usual column arrays)
+        opens = np.ascontiguousarray(opens)
+        closes = np.ascontiguousarray(closes)
+        
+        # Everything that does not depend on the running portfolio is vectorized up front
+        # Ghost Trade Filtering
+        strengths = np.where(np.abs(signals_arr) < 0.01, 0.0, signals_arr)
+        price_eps = opens + settings.EPSILON
+        buy_prices = opens * (1.0 + self.slippage)
+        sell_prices = opens * (1.0 - self.slippage)
+        cap_denoms = opens * (1 + self.commission_rate)
+        
+        # Sizing method is fixed for the whole run: dispatch once to a specialized kernel
+        if self.position_sizing_method == "fixed_amount":
+            target_qtys = (self.position_sizing_target * strengths) / price_eps
+            if self.long_only:
+                # Same as max(0.0, qty); the min-exposure filter cannot turn 0 back into a trade
+                target_qtys = np.where(target_qtys > 0.0, target_qtys, 0.0)
+            result = run_loop_fixed_amount(
+                opens, closes, target_qtys, buy_prices, sell_prices, cap_denoms,
+                self.initial_capital, self.commission_rate, self.min_commission,
+                bool(self.long_only), settings.EPSILON, settings.MIN_EXPOSURE_THRESHOLD
+            )
+        else:
+            # Mixed precision: signals are usually coarse (e.g. -1/0/1), so store them as float32
+            # when that is lossless. Prices and capital stay float64 (CONTRIBUTING 2.1); the kernel
+            # promotes strength to float64 before multiplying, so results are unchanged.
+            strengths32 = strengths.astype(np.float32)
+            if np.array_equal(strengths32, strengths):
+                strengths = strengths32
+            result = run_loop_fixed_percent(
+                opens, closes, strengths, price_eps, buy_prices, sell_prices, cap_denoms,
+                self.initial_capital, self.commission_rate, self.min_commission,
+                bool(self.long_only), self.position_sizing_target,
+                settings.EPSILON, settings.MIN_EXPOSURE_THRESHOLD
+            )
+        
+        (equity_arr, cash_arr, pv_arr, n_bars,
+         trade_bar, trade_price, trade_qty, trade_type, trade_equity, trade_commission, n_trades,
+         capital, position) = result
+        
+        self.current_capital = capital
+        self.position = position
+        self.latest_prices['TICKER'] = closes[n_bars - 1]
+        
+        # Kernel trade columns map 1:1 onto the packed trade log
+        self._reset_trades(dates.dtype, n_trades)
+        log = self._trades_buf
+        log['entry_date'] = dates[trade_bar[:n_trades]]
+        log['entry_price'] = trade_price[:n_trades]
+        log['quantity'] = trade_qty[:n_trades]
+        log['type'] = trade_type[:n_trades]
+        log['entry_equity'] = trade_equity[:n_trades]
+        log['commission'] = trade_commission[:n_trades]
+        self._n_trades = n_trades
+        
+        self._set_equity_curve(dates, equity_arr, cash_arr, pv_arr, n_bars)
+        
+        if equity_arr[n_bars - 1] <= 0:
+            print(f"Bankruptcy at {dates[n_bars - 1]}")
+
+    def _set_equity_curve(self, dates: np.ndarray, equity_arr: np.ndarray, cash_arr: np.ndarray,
+                          pv_arr: np.ndarray, n_bars: int) -> None:
+        """
+        Builds the equity curve DataFrame in one shot from the first n_bars of the column arrays.
+        """
+        self.equity_curve = pd.DataFrame({
+            "date": dates[:n_bars],
+            "equity": equity_arr[:n_bars],
+            "cash": cash_arr[:n_bars],
+            "position_value": pv_arr[:n_bars]
+        })
+
+    def _run_events(self, dates: np.ndarray, opens: np.ndarray, closes: np.ndarray, signals_arr: np.ndarray) -> None:
+        """
+        Pure-Python event loop (reference implementation of the compiled kernel).
+        """
         # -------------------------------------------------------------
         # THE EVENT LOOP (Vectorized Hybrid)
         # -------------------------------------------------------------
-        # Optimization: Convert to Numpy for fast iteration (avoid iterrows)
-        dates = combined.index.to_numpy()
-        opens = combined['open'].to_numpy()
-        closes = combined['close'].to_numpy()
-        signals_arr = combined['signal'].to_numpy()
-        
         n_rows = len(dates)
         
-        for i in range(n_rows):
+        # [PERFORMANCE] Hoist attribute/global lookups out of the hot loop
+        # (position/capital stay on self: the event handlers mutate them)
+        eps = settings.EPSILON
+        latest_prices = self.latest_prices
+        events = self.events
+        events_append = events.append
+        events_popleft = events.popleft
+        process_event = self._process_event
+        
+        # Columnar equity record, filled by index and truncated on bankruptcy
+        equity_arr = np.empty(n_rows, dtype=np.float64)
+        cash_arr = np.empty(n_rows, dtype=np.float64)
+        pv_arr = np.empty(n_rows, dtype=np.float64)
+        n_bars = 0
+        
+        # [PERFORMANCE] Flat fast path: bars with no position and no actionable signal
+        # (|signal| < 0.01 is ghost-filtered to 0) cannot trade, so whole stretches are
+        # booked at once instead of going through the event machinery bar by bar.
+        active_idx = np.flatnonzero(np.abs(signals_arr) >= 0.01)
+        
+        i = 0
+        while i < n_rows:
+            if self.position == 0.0 and not abs(signals_arr[i]) >= 0.01:
+                k = np.searchsorted(active_idx, i)
+                j = active_idx[k] if k < len(active_idx) else n_rows
+                
+                # Same arithmetic as the per-bar accounting (capital + 0 * close)
+                cash = self.current_capital
+                np.multiply(closes[i:j], 0.0, out=pv_arr[i:j])
+                np.add(pv_arr[i:j], cash, out=equity_arr[i:j])
+                cash_arr[i:j] = cash
+                bankrupt = np.flatnonzero(equity_arr[i:j] <= 0)
+                end = i + bankrupt[0] + 1 if len(bankrupt) else j
+                n_bars = end
+                
+                latest_prices['TICKER'] = closes[end - 1]
+                
+                if len(bankrupt):
+                    print(f"Bankruptcy at {dates[end - 1]}")
+                    break
+                i = j
+                continue
+            
             date = dates[i]
             current_price = opens[i] # Trade at Open
             close_price = closes[i]
             signal_val = signals_arr[i]
             
-            self.latest_prices['TICKER'] = current_price 
+            latest_prices['TICKER'] = current_price 
             
             # [PERFORMANCE] Optimization: Remove redundant MarketEvent (No-op in V2)
-            # self.events.put(MarketEvent(date))
+            # events_append(MarketEvent(date))
             
             # [PERFORMANCE] Optimization: Only fire SignalEvent if state change is possible
             # If Signal is 0 and we have no position, nothing happens.
-            if signal_val != 0 or abs(self.position) > settings.EPSILON:
-                 self.events.put(SignalEvent("Strat1", 'TICKER', date, "TARGET", strength=signal_val))
+            if signal_val != 0 or abs(self.position) > eps:
+                 events_append(SignalEvent("Strat1", 'TICKER', date, "TARGET", strength=signal_val))
             
             # 4. Process Events
-            while not self.events.empty():
-                event = self.events.get()
-                self._process_event(event)
+            while events:
+                process_event(events_popleft())
                 
             # 5. End of Day Accounting
-            self.latest_prices['TICKER'] = close_price
-            current_equity = self._get_current_equity(close_price)
+            latest_prices['TICKER'] = close_price
+            cash = self.current_capital
             position_value = self.position * close_price
+            current_equity = cash + position_value
             
-            self._equity_list.append({
-                "date": date,
-                "equity": current_equity,
-                "cash": self.current_capital,
-                "position_value": position_value
-            })
+            equity_arr[i] = current_equity
+            cash_arr[i] = cash
+            pv_arr[i] = position_value
+            n_bars = i + 1
             
             if current_equity <= 0:
                 print(f"Bankruptcy at {date}")
                 break
-
-        self.equity_curve = pd.DataFrame(self._equity_list)
\ No newline at end of file
+            
+            i += 1
+        
+        self._set_equity_curve(dates, equity_arr, cash_arr, pv_arr, n_bars)
@@ -5,24 +5,29 @@ import sys
 import atexit
 from src.config.settings import settings
 
-# [PERFORMANCE] Global Log Queue and Listener
-# We use a global listener to ensure only one thread handles I/O
-_log_queue = queue.Queue(-1)
-_queue_handler = logging.handlers.QueueHandler(_log_queue)
 _console_handler = logging.StreamHandler(sys.stderr)
 _console_handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
 
-# QueueListener runs in a separate internal thread
-_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
-_listener.start()
+if settings.LOG_ASYNC:
+    # Opt-in: a global listener thread handles all I/O, loggers only enqueue records
+    _log_queue = queue.Queue(-1)
+    _handler = logging.handlers.QueueHandler(_log_queue)
 
-# Ensure listener stops on exit
-atexit.register(_listener.stop)
+    # QueueListener runs in a separate internal thread
+    _listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+    _listener.start()
+
+    # Ensure listener stops on exit
+    atexit.register(_listener.stop)
+else:
+    # [PERFORMANCE] Default: write to stderr synchronously (StreamHandler serializes writes with
+    # its own lock). Avoids the listener thread at import and the per-record cross-thread handoff.
+    _handler = _console_handler
 
 def setup_logging(name: str) -> logging.Logger:
     """
     Setup logging with consistent format and handlers.
-    Uses QueueHandler for non-blocking I/O.
+    Uses a QueueHandler for non-blocking I/O when settings.LOG_ASYNC is enabled.
     """
     logger = logging.getLogger(name)
     
@@ -32,11 +37,8 @@ def setup_logging(name: str) -> logging.Logger:
         
     logger.setLevel(settings.LOG_LEVEL)
     
-    # Add the asynchronous QueueHandler
-    logger.addHandler(_queue_handler)
-    
-    # Do not add StreamHandler directly to logger to avoid double printing/blocking
-    # The listener handles the actual output.
+    # Shared handler: the stderr StreamHandler, or the QueueHandler feeding it in async mode
+    logger.addHandler(_handler)
     
     return logger
 
@@ -1,12 +1,19 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator
+from pydantic import Field, field_validator
+from typing import Final
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Read-only keyword tables. Settings exposes these exact objects (see the Field defaults below):
+# validate_default=False skips re-validating/rebuilding them for every Settings() instance.
+NEWS_NOISE_KEYWORDS: Final[tuple] = ("速報", "買超", "賣超", "排行榜", "熱門股", "盤前", "盤後", "漲跌停", "統整")
+NEWS_PREMIUM_SOURCES: Final[tuple] = ("reuters", "bloomberg", "wsj", "coindesk")
+
 class Settings(BaseSettings):
     # Base Directory
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
@@ -24,6 +31,7 @@ class Settings(BaseSettings):
     # Sentiment Configuration
     SENTIMENT_MODEL_TYPE: str = "local_hybrid"  # or "simple_remote"
     FINBERT_PATH: str = "yiyanghkust/finbert-tone"
+    FINBERT_ONNX_PATH: str = "" # int8 ONNX export of FINBERT_PATH for CPU inference (see finbert_analyzer.quantize_onnx); empty = PyTorch
     ABSA_MODEL_PATH: str = "snrspeaks/Gemma-2B-it-Finance-Aspect-Based-Sentiment-Analyzer"
     SENTIMENT_FILTER_THRESHOLD: float = 0.6
 
@@ -48,7 +56,8 @@ class Settings(BaseSettings):
     DEFAULT_TIMEOUT: float = 30.0
     MAX_RETRIES: int = 3
     RETRY_BACKOFF_FACTOR: float = 2.0
-    RATE_LIMIT_SLEEP: float = 0.5
+    API_QPS: float = 2.0 # Provider downloads started per second by update_all_tracked_symbols (<= 0: unlimited)
+    API_BURST: int = 4 # Downloads that may start back-to-back before API_QPS applies
     
     # ----------------------------------------------------------------
     # Data Integrity & Update Strategy
@@ -57,6 +66,7 @@ class Settings(BaseSettings):
     # "FULL_VERIFY": Download full history, compare with DB. 
     #                If conflict > tolerance, trigger backup provider voting.
     DATA_UPDATE_MODE: str = "INCREMENTAL" 
+    DATA_UPDATE_WORKERS: int = 8 # Tickers downloaded concurrently by update_all_tracked_symbols
     
     # Tolerance for floating point comparison between data sources
     DATA_DIFF_TOLERANCE: float = 1e-4
@@ -67,23 +77,32 @@ class Settings(BaseSettings):
     }
 
     # News Engine Settings
+    # (Constant keyword/source lists are read-only tuples)
     NEWS_BASE_URLS: dict = {
         'TW': "https://news.google.com/rss/search?q={ENCODED_QUERY}&hl=zh-TW&gl=TW&ceid=TW:zh-Hant",
         'US': "https://news.google.com/rss/search?q={ENCODED_QUERY}&hl=en-US&gl=US&ceid=US:en",
         'CRYPTO': "https://news.google.com/rss/search?q={ENCODED_QUERY}&hl=en-US&gl=US&ceid=US:en"
     }
     NEWS_SOURCES: dict = {
-        'TW': ["site:cnyes.com", "site:udn.com", "site:bnext.com.tw", "site:moneydj.com", "site:tw.stock.yahoo.com", "site:ctee.com.tw", "site:finance.ettoday.net", "site:anue.com"],
-        'US': ["site:reuters.com", "site:cnbc.com", "site:bloomberg.com", "site:finance.yahoo.com", "site:marketwatch.com", "site:investing.com", "site:barrons.com", "site:thestreet.com", "site:fool.com", "site:forbes.com", "site:businessinsider.com", "site:seekingalpha.com", "site:benzinga.com", "site:tipranks.com"],
-        'CRYPTO': ["site:coindesk.com", "site:cointelegraph.com", "site:theblock.co", "site:decrypt.co", "site:blockworks.co", "site:cryptoslate.com", "site:bitcoinmagazine.com", "site:u.today"]
+        'TW': ("site:cnyes.com", "site:udn.com", "site:bnext.com.tw", "site:moneydj.com", "site:tw.stock.yahoo.com", "site:ctee.com.tw", "site:finance.ettoday.net", "site:anue.com"),
+        'US': ("site:reuters.com", "site:cnbc.com", "site:bloomberg.com", "site:finance.yahoo.com", "site:marketwatch.com", "site:investing.com", "site:barrons.com", "site:thestreet.com", "site:fool.com", "site:forbes.com", "site:businessinsider.com", "site:seekingalpha.com", "site:benzinga.com", "site:tipranks.com"),
+        'CRYPTO': ("site:coindesk.com", "site:cointelegraph.com", "site:theblock.co", "site:decrypt.co", "site:blockworks.co", "site:cryptoslate.com", "site:bitcoinmagazine.com", "site:u.today")
     }
     NEWS_TOP_N_LIMIT: int = 10
     LLM_MAX_INPUT_CHARS: int = 6000 # Approx 1500-2000 tokens
+    NEWS_ENGINE_WORKERS: int = 8 # Shared news analysis thread pool (env: NEWS_ENGINE_WORKERS)
+    NEWS_FETCH_CONNECTIONS: int = 32 # Concurrent RSS connections in NewsFetcher.fetch_headlines_many (aiohttp)
+    LLM_RESPONSE_CACHE: bool = True # Reuse translations/sentiment scores for identical news text
+    LLM_CACHE_PATH: Path = DATA_DIR / "llm_cache.db"
+    RESPONSE_CACHE_MAX_ENTRIES: int = 200_000 # Per cache file; least recently used entries are evicted beyond this
+    NEWS_DISK_CACHE: bool = True # Share fetched RSS feeds across processes/restarts (NewsFetcher)
+    NEWS_CACHE_PATH: Path = DATA_DIR / "news_cache.db"
     SENTIMENT_DECAY_HALFLIFE: float = 5.0
     SENTIMENT_NOISE_THRESHOLD: float = 0.01
+    SENTIMENT_NUMBA_DECAY: bool = True # Compiled decay kernel in DecayModel (False: pandas ewm)
     
     # News Engine - Noise Filtering
-    NEWS_NOISE_KEYWORDS: list = ["速報", "買超", "賣超", "排行榜", "熱門股", "盤前", "盤後", "漲跌停", "統整"]
+    NEWS_NOISE_KEYWORDS: tuple = Field(default=NEWS_NOISE_KEYWORDS, validate_default=False)
     
     # News Engine - Impact Ranking
     NEWS_IMPACT_SCORES: dict = {
@@ -95,16 +114,16 @@ class Settings(BaseSettings):
     
     NEWS_IMPACT_KEYWORDS: dict = {
         'TW': {
-            'TIER_1': ["財報", "營收", "EPS", "股利", "配息", "法說", "併購", "收購", "違約", "裁員", "擴廠", "資本支出"],
-            'TIER_2': ["漲停", "跌停", "創新高", "創新低", "大漲", "崩跌", "主力", "外資"]
+            'TIER_1': ("財報", "營收", "EPS", "股利", "配息", "法說", "併購", "收購", "違約", "裁員", "擴廠", "資本支出"),
+            'TIER_2': ("漲停", "跌停", "創新高", "創新低", "大漲", "崩跌", "主力", "外資")
         },
         'US': {
-            'TIER_1': ["earnings", "revenue", "eps", "dividend", "acquisition", "merger", "default", "layoff", "expansion", "guidance", "sec", "fed"],
-            'TIER_2': ["surge", "plunge", "all-time high", "crash", "breakout", "upgrade", "downgrade"]
+            'TIER_1': ("earnings", "revenue", "eps", "dividend", "acquisition", "merger", "default", "layoff", "expansion", "guidance", "sec", "fed"),
+            'TIER_2': ("surge", "plunge", "all-time high", "crash", "breakout", "upgrade", "downgrade")
         }
     }
     
-    NEWS_PREMIUM_SOURCES: list = ["reuters", "bloomberg", "wsj", "coindesk"]
+    NEWS_PREMIUM_SOURCES: tuple = Field(default=NEWS_PREMIUM_SOURCES, validate_default=False)
     
     # News Engine - Timezone & Rollover
     MARKET_TIMEZONES: dict = {
@@ -133,6 +152,7 @@ class Settings(BaseSettings):
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(levelname)s - %(message)s"
+    LOG_ASYNC: bool = False  # Route records through a background QueueListener thread
 
     # Backtest Engine Settings
     MIN_EXPOSURE_THRESHOLD: float = 0.001  # 0.1% of Equity
@@ -157,8 +177,16 @@ class Settings(BaseSettings):
             raise ValueError("SENTIMENT_DECAY_HALFLIFE must be positive")
         return v
 
-# Singleton instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Process-wide Settings, parsed (env, .env, validators) once.
+    Call get_settings.cache_clear() after changing the environment to re-parse.
+    """
+    s = Settings()
+    # Ensure data directory exists
+    s.DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return s
 
-# Ensure data directory exists
-settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Singleton instance
+settings = get_settings()
@@ -2,7 +2,6 @@ from abc import ABC
 from enum import Enum
 from typing import Optional, Dict
 from datetime import datetime
-import queue
 
 class EventType(Enum):
     MARKET = "MARKET"
@@ -0,0 +1,28 @@
+import math
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def decay_kernel(raw, delta_days, lam):
+    """
+    Numba compiled time-aware EWM used by DecayModel.apply_decay.
+    Same recurrence as pandas ewm(halflife=..., times=..., adjust=False).mean() on NaN-free input:
+        out[0] = raw[0]
+        out[i] = a * out[i-1] + (1 - a) * raw[i],  a = exp(-lam * delta_days[i-1])
+
+    Args:
+        raw (float64 array): Daily scores, missing days already filled with 0.0.
+        delta_days (float64 array): Gaps between consecutive dates in days (len(raw) - 1).
+        lam (float): Decay rate, ln(2) / half-life in days.
+    """
+    out = np.empty_like(raw)
+    if raw.shape[0] == 0:
+        return out
+    out[0] = raw[0]
+    for i in range(1, raw.shape[0]):
+        a = math.exp(-lam * delta_days[i - 1])
+        out[i] = a * out[i - 1] + (1.0 - a) * raw[i]
+    return out
+
+# Compile (or load from the on-disk cache) at import instead of on the first real call
+decay_kernel(np.zeros(2), np.ones(1), 0.1)
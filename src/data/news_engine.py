@@ -1,21 +1,54 @@
+from __future__ import annotations
+
 import os
+import re
+import stat
+import atexit
+import time
+import shutil
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import logging
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+from collections import OrderedDict, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from src.config.settings import settings
 from src.data.news_fetcher import NewsFetcher
 from src.data.sentiment_processor import SentimentAnalyzer, DecayModel
-from src.ai.llm_client import LLMClient
-from src.ai.translator import TextTranslator
 import threading
 
+if TYPE_CHECKING:
+    from src.ai.llm_client import LLMClient
+    from src.ai.translator import TextTranslator
+
 try:
     from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 except ImportError:
     def add_script_run_ctx(thread, ctx=None): pass
     def get_script_run_ctx(): return None
 
+# Detects CJK characters (common range) in headlines
+_CJK_RE = re.compile(r'[\u4e00-\u9fa5]')
+
+# Sentiment is bounded in [-1, 1]: float32 halves memory and cache size
+SENTIMENT_DTYPE = np.float32
+
+# int64 view of NaT (unparseable publish dates)
+_NAT_NS = np.iinfo(np.int64).min
+
+# Rewrite a ticker's partitioned sentiment cache once it accumulates this many fragment files
+_CACHE_COMPACT_FILES = 64
+
+# Decoded sentiment caches kept in memory per NewsEngine (LRU, validated against the cache mtime)
+_MEM_CACHE_SIZE = 32
+
+# Shared by all NewsEngine instances (futures are tracked per call)
+_NEWS_EXECUTOR = ThreadPoolExecutor(max_workers=settings.NEWS_ENGINE_WORKERS, thread_name_prefix="news")
+atexit.register(_NEWS_EXECUTOR.shutdown, wait=False)
+
 class NewsEngine:
     """
     Orchestrates news fetching, sentiment analysis, and caching.
@@ -30,40 +63,174 @@ class NewsEngine:
                  translator: Optional[TextTranslator] = None):
         
         self.cache_dir = cache_dir
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
             
-        self.llm_client = llm_client if llm_client else LLMClient()
+        if llm_client is None:
+            # Deferred: pulls in the openai SDK
+            from src.ai.llm_client import LLMClient
+            llm_client = LLMClient()
+        self.llm_client = llm_client
         self.fetcher = fetcher if fetcher else NewsFetcher()
         self.analyzer = analyzer if analyzer else SentimentAnalyzer(llm_client=self.llm_client)
         self.decay_model = decay_model if decay_model else DecayModel()
-        self.translator = translator if translator else TextTranslator(llm_client=self.llm_client)
+        if translator is None:
+            from src.ai.translator import TextTranslator
+            translator = TextTranslator(llm_client=self.llm_client)
+        self.translator = translator
         self.logger = logging.getLogger(__name__)
+        # cache_path -> (st_mtime_ns, frame); every cache write refreshes the mtime (see _write_cache)
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._mem_lock = threading.Lock()
 
     def _get_cache_path(self, ticker: str) -> str:
-        # Use Parquet for better performance
+        # Parquet dataset partitioned by year (append-only); older caches are a single Parquet file
         return os.path.join(self.cache_dir, f"{ticker}.parquet")
 
+    @staticmethod
+    def _stat(path: str) -> Optional[os.stat_result]:
+        """os.stat, or None if the path does not exist."""
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    def _load_cached_frame(self, cache_path: str, st: os.stat_result) -> pd.DataFrame:
+        """
+        Full cached sentiment frame for `cache_path`, served from memory while the on-disk mtime is unchanged.
+        """
+        with self._mem_lock:
+            entry = self._mem_cache.get(cache_path)
+            if entry is not None and entry[0] == st.st_mtime_ns:
+                self._mem_cache.move_to_end(cache_path)
+                return entry[1]
+        
+        if stat.S_ISREG(st.st_mode):
+            # Single-file cache from older versions
+            df = pd.read_parquet(cache_path, columns=['sentiment'])
+        else:
+            df = self._read_cache(cache_path)
+        
+        with self._mem_lock:
+            self._mem_cache[cache_path] = (st.st_mtime_ns, df)
+            self._mem_cache.move_to_end(cache_path)
+            while len(self._mem_cache) > _MEM_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+        return df
+
+    def read_cache(self, ticker: str, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        Cached sentiment for `ticker` (DatetimeIndex, 'sentiment' column), optionally limited to [start, end].
+        The cache must exist; the UI checks _get_cache_path first.
+        """
+        return self._read_cache(self._get_cache_path(ticker), start, end)
+
+    def _read_cache(self, cache_path: str, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        Reads the cached sentiment frame (DatetimeIndex, 'sentiment' column), optionally limited to [start, end].
+        On the partitioned dataset the range is pushed down as row filters.
+        For dates written more than once the latest write wins.
+        """
+        if os.path.isfile(cache_path):
+            # Single-file cache from older versions
+            df = pd.read_parquet(cache_path, columns=['sentiment'])
+            return df.loc[start:end]
+        
+        filters = []
+        if start is not None:
+            filters.append(('date', '>=', start))
+        if end is not None:
+            filters.append(('date', '<=', end))
+        
+        df = pq.read_table(cache_path, columns=['date', 'sentiment', '_written'], filters=filters or None).to_pandas()
+        df = df.dropna(subset=['sentiment']).sort_values('_written', kind='stable').set_index('date')[['sentiment']]
+        # Rows are in write order: keep the newest value per date (single C-level scan)
+        return df[~df.index.duplicated(keep='last')].sort_index()
+
+    def _append_partition(self, cache_path: str, frame: pd.DataFrame) -> None:
+        """Writes `frame` as new fragment files (one per year) without touching existing ones."""
+        written = time.time_ns()
+        dates = pd.DatetimeIndex(frame.index)
+        df = pd.DataFrame({
+            'date': dates,
+            'sentiment': frame['sentiment'].to_numpy(dtype=SENTIMENT_DTYPE),
+            '_written': written,
+            'year': dates.year,
+        })
+        pq.write_to_dataset(
+            pa.Table.from_pandas(df, preserve_index=False),
+            root_path=cache_path,
+            partition_cols=['year'],
+            basename_template=f"{written}-{{i}}.parquet",
+            # Float/timestamp payload: dictionary pages are pure overhead; statistics drive the date filters
+            compression='snappy',
+            use_dictionary=False,
+            write_statistics=True
+        )
+
+    def _rewrite_dataset(self, cache_path: str, *frames: pd.DataFrame) -> None:
+        """
+        Replaces the cache at `cache_path` with a dataset holding `frames` (in write order).
+        The new dataset is written to a sibling temp directory and renamed into place; the old
+        cache is deleted only after that, so a failed write never loses history (RSS cannot re-fetch it).
+        """
+        tmp_path = f"{cache_path}.tmp-{time.time_ns()}"
+        try:
+            for frame in frames:
+                self._append_partition(tmp_path, frame)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+        
+        # A directory cannot be renamed over a file or a non-empty directory: move the old cache aside first
+        old_path = f"{cache_path}.old-{time.time_ns()}"
+        os.replace(cache_path, old_path)
+        os.replace(tmp_path, cache_path)
+        if os.path.isdir(old_path):
+            shutil.rmtree(old_path)
+        else:
+            os.remove(old_path)
+
+    def _write_cache(self, cache_path: str, series: pd.Series, legacy_df: Optional[pd.DataFrame] = None) -> None:
+        """
+        Appends a sentiment series to the cache: O(new rows) instead of a full read/merge/rewrite.
+        `legacy_df` is the already-loaded single-file cache at cache_path, if the caller has it.
+        """
+        if series.empty:
+            return
+        
+        with self._mem_lock:
+            self._mem_cache.pop(cache_path, None)
+        
+        if os.path.isfile(cache_path):
+            # Migrate a single-file cache into the partitioned layout (as the oldest write)
+            if legacy_df is None:
+                legacy_df = pd.read_parquet(cache_path, columns=['sentiment'])
+            self._rewrite_dataset(cache_path, legacy_df, series.to_frame('sentiment'))
+        else:
+            self._append_partition(cache_path, series.to_frame('sentiment'))
+        
+        # Compact once appends have produced many small fragments
+        n_files = sum(len(files) for _, _, files in os.walk(cache_path))
+        if n_files > _CACHE_COMPACT_FILES:
+            self._rewrite_dataset(cache_path, self._read_cache(cache_path))
+        
+        # New fragments land in year sub-directories: refresh the root mtime for update_cache_smart
+        os.utime(cache_path, None)
+
     def _process_translation(self, items: list) -> list:
         """
         Translates non-English titles in the list of news items.
         Returns the modified list.
         """
-        import re
-        
-        # 1. Identify items needing translation
-        indices_to_translate = []
-        texts_to_translate = []
+        # 1. Identify items needing translation (single pass)
+        cjk_search = _CJK_RE.search
+        pairs = [(i, title) for i, item in enumerate(items) if (title := item.get('title', '')) and cjk_search(title)]
         
-        for i, item in enumerate(items):
-            title = item.get('title', '')
-            # Regex to detect CJK characters (common range)
-            if re.search(r'[\u4e00-\u9fa5]', title):
-                indices_to_translate.append(i)
-                texts_to_translate.append(title)
-        
-        if not texts_to_translate:
+        if not pairs:
             return items
+        
+        indices_to_translate = [i for i, _ in pairs]
+        texts_to_translate = [title for _, title in pairs]
             
         self.logger.info(f"Translating {len(texts_to_translate)} items.")
         
@@ -81,7 +248,7 @@ class NewsEngine:
                 self.logger.debug(f"DEBUG - Translated Text: {trans}")
                 
                 # Check for failed translation (Empty or Identical while being Chinese)
-                if not trans or (trans == original and re.search(r'[\u4e00-\u9fa5]', original)):
+                if not trans or (trans == original and cjk_search(original)):
                     self.logger.warning(f"Translation might have failed (returned identical or empty) for: {original}")
         
         # 3. Apply translations
@@ -93,6 +260,23 @@ class NewsEngine:
                 
         return items
 
+    @staticmethod
+    def _split_by_input_budget(news_by_date: dict) -> list:
+        """
+        Splits {date: items} into consecutive chunks (on date boundaries) of at most
+        settings.LLM_MAX_INPUT_CHARS of headline+summary text each.
+        """
+        chunks = [{}]
+        chunk_chars = 0
+        for date, items in news_by_date.items():
+            chars = sum(len(item.get('title', '')) + len(item.get('summary', '')) + 2 for item in items)
+            if chunks[-1] and chunk_chars + chars > settings.LLM_MAX_INPUT_CHARS:
+                chunks.append({})
+                chunk_chars = 0
+            chunks[-1][date] = items
+            chunk_chars += chars
+        return chunks
+
     @staticmethod
     def _analyze_wrapper(ctx, func, *args):
         """Helper to run analysis with Streamlit context in thread."""
@@ -110,47 +294,56 @@ class NewsEngine:
         # Fetch
         headlines = self.fetcher.fetch_headlines(ticker=ticker, market='US')
         
-        # Group by date
+        # Group by date (one vectorized parse; unparseable dates are dropped)
         news_by_date = {}
         if headlines:
-            for item in headlines:
-                try:
-                    pub_date = pd.to_datetime(item['published']).normalize()
-                    if pub_date not in news_by_date:
-                        news_by_date[pub_date] = []
-                    news_by_date[pub_date].append(item)
-                except:
-                    continue
+            published = pd.Series([item.get('published') for item in headlines], dtype=object)
+            pub_dates = pd.to_datetime(published, errors='coerce', utc=True)
+            # The format is inferred from the first entry: re-parse stragglers in other formats
+            retry = pub_dates.isna() & published.notna()
+            if retry.any():
+                pub_dates[retry] = pd.to_datetime(published[retry], errors='coerce', utc=True, format='mixed')
+            pub_dates = pub_dates.dt.tz_localize(None).dt.normalize()
+
+            # Bucket on int64 nanoseconds (cheap hashing), then build Timestamp keys once per day, in date order
+            buckets = defaultdict(list)
+            for item, key in zip(headlines, pub_dates.to_numpy(dtype='datetime64[ns]').view('i8').tolist()):
+                if key != _NAT_NS:
+                    buckets[key].append(item)
+            news_by_date = {pd.Timestamp(key): buckets[key] for key in sorted(buckets)}
         
         if not news_by_date:
             if start_date and end_date:
                  dates = pd.date_range(start=start_date, end=end_date)
-                 return pd.Series(0.0, index=dates, name='sentiment')
-            return pd.Series(dtype=float)
+                 return pd.Series(np.zeros(len(dates), dtype=SENTIMENT_DTYPE), index=dates, name='sentiment', copy=False)
+            return pd.Series(dtype=SENTIMENT_DTYPE)
 
-        # Analyze (Threaded)
-        raw_scores = {}
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # Translation (one batch for all dates; items are shared with news_by_date)
+        self._process_translation([item for items in news_by_date.values() for item in items])
+
+        # Analyze: all dates in one batched request, unless the news exceeds the LLM input budget
+        date_chunks = self._split_by_input_budget(news_by_date)
+        if len(date_chunks) == 1:
+            raw_scores = self.analyzer.analyze_news_batched(news_by_date, ticker)
+        else:
+            # Threaded fallback: one batched request per chunk of dates
+            raw_scores = {}
+            executor = _NEWS_EXECUTOR
             ctx = get_script_run_ctx()
-            future_to_date = {}
-            for date, items in news_by_date.items():
-                # Translation
-                translated_items = self._process_translation(items)
-                
-                # Analysis
+            future_to_dates = {}
+            for chunk in date_chunks:
                 if ctx:
-                    future = executor.submit(self._analyze_wrapper, ctx, self.analyzer.analyze_news, translated_items, ticker)
+                    future = executor.submit(self._analyze_wrapper, ctx, self.analyzer.analyze_news_batched, chunk, ticker)
                 else:
-                    future = executor.submit(self.analyzer.analyze_news, translated_items, ticker)
-                future_to_date[future] = date
+                    future = executor.submit(self.analyzer.analyze_news_batched, chunk, ticker)
+                future_to_dates[future] = list(chunk)
 
-            for future in as_completed(future_to_date):
-                date = future_to_date[future]
+            for future in as_completed(future_to_dates):
+                dates = future_to_dates[future]
                 try:
-                    score = future.result()
-                    raw_scores[date] = score
+                    raw_scores.update(future.result())
                 except Exception as e:
-                    self.logger.error(f"Error analyzing news for {date}: {e}")
+                    self.logger.error(f"Error analyzing news for {dates[0]}..{dates[-1]}: {e}")
 
         # Apply Decay
         if start_date and end_date:
@@ -158,10 +351,11 @@ class NewsEngine:
         else:
             sorted_dates = sorted(raw_scores.keys())
             if not sorted_dates:
-                 return pd.Series(dtype=float)
-            target_dates = pd.DatetimeIndex(sorted_dates)
+                 return pd.Series(dtype=SENTIMENT_DTYPE)
+            # Plain datetime64 array; apply_decay builds the one index it needs
+            target_dates = np.array(sorted_dates, dtype='datetime64[ns]')
 
-        series = self.decay_model.apply_decay(target_dates, raw_scores)
+        series = self.decay_model.apply_decay(target_dates, raw_scores).astype(SENTIMENT_DTYPE)
         series.name = 'sentiment'
         return series
 
@@ -173,21 +367,25 @@ class NewsEngine:
         """
         cache_path = self._get_cache_path(ticker)
         
-        # 1. Try Load Cache (Parquet)
-        if os.path.exists(cache_path):
+        # 1. Try Load Cache (Parquet, or memory if unchanged since the last read)
+        cached_df = None
+        legacy_df = None # Single-file cache from older versions, reused for the write below
+        st = self._stat(cache_path)
+        if st is not None:
             try:
-                cached_df = pd.read_parquet(cache_path)
+                cached_df = self._load_cached_frame(cache_path, st)
+                if stat.S_ISREG(st.st_mode):
+                    legacy_df = cached_df
+                
                 # Check if covers range
                 if not cached_df.empty:
-                    cache_start = cached_df.index.min()
-                    cache_end = cached_df.index.max()
-                    
                     req_start = pd.to_datetime(start_date)
                     req_end = pd.to_datetime(end_date)
                     
-                    if cache_start <= req_start and cache_end >= req_end:
+                    if cached_df.index.min() <= req_start and cached_df.index.max() >= req_end:
                         return cached_df['sentiment'].loc[req_start:req_end]
-            except Exception as e:
+            except (OSError, ValueError, KeyError, TypeError, pa.ArrowException) as e:
+                # Unreadable/corrupt cache: fall through to a fresh fetch
                 self.logger.warning(f"Failed to read cache for {ticker}: {e}")
 
         # 2. Miss - Fetch & Compute
@@ -195,16 +393,14 @@ class NewsEngine:
         
         series = self._fetch_and_analyze(ticker, start_date, end_date)
 
-        # 3. Save Cache (Parquet)
-        if os.path.exists(cache_path):
-            try:
-                existing_df = pd.read_parquet(cache_path)
-                combined_df = existing_df.combine_first(series.to_frame())
-                combined_df.to_parquet(cache_path)
-            except:
-                series.to_frame().to_parquet(cache_path)
-        else:
-            series.to_frame().to_parquet(cache_path)
+        # 3. Save Cache (append-only Parquet dataset)
+        # Only days the cache lacks: the range is zero/decay-filled where the fetch found no news,
+        # which must not overwrite cached history (update_cache_smart writes fresh scores that do).
+        new_days = series if cached_df is None else series[~series.index.isin(cached_df.index)]
+        try:
+            self._write_cache(cache_path, new_days, legacy_df)
+        except (OSError, ValueError, TypeError, pa.ArrowException) as e:
+            self.logger.warning(f"Failed to write sentiment cache for {ticker}: {e}")
             
         return series
 
@@ -214,18 +410,16 @@ class NewsEngine:
         """
         cache_path = self._get_cache_path(ticker)
         
-        # 1. Check Recency
-        if os.path.exists(cache_path):
-            try:
-                mtime = os.path.getmtime(cache_path)
-                last_updated = datetime.fromtimestamp(mtime)
-                
-                # Check delta
-                if (datetime.now() - last_updated).days < days_threshold:
-                    self.logger.info(f"Skipping sentiment update for {ticker} (Last updated: {last_updated.date()})")
-                    return
-            except Exception as e:
-                self.logger.warning(f"Failed to check cache mtime for {ticker}, forcing update: {e}")
+        # 1. Check Recency (one stat call for existence and mtime)
+        try:
+            st = self._stat(cache_path)
+        except OSError as e:
+            st = None
+            self.logger.warning(f"Failed to check cache mtime for {ticker}, forcing update: {e}")
+        
+        if st is not None and (time.time() - st.st_mtime) < days_threshold * 86400:
+            self.logger.info(f"Skipping sentiment update for {ticker} (Last updated: {datetime.fromtimestamp(st.st_mtime).date()})")
+            return
 
         # 2. Update (Fault Tolerant)
         self.logger.info(f"Triggering smart update for {ticker}...")
@@ -234,20 +428,12 @@ class NewsEngine:
             
             if series.empty:
                  self.logger.info(f"No news found for {ticker}.")
-                 if os.path.exists(cache_path):
+                 if st is not None:
                      os.utime(cache_path, None)
                  return
 
             # Save/Merge
-            if os.path.exists(cache_path):
-                try:
-                    existing_df = pd.read_parquet(cache_path)
-                    combined_df = existing_df.combine_first(series.to_frame())
-                    combined_df.to_parquet(cache_path)
-                except:
-                    series.to_frame().to_parquet(cache_path)
-            else:
-                series.to_frame().to_parquet(cache_path)
+            self._write_cache(cache_path, series)
                 
             self.logger.info(f"Smart update completed for {ticker}")
             
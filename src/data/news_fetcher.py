@@ -1,118 +1,234 @@
 import feedparser
+import asyncio
+import io
 import pandas as pd
 import urllib.parse
 from bs4 import BeautifulSoup
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from src.config.settings import settings
+from src.ai.response_cache import ResponseCache, get_news_cache
+from src.data.text_dedup import MinHashLSH, is_near_duplicate
 import re
+import html
 from datetime import datetime, timedelta
 import pytz
 from dateutil import parser
-import difflib
-from cachetools import TTLCache, cached
+from email.utils import parsedate_to_datetime
+from cachetools import TTLCache, LRUCache, cached
 import chardet
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional asyncio HTTP client for fetch_headlines_many (thread pool fallback)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional libxml2 streaming parser for RSS 2.0; feedparser handles everything else
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Summary fragments are tiny: strip tags with regexes, BeautifulSoup only when script/style bodies must be dropped
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_SCRIPT_STYLE_RE = re.compile(r'<(?:script|style)\b', re.IGNORECASE)
+
+def _keyword_pattern(keywords) -> Optional["re.Pattern"]:
+    """One alternation regex for substring matching against any keyword (None when there are none)."""
+    if not keywords:
+        return None
+    # Longest first so a keyword is never shadowed by one of its prefixes
+    return re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+_DEDUP_THRESHOLD = 0.7 # difflib ratio above which two titles are the same story
+_MAX_FEED_ENTRIES = 100 # Fetch 100 first, then filter (Increased to 100 to ensure top-5 survival)
+# HTTP retry policy, shared by the requests session and the aiohttp path
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def _event_loop_running() -> bool:
+    """True when called from inside a running asyncio loop (asyncio.run would fail)."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
 
 class NewsFetcher:
     """
     Fetches news from Google News RSS and cleans the output.
     """
-    def __init__(self):
+    _UTC = pytz.UTC
+
+    def __init__(self, disk_cache: Optional[ResponseCache] = None):
         self.base_urls = settings.NEWS_BASE_URLS
         self.sources = settings.NEWS_SOURCES
+        # Resolved once: _normalize_date runs per entry
+        self._tz_by_market = {m: pytz.timezone(tz) for m, tz in settings.MARKET_TIMEZONES.items()}
+        self._cutoff_by_market = dict(settings.MARKET_ROLLOVER_HOURS)
+        # Keyword lists compiled once: each title/link is scanned in a single regex pass per list
+        self._impact_patterns = {
+            m: (_keyword_pattern(kws.get('TIER_1')), _keyword_pattern(kws.get('TIER_2')))
+            for m, kws in settings.NEWS_IMPACT_KEYWORDS.items()
+        }
+        self._premium_pattern = _keyword_pattern(settings.NEWS_PREMIUM_SOURCES)
+        self._noise_pattern = _keyword_pattern(settings.NEWS_NOISE_KEYWORDS)
+        # Per-market (url_prefix, encoded " site:A OR site:B ..." + url_suffix), built once.
+        # quote() is per-character, so encoding the parts separately equals encoding the whole query.
+        self._url_templates = {}
+        for market, base_url in self.base_urls.items():
+            prefix, _, suffix = base_url.partition("{ENCODED_QUERY}")
+            site_query = " OR ".join(self.sources.get(market, ()))
+            self._url_templates[market] = (prefix, urllib.parse.quote(f" {site_query}") + suffix)
         self.logger = logging.getLogger(__name__)
         # [OPTIMIZATION] Resilience: User-Agent and Timeout
         self.request_headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.timeout = settings.DEFAULT_TIMEOUT
+        # Keep-alive session: repeat fetches (and fetch_headlines_many workers) reuse pooled TLS connections
+        self._session = requests.Session()
+        self._session.headers.update(self.request_headers)
+        retry = Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF, status_forcelist=list(_RETRY_STATUSES))
+        self._session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
         
         # [OPTIMIZATION] Performance: TTL Cache (100 items, 5 mins)
         # Note: We cannot easily use @cached decorator on method with self if cache is instance-bound.
         # But we can use a dict. Or use methodtools.
         # For simplicity, let's use a simple dict with timestamp check or cachetools.TTLCache
         self._cache = TTLCache(maxsize=100, ttl=300)
+        # Validators (ETag / Last-Modified) of the last 200 response per query, kept past the TTL
+        # so an expired entry is revalidated with a conditional GET: {cache_key: (etag, last_modified, headlines)}
+        self._validators = LRUCache(maxsize=256)
+        # Process-shared copy of the above, so restarts and other workers start warm (None when disabled):
+        # {"fetched": epoch seconds, "etag", "last_modified", "headlines"}
+        self._disk_cache = disk_cache if disk_cache is not None else get_news_cache()
+        # Neither in-memory cache is thread-safe (fetch_headlines_many shares them across threads)
+        self._cache_lock = threading.Lock()
 
     def _build_query(self, ticker: str, name: Optional[str] = None, market: str = 'US') -> str:
         """
         Constructs the Google News RSS URL with advanced query operators.
         """
-        if market not in self.base_urls:
+        template = self._url_templates.get(market)
+        if template is None:
             raise ValueError(f"Unsupported market: {market}")
 
-        # 1. Build the search terms part: "{Name}" OR "{Ticker}"
+        # Search terms: "{Name}" OR "{Ticker}"; the site filter part is precomputed
         search_terms = []
         if name:
             search_terms.append(f'"{name}"')
         if ticker:
             search_terms.append(f'"{ticker}"')
         
-        term_query = " OR ".join(search_terms)
-        
-        # 2. Build the site filter part: site:A OR site:B ...
-        sites = self.sources.get(market, [])
-        site_query = " OR ".join(sites)
-        
-        full_query = f"{term_query} {site_query}"
-        
-        # 4. URL Encode
-        encoded_query = urllib.parse.quote(full_query)
-        
-        # 5. Inject into Base URL
-        base_url = self.base_urls[market]
-        final_url = base_url.replace("{ENCODED_QUERY}", encoded_query)
-        
-        return final_url
+        prefix, encoded_sites = template
+        return prefix + urllib.parse.quote(" OR ".join(search_terms)) + encoded_sites
 
     def _clean_html(self, raw_html: str) -> str:
         """
         Removes HTML tags and cleans up text.
         """
-        soup = BeautifulSoup(raw_html, "html.parser")
-        text = soup.get_text(separator=" ")
-        return text.strip()
+        if not raw_html:
+            return ""
+        if _SCRIPT_STYLE_RE.search(raw_html):
+            text = BeautifulSoup(raw_html, "html.parser").get_text(separator=" ")
+        else:
+            text = html.unescape(_TAG_RE.sub(' ', raw_html))
+        return _WS_RE.sub(' ', text).strip()
+
+    def _parse_feed(self, text: str) -> List[Dict]:
+        """
+        Parses up to _MAX_FEED_ENTRIES feed entries as feedparser-style dicts (title/link/summary/published).
+        RSS 2.0 <item>s are stream-parsed with lxml, stopping at the cap and freeing each element as it goes;
+        Atom/RDF feeds, malformed XML or a missing lxml fall back to feedparser.
+        """
+        if LXML_AVAILABLE:
+            entries = []
+            try:
+                # Parse the already-decoded text: the encoding override keeps the TW Big5 / chardet fix
+                # instead of trusting the XML declaration
+                context = etree.iterparse(io.BytesIO(text.encode('utf-8')), events=('end',), tag='item',
+                                          encoding='utf-8', recover=True, resolve_entities=False)
+                for _, elem in context:
+                    entries.append({
+                        'title': (elem.findtext('title') or '').strip(),
+                        'link': (elem.findtext('link') or '').strip(),
+                        'summary': elem.findtext('description') or '',
+                        'published': (elem.findtext('pubDate') or '').strip(),
+                    })
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                    if len(entries) >= _MAX_FEED_ENTRIES:
+                        break
+                if entries:
+                    return entries
+            except Exception as e:
+                self.logger.debug(f"lxml feed parse failed, falling back to feedparser: {e}")
+        
+        return feedparser.parse(text).entries[:_MAX_FEED_ENTRIES]
 
     def _filter_noise(self, entries: List[Dict], market: str) -> List[Dict]:
         """
         Filters out noise (listicles, reports) and duplicates.
         """
-        filtered = []
-        seen_titles = set()
+        return list(self._iter_clean_entries(entries, market))
+
+    def _iter_clean_entries(self, entries: List[Dict], market: str):
+        """
+        Lazily yields the entries that are neither duplicates nor noise, in feed order.
+        """
+        seen_titles = []
+        lsh = MinHashLSH()
         
         # Blocklist for TW market
-        NOISE_KEYWORDS = settings.NEWS_NOISE_KEYWORDS
+        noise_pattern = self._noise_pattern
         
         for entry in entries:
             title = entry.get('title', '').strip()
             if not title:
                 continue
                 
-            # 1. Deduplication (Fuzzy Match)
-            is_duplicate = False
-            for seen_title in seen_titles:
-                # Calculate similarity
-                similarity = difflib.SequenceMatcher(None, title, seen_title).ratio()
-                if similarity > 0.7: # Threshold
-                    is_duplicate = True
-                    break
-            
-            if is_duplicate:
+            # 1. Deduplication (Fuzzy Match): only LSH candidates are scored
+            keys = lsh.band_keys(title)
+            candidates = [seen_titles[idx] for idx in sorted(lsh.query(keys))]
+            if candidates and is_near_duplicate(title, candidates, _DEDUP_THRESHOLD):
                 continue
             
             # 2. Noise Filtering (TW only mostly)
-            is_noise = False
-            if market == 'TW':
-                for keyword in NOISE_KEYWORDS:
-                    if keyword in title:
-                        is_noise = True
-                        break
+            is_noise = market == 'TW' and noise_pattern is not None and noise_pattern.search(title) is not None
             
             if not is_noise:
-                filtered.append(entry)
-                seen_titles.add(title)
-                
-        return filtered
+                lsh.insert(keys, len(seen_titles))
+                seen_titles.append(title)
+                yield entry
+
+    def _parse_published(self, published_str: str) -> datetime:
+        """
+        Parses an RSS published date into an aware UTC datetime.
+        RSS dates are RFC 822 ('Fri, 28 Nov 2025 04:00:00 GMT'): the stdlib email parser handles them
+        directly; anything else goes through dateutil. Raises on unparseable input.
+        """
+        try:
+            dt = parsedate_to_datetime(published_str)
+        except (TypeError, ValueError):
+            dt = parser.parse(published_str)
+        
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=self._UTC)
+        return dt.astimezone(self._UTC)
 
     def _normalize_date(self, published_str: str, market: str) -> str:
         """
@@ -120,83 +236,60 @@ class NewsFetcher:
         Returns 'YYYY-MM-DD' string.
         """
         try:
-            # 1. Parse UTC/GMT time
-            dt_utc = parser.parse(published_str)
-            
-            # Ensure it is timezone-aware
-            if dt_utc.tzinfo is None:
-                dt_utc = dt_utc.replace(tzinfo=pytz.UTC)
-            else:
-                dt_utc = dt_utc.astimezone(pytz.UTC)
-
-            # 2. Define Market Timezone & Cutoff
-            tz_name = settings.MARKET_TIMEZONES.get(market, 'UTC')
-            cutoff_hour = settings.MARKET_ROLLOVER_HOURS.get(market, 24)
-            
-            tz = pytz.timezone(tz_name)
-
-            # 3. Convert to Local Time
-            dt_local = dt_utc.astimezone(tz)
-            
-            # 4. Rollover Logic
-            # If hour >= cutoff, move to next day
-            if dt_local.hour >= cutoff_hour:
-                effective_date = dt_local.date() + timedelta(days=1)
-            else:
-                effective_date = dt_local.date()
-                
-            return effective_date.strftime('%Y-%m-%d')
+            # 1. Parse UTC/GMT time (timezone-aware)
+            return self._effective_date(self._parse_published(published_str), market)
             
         except Exception as e:
             logging.getLogger(__name__).warning(f"Date parsing failed for {published_str}: {e}")
             # Fallback to today's date if parsing fails
             return datetime.now().strftime('%Y-%m-%d')
 
+    def _effective_date(self, dt_utc: datetime, market: str) -> str:
+        """
+        'YYYY-MM-DD' trading date of an aware datetime in the market's timezone, after rollover.
+        """
+        # 2. Market Timezone & Cutoff
+        tz = self._tz_by_market.get(market, self._UTC)
+        cutoff_hour = self._cutoff_by_market.get(market, 24)
+
+        # 3. Convert to Local Time
+        dt_local = dt_utc.astimezone(tz)
+        
+        # 4. Rollover Logic
+        # If hour >= cutoff, move to next day
+        if dt_local.hour >= cutoff_hour:
+            effective_date = dt_local.date() + timedelta(days=1)
+        else:
+            effective_date = dt_local.date()
+            
+        return effective_date.strftime('%Y-%m-%d')
+
     def _calculate_impact_score(self, title: str, link: str, market: str) -> float:
         """
         Calculates impact score based on keywords and source.
         """
         scores = settings.NEWS_IMPACT_SCORES
         score = scores.get('BASE_SCORE', 1.0)
-        title_lower = title.lower()
-        
-        # Keyword Lists
-        impact_kws = settings.NEWS_IMPACT_KEYWORDS.get(market, {})
-        tier_1 = impact_kws.get('TIER_1', [])
-        tier_2 = impact_kws.get('TIER_2', [])
-        
-        # Source Bonus List
-        premium_sources = settings.NEWS_PREMIUM_SOURCES
         
         # 1. Keyword Bonus
         # For TW, keywords are usually Chinese, case sensitivity matters less for Chinese characters but good to be safe.
         # For US, we use lowercase.
+        text = title if market == 'TW' else title.lower()
+        tier_1, tier_2 = self._impact_patterns.get(market, (None, None))
         
-        # Check Tier 1
-        for kw in tier_1:
-            if kw in (title if market == 'TW' else title_lower):
-                score += scores.get('TIER_1', 10.0)
-                break
+        if tier_1 is not None and tier_1.search(text):
+            score += scores.get('TIER_1', 10.0)
         
-        # Check Tier 2
-        for kw in tier_2:
-            if kw in (title if market == 'TW' else title_lower):
-                score += scores.get('TIER_2', 5.0)
-                break
+        if tier_2 is not None and tier_2.search(text):
+            score += scores.get('TIER_2', 5.0)
                     
         # 2. Source Bonus
-        for src in premium_sources:
-            if src in link:
-                score += scores.get('SOURCE_BONUS', 3.0)
-                break
+        if self._premium_pattern is not None and self._premium_pattern.search(link):
+            score += scores.get('SOURCE_BONUS', 3.0)
                 
         return score
 
-    def fetch_headlines(self, ticker: str, name: Optional[str] = None, market: str = 'US', start_date: Optional[str] = None) -> List[Dict[str, str]]:
-        """
-        Fetches top 5 news headlines after filtering and ranking.
-        Returns empty list on failure.
-        """
+    def _warn_lookahead(self, ticker: str, start_date: Optional[str]) -> None:
         # Warning about Look-ahead Bias
         logging.getLogger(__name__).warning(f"Fetching REAL-TIME news for {ticker}. CAUTION: This may introduce look-ahead bias if used for historical backtesting.")
         
@@ -209,125 +302,296 @@ class NewsFetcher:
                     self.logger.warning(f"WARNING: NewsFetcher limitations - Historical news prior to {start_date} is NOT available via RSS. Sentiment will be 0.0.")
             except Exception as e:
                 self.logger.warning(f"Error checking start_date limit: {e}")
-        
-        # Check Cache
-        cache_key = f"{ticker}_{market}"
-        if cache_key in self._cache:
+
+    def _cached_headlines(self, ticker: str, cache_key: str) -> Tuple[Optional[List[Dict[str, str]]], Optional[str], Optional[Dict]]:
+        """
+        Looks the query up in the TTL cache, then the disk cache.
+        Returns (fresh headlines or None, disk cache key, disk entry for revalidation).
+        """
+        with self._cache_lock:
+            cached_headlines = self._cache.get(cache_key)
+        if cached_headlines is not None:
             self.logger.info(f"Cache Hit for {ticker}")
-            return self._cache[cache_key]
-            
-        try:
-            # Auto-detect market based on ticker suffix
-            effective_market = market
-            search_ticker = ticker
-            
-            if ticker.endswith('.TW') or ticker.endswith('.TWO'):
-                effective_market = 'TW'
-                # Remove suffix for better search results (e.g., "2330" instead of "2330.TW")
-                search_ticker = ticker.split('.')[0]
-            
-            url = self._build_query(search_ticker, name, effective_market)
-            
-            # [OPTIMIZATION] Resilience: Use requests with timeout and headers, then parse string
-            # feedparser's remote fetching is flaky.
-            import requests
-            response = requests.get(url, headers=self.request_headers, timeout=self.timeout)
-            
-            # [FIX] Encoding Detection (Mojibake Fix)
-            # If TW, prioritize Big5 (common in legacy TW news feeds)
-            if effective_market == 'TW':
-                 # Force Big5 for TW if standard detection fails or is ambiguous
-                 # We assume TW sources are either UTF-8 or Big5.
-                 if response.encoding.lower() not in ['utf-8', 'utf8']:
-                    response.encoding = 'big5'
-            elif response.encoding.lower() not in ['utf-8', 'utf8']:
-                detected = chardet.detect(response.content)
-                if detected['encoding']:
-                    response.encoding = detected['encoding']
-            
-            response.raise_for_status()
-            feed = feedparser.parse(response.text) # Use .text to use the decoded unicode
-            
-            headlines = []
-            # Fetch 100 first, then filter (Increased to 100 to ensure top-5 survival)
-            all_entries = feed.entries[:100]
-            count_fetched = len(all_entries)
-            
-            # Apply Filtering
-            clean_entries = self._filter_noise(all_entries, effective_market)
-            count_after_noise = len(clean_entries)
-            
-            # --- Impact Ranking ---
-            scored_entries = []
-            for entry in clean_entries:
-                title = entry.get('title', '')
-                link = entry.get('link', '')
-                score = self._calculate_impact_score(title, link, effective_market)
+            return cached_headlines, None, None
+        
+        disk_key = ResponseCache.make_key("news_feed", cache_key) if self._disk_cache is not None else None
+        disk_entry = self._disk_cache.get_many([disk_key]).get(disk_key) if disk_key else None
+        if disk_entry and time.time() - disk_entry['fetched'] < self._cache.ttl:
+            self.logger.info(f"Disk Cache Hit for {ticker}")
+            with self._cache_lock:
+                self._cache[cache_key] = disk_entry['headlines']
+            return disk_entry['headlines'], disk_key, disk_entry
+        return None, disk_key, disk_entry
+
+    def _resolve_request(self, ticker: str, name: Optional[str], market: str) -> Tuple[str, str]:
+        """Returns (effective_market, feed url)."""
+        # Auto-detect market based on ticker suffix
+        effective_market = market
+        search_ticker = ticker
+        
+        if ticker.endswith('.TW') or ticker.endswith('.TWO'):
+            effective_market = 'TW'
+            # Remove suffix for better search results (e.g., "2330" instead of "2330.TW")
+            search_ticker = ticker.split('.')[0]
+        
+        return effective_market, self._build_query(search_ticker, name, effective_market)
+
+    def _conditional_request(self, cache_key: str, disk_entry: Optional[Dict]) -> Tuple[Optional[Tuple], Dict[str, str]]:
+        """Returns (validators, If-None-Match / If-Modified-Since headers) for a conditional GET."""
+        with self._cache_lock:
+            validators = self._validators.get(cache_key)
+        if validators is None and disk_entry and (disk_entry['etag'] or disk_entry['last_modified']):
+            validators = (disk_entry['etag'], disk_entry['last_modified'], disk_entry['headlines'])
+        conditional_headers = {}
+        if validators:
+            etag, last_modified, _ = validators
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+        return validators, conditional_headers
+
+    def _reuse_validated(self, ticker: str, cache_key: str, disk_key: Optional[str], validators: Tuple) -> List[Dict[str, str]]:
+        """Feed unchanged since the last download: skip parsing, filtering and ranking."""
+        self.logger.info(f"Feed not modified for {ticker}")
+        etag, last_modified, headlines = validators
+        with self._cache_lock:
+            self._cache[cache_key] = headlines
+        self._store_disk(disk_key, etag, last_modified, headlines)
+        return headlines
+
+    def _feed_encoding(self, declared: Optional[str], content: bytes, market: str) -> Optional[str]:
+        """
+        [FIX] Encoding Detection (Mojibake Fix): the charset to decode the feed body with.
+        """
+        if (declared or '').lower() in ['utf-8', 'utf8']:
+            return declared
+        # If TW, prioritize Big5 (common in legacy TW news feeds)
+        # We assume TW sources are either UTF-8 or Big5.
+        if market == 'TW':
+            return 'big5'
+        detected = chardet.detect(content)
+        return detected['encoding'] or declared
+
+    def _parse_and_rank(self, ticker: str, text: str, effective_market: str) -> List[Dict[str, str]]:
+        """
+        Parses the decoded feed, then filters, ranks and formats the top entries (CPU bound, no I/O).
+        """
+        all_entries = self._parse_feed(text)
+        
+        headlines = []
+        count_fetched = len(all_entries)
+        
+        # Limit to Top N (from settings)
+        limit = settings.NEWS_TOP_N_LIMIT
+        
+        # [FIX] Crypto Sparsity: Increase limit for Crypto to find older news if recent is scarce
+        if effective_market == 'CRYPTO':
+            limit = 30 
+        
+        # Single pass: dedup/noise filter -> stale filter -> impact score, feeding a bounded top-N
+        count_after_noise = 0
+        now_utc = datetime.now(self._UTC)
+        
+        def scored_entries():
+            nonlocal count_after_noise
+            for entry in self._iter_clean_entries(all_entries, effective_market):
+                count_after_noise += 1
                 # [FIX] Stale Data Filtering
                 # Google RSS sometimes returns ancient news (e.g., 2018) for generic queries.
                 # We strictly filter out anything older than 30 days to prevent "Linear Artifacts".
-                published_str = entry.get('published', '')
                 try:
-                    dt_pub = parser.parse(published_str)
-                    # Convert to UTC for comparison
-                    if dt_pub.tzinfo is None:
-                        dt_pub = dt_pub.replace(tzinfo=pytz.UTC)
-                    else:
-                        dt_pub = dt_pub.astimezone(pytz.UTC)
-                        
-                    # Calculate age
-                    now_utc = datetime.now(pytz.UTC)
-                    age_days = (now_utc - dt_pub).days
-                    
-                    if age_days > 30:
+                    dt_pub = self._parse_published(entry.get('published', ''))
+                    if (now_utc - dt_pub).days > 30:
                         # Skip stale news
                         continue
                 except Exception:
                     # If date is unparseable, let it pass (normalize_date will handle it or fallback to today)
-                    # OR safely skip. Safest is to skip if we can't verify freshness.
-                    pass
-
-                scored_entries.append((score, entry))
+                    dt_pub = None
+                
+                score = self._calculate_impact_score(entry.get('title', ''), entry.get('link', ''), effective_market)
+                yield score, dt_pub, entry
+        
+        # --- Impact Ranking ---
+        # Highest score first; nsmallest is stable, so ties keep feed order (same as a full stable sort)
+        final_entries = heapq.nsmallest(limit, scored_entries(), key=lambda x: -x[0])
+        count_final = len(final_entries)
+        
+        # [OPTIMIZATION] Observability: Funnel Metrics
+        self.logger.info(f"News Funnel for {ticker}: Fetched={count_fetched} -> NoiseFiltered={count_after_noise} -> Final={count_final}")
+        
+        for _, dt_pub, entry in final_entries:
+            summary = self._clean_html(entry.get('summary', ''))
+            published = entry.get('published', '')
             
-            # Sort by Score (Desc)
-            scored_entries.sort(key=lambda x: x[0], reverse=True)
+            # Normalize Date (reusing the parse from the stale filter)
+            if dt_pub is not None:
+                date_str = self._effective_date(dt_pub, effective_market)
+            else:
+                date_str = self._normalize_date(published, effective_market)
             
-            # Extract sorted entries
-            sorted_entries = [x[1] for x in scored_entries]
-            # ----------------------
+            headlines.append({
+                "title": entry.get('title', ''),
+                "link": entry.get('link', ''),
+                "published": published,
+                "date": date_str,
+                "summary": summary
+            })
+        return headlines
+
+    def _remember(self, cache_key: str, disk_key: Optional[str], etag: Optional[str], last_modified: Optional[str], headlines: List[Dict[str, str]]) -> None:
+        """Stores freshly ranked headlines in the TTL, validator and disk caches."""
+        with self._cache_lock:
+            self._cache[cache_key] = headlines
+            if etag or last_modified:
+                self._validators[cache_key] = (etag, last_modified, headlines)
+        self._store_disk(disk_key, etag, last_modified, headlines)
+
+    def fetch_headlines(self, ticker: str, name: Optional[str] = None, market: str = 'US', start_date: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Fetches top 5 news headlines after filtering and ranking.
+        Returns empty list on failure.
+        """
+        self._warn_lookahead(ticker, start_date)
+        
+        # Check Cache
+        cache_key = f"{ticker}_{market}"
+        cached_headlines, disk_key, disk_entry = self._cached_headlines(ticker, cache_key)
+        if cached_headlines is not None:
+            return cached_headlines
             
-            # Limit to Top N (from settings)
-            limit = settings.NEWS_TOP_N_LIMIT
+        try:
+            effective_market, url = self._resolve_request(ticker, name, market)
             
-            # [FIX] Crypto Sparsity: Increase limit for Crypto to find older news if recent is scarce
-            if effective_market == 'CRYPTO':
-                limit = 30 
-                
-            final_entries = sorted_entries[:limit]
-            count_final = len(final_entries)
+            # [OPTIMIZATION] Resilience: Use requests with timeout and headers, then parse string
+            # feedparser's remote fetching is flaky.
+            validators, conditional_headers = self._conditional_request(cache_key, disk_entry)
+            response = self._session.get(url, headers=conditional_headers, timeout=self.timeout)
             
-            # [OPTIMIZATION] Observability: Funnel Metrics
-            self.logger.info(f"News Funnel for {ticker}: Fetched={count_fetched} -> NoiseFiltered={count_after_noise} -> Final={count_final}")
+            if response.status_code == 304 and validators:
+                return self._reuse_validated(ticker, cache_key, disk_key, validators)
             
-            for entry in final_entries:
-                summary = self._clean_html(entry.get('summary', ''))
-                published = entry.get('published', '')
-                
-                # Normalize Date
-                date_str = self._normalize_date(published, effective_market)
-                
-                headlines.append({
-                    "title": entry.get('title', ''),
-                    "link": entry.get('link', ''),
-                    "published": published,
-                    "date": date_str,
-                    "summary": summary
-                })
+            response.encoding = self._feed_encoding(response.encoding, response.content, effective_market)
+            response.raise_for_status()
+            headlines = self._parse_and_rank(ticker, response.text, effective_market) # Use .text to use the decoded unicode
                 
             # Update Cache
-            self._cache[cache_key] = headlines
+            self._remember(cache_key, disk_key, response.headers.get('ETag'), response.headers.get('Last-Modified'), headlines)
             return headlines
             
         except Exception as e:
             logging.getLogger(__name__).warning(f"Failed to fetch news for {ticker}: {e}")
             return []
+
+    def _open_async_session(self) -> "aiohttp.ClientSession":
+        """One event-loop HTTP session: pooled keep-alive connections and cached DNS for a whole fan-out."""
+        connector = aiohttp.TCPConnector(limit=settings.NEWS_FETCH_CONNECTIONS, ttl_dns_cache=300)
+        return aiohttp.ClientSession(connector=connector, headers=self.request_headers,
+                                     timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    async def _get_async(self, session: "aiohttp.ClientSession", url: str, headers: Dict[str, str]) -> Tuple[int, bytes, Optional[str], Optional[str], Optional[str]]:
+        """
+        GET with the same retry policy as the requests session.
+        Returns (status, body, charset, etag, last_modified); raises on 4xx/5xx after the retries.
+        """
+        for attempt in range(_RETRY_TOTAL + 1):
+            last_attempt = attempt == _RETRY_TOTAL
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status in _RETRY_STATUSES and not last_attempt:
+                        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+                        continue
+                    response.raise_for_status()
+                    content = await response.read()
+                    return (response.status, content, response.charset,
+                            response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+    async def fetch_headlines_async(self, ticker: str, name: Optional[str] = None, market: str = 'US', start_date: Optional[str] = None,
+                                    session: Optional["aiohttp.ClientSession"] = None) -> List[Dict[str, str]]:
+        """
+        asyncio version of fetch_headlines over aiohttp (same caches, validators and output).
+        Decoding, parsing and ranking run in the default executor so the event loop keeps serving sockets.
+        Pass `session` to share one connection pool across calls; without aiohttp it runs fetch_headlines in the executor.
+        """
+        loop = asyncio.get_running_loop()
+        if not AIOHTTP_AVAILABLE:
+            return await loop.run_in_executor(None, lambda: self.fetch_headlines(ticker, name=name, market=market, start_date=start_date))
+        if session is None:
+            async with self._open_async_session() as own_session:
+                return await self.fetch_headlines_async(ticker, name, market, start_date, session=own_session)
+        
+        self._warn_lookahead(ticker, start_date)
+        
+        cache_key = f"{ticker}_{market}"
+        cached_headlines, disk_key, disk_entry = self._cached_headlines(ticker, cache_key)
+        if cached_headlines is not None:
+            return cached_headlines
+        
+        try:
+            effective_market, url = self._resolve_request(ticker, name, market)
+            validators, conditional_headers = self._conditional_request(cache_key, disk_entry)
+            status, content, charset, etag, last_modified = await self._get_async(session, url, conditional_headers)
+            
+            if status == 304 and validators:
+                return self._reuse_validated(ticker, cache_key, disk_key, validators)
+            
+            def decode_and_rank():
+                encoding = self._feed_encoding(charset, content, effective_market) or 'utf-8'
+                return self._parse_and_rank(ticker, content.decode(encoding, errors='replace'), effective_market)
+            
+            headlines = await loop.run_in_executor(None, decode_and_rank)
+            self._remember(cache_key, disk_key, etag, last_modified, headlines)
+            return headlines
+            
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Failed to fetch news for {ticker}: {e}")
+            return []
+
+    def _store_disk(self, disk_key: Optional[str], etag: Optional[str], last_modified: Optional[str], headlines: List[Dict[str, str]]) -> None:
+        """Writes a freshly fetched (or revalidated) feed to the process-shared disk cache."""
+        if disk_key is not None:
+            self._disk_cache.set_many({disk_key: {
+                "fetched": time.time(), "etag": etag, "last_modified": last_modified, "headlines": headlines
+            }})
+
+    async def fetch_headlines_many_async(self, requests_list: List[Tuple[str, Optional[str], str]]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Fetches headlines for several (ticker, name, market) requests on one event loop and one aiohttp session.
+        
+        Returns:
+            Dict[str, List[Dict[str, str]]]: {ticker: headlines}; failed tickers map to [].
+        """
+        if not requests_list:
+            return {}
+        
+        async with self._open_async_session() as session:
+            results = await asyncio.gather(*(
+                self.fetch_headlines_async(ticker, name=name, market=market, session=session)
+                for ticker, name, market in requests_list
+            ))
+        return {req[0]: headlines for req, headlines in zip(requests_list, results)}
+
+    def fetch_headlines_many(self, requests_list: List[Tuple[str, Optional[str], str]]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Fetches headlines for several (ticker, name, market) requests concurrently.
+        The RSS round trips are I/O bound, so wall time is roughly the slowest fetch instead of the sum.
+        Runs fetch_headlines_many_async with aiohttp; falls back to a thread pool without aiohttp,
+        or when called from a thread that already runs an event loop.
+        
+        Returns:
+            Dict[str, List[Dict[str, str]]]: {ticker: headlines}; failed tickers map to [].
+        """
+        if not requests_list:
+            return {}
+        
+        if AIOHTTP_AVAILABLE and not _event_loop_running():
+            return asyncio.run(self.fetch_headlines_many_async(requests_list))
+        
+        workers = min(settings.NEWS_ENGINE_WORKERS, len(requests_list))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+            results = executor.map(lambda req: self.fetch_headlines(req[0], name=req[1], market=req[2]), requests_list)
+            return {req[0]: headlines for req, headlines in zip(requests_list, results)}
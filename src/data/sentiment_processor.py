@@ -1,11 +1,48 @@
 import json
 import logging
+import importlib
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from src.config.settings import settings
-from src.analytics.sentiment.finbert_analyzer import FinBERTAnalyzer
-from src.analytics.sentiment.absa_analyzer import ABSAAnalyzer
+from src.ai.response_cache import ResponseCache, get_response_cache
+from src.data.text_dedup import dedupe_texts
+
+# Bump when the scoring pipeline changes (gatekeeper, weights, dedup) so cached scores are not reused
+_SCORING_VERSION = "2"
+
+def _scoring_namespace() -> str:
+    """Response-cache namespace for sentiment scores: changes with the models and filter threshold."""
+    return "|".join(("sentiment", _SCORING_VERSION, settings.FINBERT_PATH, settings.FINBERT_ONNX_PATH,
+                     settings.ABSA_MODEL_PATH, repr(settings.SENTIMENT_FILTER_THRESHOLD)))
+
+# FinBERTAnalyzer (torch/transformers) and ABSAAnalyzer (openai) are imported on first use:
+# importing this module, e.g. via NewsEngine/DataManager, must not load the ML stack.
+_LAZY_IMPORTS = {
+    "FinBERTAnalyzer": "src.analytics.sentiment.finbert_analyzer",
+    "ABSAAnalyzer": "src.analytics.sentiment.absa_analyzer",
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@lru_cache(maxsize=1)
+def _decay_kernel():
+    """Numba EWM kernel (src.data.decay_kernels), loaded on first use; None without numba."""
+    try:
+        from src.data.decay_kernels import decay_kernel
+        return decay_kernel
+    except ImportError:
+        return None
+
+def _lazy(name: str):
+    """Module global `name` (possibly patched in tests), importing it on first use."""
+    return globals()[name] if name in globals() else __getattr__(name)
 
 class SentimentAnalyzer:
     """
@@ -14,10 +51,11 @@ class SentimentAnalyzer:
     2. Analyze: LLM ABSA (Aspect-Based)
     3. Synthesize: Weighted Scoring
     """
-    def __init__(self, llm_client: Optional[object] = None):
+    def __init__(self, llm_client: Optional[object] = None, cache: Optional[ResponseCache] = None):
         self.logger = logging.getLogger(__name__)
         self.mode = settings.SENTIMENT_MODEL_TYPE
         self.llm_client = llm_client
+        self.cache = cache if cache is not None else get_response_cache()
         
         # Lazy loading to save resources if not used
         self.finbert = None
@@ -26,13 +64,13 @@ class SentimentAnalyzer:
     def _load_models(self):
         if self.finbert is None:
             try:
-                self.finbert = FinBERTAnalyzer(model_name=settings.FINBERT_PATH)
+                self.finbert = _lazy("FinBERTAnalyzer")(model_name=settings.FINBERT_PATH, onnx_path=settings.FINBERT_ONNX_PATH or None)
             except Exception as e:
                 self.logger.error(f"Failed to load FinBERT: {e}")
                 
         if self.absa is None:
             try:
-                self.absa = ABSAAnalyzer(llm_client=self.llm_client, model_id=settings.ABSA_MODEL_PATH)
+                self.absa = _lazy("ABSAAnalyzer")(llm_client=self.llm_client, model_id=settings.ABSA_MODEL_PATH)
             except Exception as e:
                 self.logger.error(f"Failed to load ABSA: {e}")
 
@@ -42,53 +80,102 @@ class SentimentAnalyzer:
         """
         if not news_list:
             return 0.0
+        return self.analyze_news_batched({None: news_list}, ticker)[None]
+
+    def analyze_news_batched(self, items_by_date: Dict[object, List[Dict]], ticker: str) -> Dict[object, float]:
+        """
+        Scores several days of news at once: one FinBERT pass and one ABSA batch for all dates.
+        Returns {date: score (-1.0 to 1.0)}, with the same per-date score as analyze_news.
+        Days whose exact news (ticker + texts) was scored before are served from the response cache.
+        """
+        return self._analyze_groups({date: (ticker, news_list) for date, news_list in items_by_date.items()})
+
+    def analyze_news_many(self, requests: List[Tuple[str, List[Dict]]]) -> Dict[str, float]:
+        """
+        Scores the news of several tickers in one FinBERT pass and one ABSA batch.
+        Returns {ticker: score (-1.0 to 1.0)}, the same score analyze_news gives each ticker alone.
+        """
+        return self._analyze_groups({ticker: (ticker, news_list) for ticker, news_list in requests})
+
+    def _analyze_groups(self, groups: Dict[object, Tuple[str, List[Dict]]]) -> Dict[object, float]:
+        """
+        Hybrid pipeline over {key: (ticker, news_list)}; every key gets its own averaged score.
+        """
+        tickers = {group: ticker for group, (ticker, _) in groups.items()}
+        items_by_group = {group: news_list for group, (_, news_list) in groups.items()}
+        scores = {group: 0.0 for group in items_by_group}
+        if not any(items_by_group.values()):
+            return scores
 
         if self.mode != "local_hybrid":
             self.logger.warning("Legacy mode not supported in this version. Please set SENTIMENT_MODEL_TYPE='local_hybrid'")
-            return 0.0
+            return scores
+
+        # "title. summary" per item, built once for both the cache key and the FinBERT input
+        texts_by_group = {group: [f"{item.get('title', '')}. {item.get('summary', '')}" for item in news_list]
+                          for group, news_list in items_by_group.items()}
+
+        cache_keys = {}
+        if self.cache is not None:
+            namespace = _scoring_namespace()
+            for group, texts in texts_by_group.items():
+                if texts:
+                    cache_keys[group] = ResponseCache.make_key(namespace, tickers[group], *sorted(texts))
+            cached = self.cache.get_many(cache_keys.values())
+            for group, key in cache_keys.items():
+                if key in cached:
+                    scores[group] = cached[key]
+            items_by_group = {group: news_list for group, news_list in items_by_group.items()
+                             if news_list and cache_keys[group] not in cached}
+            if not items_by_group:
+                return scores
 
         self._load_models()
         if not self.finbert or not self.absa:
              self.logger.error("Models not loaded. Returning 0.")
-             return 0.0
+             return scores
 
-        # Step 1: Pre-process and Batch for FinBERT
+        # Step 1: Pre-process and Batch for FinBERT (all groups in one list)
         processed_texts = []
-        original_map = [] # Map index to original item
+        text_groups = [] # Map index to its group
         
-        for item in news_list:
-            title = item.get('title', '')
-            summary = item.get('summary', '')
-            text = f"{title}. {summary}"
-            processed_texts.append(text)
-            original_map.append(item)
+        for group in items_by_group:
+            texts = texts_by_group[group]
+            processed_texts.extend(texts)
+            text_groups.extend([group] * len(texts))
 
         # Step 2: FinBERT Filter
+        # The same article often appears under several tickers/days: score each distinct text once
+        unique_texts, rep = dedupe_texts(processed_texts)
         try:
-            finbert_results = self.finbert.predict(processed_texts)
+            finbert_results = self.finbert.predict(unique_texts)
         except Exception as e:
             self.logger.error(f"FinBERT prediction failed: {e}")
-            return 0.0
+            return scores
 
         high_confidence_items = []
         
         # Filter logic
-        for i, res in enumerate(finbert_results):
+        for i, r in enumerate(rep):
+            if r >= len(finbert_results):
+                continue
+            res = finbert_results[r]
             neutral_score = res.get('Neutral', 0.0)
             if neutral_score > settings.SENTIMENT_FILTER_THRESHOLD: # > 0.85
                 continue # Skip noise
             
             # Keep interesting items
-            # We pass the text and the FinBERT score to the next stage
+            # We pass the (representative) text and the FinBERT score to the next stage
             high_confidence_items.append({
-                'text': processed_texts[i],
+                'text': unique_texts[r],
                 'finbert_score': res, # {'Positive', 'Negative', 'Neutral'}
-                'original': original_map[i]
+                'group': text_groups[i]
             })
 
         if not high_confidence_items:
-            self.logger.info(f"No significant news found for {ticker} after filtering.")
-            return 0.0
+            self.logger.info(f"No significant news found for {', '.join(sorted(set(tickers.values())))} after filtering.")
+            self._store_scores(scores, items_by_group, cache_keys)
+            return scores
 
         # Step 3: LLM ABSA Analysis (OPTIMIZED COST-SAVING)
         # We only analyze items where FinBERT is "Sure but needs nuance"
@@ -109,18 +196,27 @@ class SentimentAnalyzer:
                 indices_to_analyze.append(idx)
             # Else: skip LLM, use default neutral structure
         
+        absa_ok = True
         if texts_to_analyze:
             try:
-                batch_results = self.absa.analyze_batch(texts_to_analyze)
-                for i, res in enumerate(batch_results):
-                    absa_results_map[indices_to_analyze[i]] = res
+                # Items carry their representative text, so exact repeats (shared articles) reach the LLM once
+                unique_texts = list(dict.fromkeys(texts_to_analyze))
+                result_by_text = dict(zip(unique_texts, self.absa.analyze_batch(unique_texts)))
+                for text, idx in zip(texts_to_analyze, indices_to_analyze):
+                    res = result_by_text.get(text)
+                    if res is None:
+                        continue
+                    absa_results_map[idx] = res
+                    if 'Error' in res:
+                        absa_ok = False
             except Exception as e:
                 self.logger.error(f"ABSA prediction failed: {e}")
+                absa_ok = False
                 # Fallbck: map stays empty
 
-        # Step 4: Signal Synthesis
-        total_score = 0.0
-        count = 0
+        # Step 4: Signal Synthesis (per group)
+        totals = {}
+        counts = {}
         
         for i, item in enumerate(high_confidence_items):
             f_score = item['polarity']
@@ -151,18 +247,25 @@ class SentimentAnalyzer:
                 # Combined = 0.6 * FinBERT + 0.4 * 0 = 0.6 * FinBERT
                 combined_score = 0.6 * f_score 
 
-            total_score += combined_score
-            count += 1
+            group = item['group']
+            totals[group] = totals.get(group, 0.0) + combined_score
+            counts[group] = counts.get(group, 0) + 1
             
-        if count == 0:
-            return 0.0
+        for group, total_score in totals.items():
+            final_avg_score = total_score / counts[group]
             
-        final_avg_score = total_score / count
+            # Clamp
+            scores[group] = max(-1.0, min(1.0, final_avg_score))
         
-        # Clamp
-        final_avg_score = max(-1.0, min(1.0, final_avg_score))
-        
-        return final_avg_score
+        # FinBERT-only fallbacks after ABSA errors are not cached, so they are retried next time
+        if absa_ok:
+            self._store_scores(scores, items_by_group, cache_keys)
+        return scores
+
+    def _store_scores(self, scores: Dict[object, float], items_by_group: Dict[object, List[Dict]], cache_keys: Dict[object, str]) -> None:
+        """Writes freshly computed per-group scores to the response cache."""
+        if self.cache is not None:
+            self.cache.set_many({cache_keys[group]: scores[group] for group in items_by_group})
 
 class DecayModel:
     """
@@ -174,21 +277,26 @@ class DecayModel:
         # [FIX] Lower threshold to avoid "Dead Fish" on subtle news
         self.noise_threshold = 0.01 # Was settings.SENTIMENT_NOISE_THRESHOLD or 0.1
 
-    def apply_decay(self, dates: pd.DatetimeIndex, raw_scores: Dict[pd.Timestamp, float]) -> pd.Series:
+    def apply_decay(self, dates: Union[pd.DatetimeIndex, np.ndarray], raw_scores: Dict[pd.Timestamp, float]) -> pd.Series:
         """
         Applies exponential decay to sentiment scores over time using Vectorized operations.
+        `dates` may be a DatetimeIndex or a datetime64 array; it is wrapped into an index once.
         """
-        # 1. Align Raw Scores to Full Date Range
-        # Create a Series with NaNs where there is no score
-        raw_series = pd.Series(np.nan, index=dates)
+        dates = pd.DatetimeIndex(dates)
         
-        # Fill only existing dates (Much faster than iterating)
-        # We need to construct a Series from the dict and then reindex
-        # But for safety/robustness with duplicates in dict (if any), let's do:
-        incoming_series = pd.Series(raw_scores)
-        # Align to our target index
-        # We assume dates is sorted and unique mostly, but let's be safe
-        aligned_scores = incoming_series.reindex(dates) 
+        # 1. Align Raw Scores to Full Date Range
+        if dates.is_unique:
+            # One hash lookup of all news dates into the target index, one scatter into a 0.0 array
+            # (dates without news, or news outside the range, are simply skipped)
+            values = np.zeros(len(dates), dtype=np.float64)
+            if raw_scores:
+                positions = dates.get_indexer(pd.DatetimeIndex(list(raw_scores.keys())))
+                scores = np.fromiter(raw_scores.values(), dtype=np.float64, count=len(raw_scores))
+                found = positions >= 0
+                values[positions[found]] = scores[found]
+        else:
+            # get_indexer needs a unique index: reindex also fills every repeat of a date
+            values = pd.Series(raw_scores, dtype=np.float64).reindex(dates).to_numpy(dtype=np.float64)
         
         # 2. Fill NaNs with previous values (Forward Fill) for standard decay continuity?
         # WAIT: The original logic was:
@@ -210,12 +318,28 @@ class DecayModel:
         # This means sentiment decays towards 0.0.
         
         # Implementation with EWM:
-        # Fill missing with 0.0
-        aligned_scores = aligned_scores.fillna(0.0)
+        # Fill missing with 0.0 and clamp inputs (on the raw array: the pandas
+        # fillna/clip wrappers cost several times more than the EWM itself)
+        values = np.clip(np.nan_to_num(values, nan=0.0), -1.0, 1.0)
         
-        # Clamp inputs
-        aligned_scores = aligned_scores.clip(-1.0, 1.0)
+        kernel = _decay_kernel() if settings.SENTIMENT_NUMBA_DECAY else None
+        if kernel is not None and dates.is_monotonic_increasing:
+            # Compiled recurrence, same result as the times-based ewm below
+            delta_days = np.diff(dates.values) / np.timedelta64(1, 'D')
+            result = kernel(values, delta_days, self.lambda_param)
+        else:
+            result = self._ewm(pd.Series(values, index=dates), dates)
         
+        # Clamp result, then Noise Filter
+        result = np.clip(result, -1.0, 1.0)
+        result[np.abs(result) < self.noise_threshold] = 0.0
+        
+        return pd.Series(result, index=dates)
+
+    def _ewm(self, aligned_scores: pd.Series, dates: pd.DatetimeIndex) -> np.ndarray:
+        """
+        pandas EWM fallback for apply_decay (no numba, or unsorted dates).
+        """
         # EWM
         # Note: pandas ewm assumes constant time steps if 'times' not provided.
         # dates passed in IS the time index.
@@ -229,11 +353,5 @@ class DecayModel:
              # Fallback for older pandas or if dates index is not DatetimeIndex compatible
              # Assume daily steps if we can't use times
              result_series = aligned_scores.ewm(halflife=self.half_life, adjust=False).mean()
-             
-        # Clamp result
-        result_series = result_series.clip(-1.0, 1.0) # clip is vectorized max/min
-        
-        # Noise Filter
-        result_series[result_series.abs() < self.noise_threshold] = 0.0
         
-        return result_series
+        return result_series.to_numpy()
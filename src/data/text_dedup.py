@@ -0,0 +1,85 @@
+import difflib
+import zlib
+import numpy as np
+from typing import List, Tuple
+
+# Optional C++ string matcher, used as a pre-filter; difflib makes the final call
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+class MinHashLSH:
+    """
+    MinHash + banded LSH over character 3-grams, used to find near-duplicate text candidates
+    without comparing every pair. Bands x rows are tuned for a low Jaccard cut-off (~0.18):
+    a similarity ratio above 0.7 can still mean only ~0.35 shingle overlap on short headlines,
+    so candidates are confirmed with is_near_duplicate.
+    Signatures are stable across processes (crc32 shingle hashes, fixed seed).
+    """
+    _PRIME = (1 << 31) - 1
+    _SHINGLE = 3
+
+    def __init__(self, bands: int = 32, rows: int = 2, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        n = bands * rows
+        self._a = rng.integers(1, self._PRIME, n, dtype=np.int64)
+        self._b = rng.integers(0, self._PRIME, n, dtype=np.int64)
+        self._bands = bands
+        self._rows = rows
+        self._buckets = {}
+
+    def band_keys(self, text: str) -> List[bytes]:
+        k = self._SHINGLE
+        shingles = {text[i:i + k] for i in range(max(len(text) - k + 1, 1))}
+        # crc32 rather than hash(): str hashing is salted per process
+        h = np.fromiter((zlib.crc32(sh.encode("utf-8")) for sh in shingles), dtype=np.int64, count=len(shingles))
+        sig = ((np.outer(self._a, h % self._PRIME) + self._b[:, None]) % self._PRIME).min(axis=1)
+        return [i.to_bytes(1, "little") + sig[i * self._rows:(i + 1) * self._rows].tobytes() for i in range(self._bands)]
+
+    def query(self, keys: List[bytes]) -> set:
+        """Items sharing at least one band bucket."""
+        candidates = set()
+        for key in keys:
+            candidates.update(self._buckets.get(key, ()))
+        return candidates
+
+    def insert(self, keys: List[bytes], item) -> None:
+        for key in keys:
+            self._buckets.setdefault(key, []).append(item)
+
+def is_near_duplicate(text: str, candidates: List[str], threshold: float) -> bool:
+    """
+    True if any candidate's difflib ratio (0-1) to `text` exceeds `threshold`.
+    difflib's matching blocks form a common subsequence, so its ratio never exceeds the
+    Indel (LCS) ratio: rapidfuzz only rejects pairs that cannot pass, and difflib decides
+    the rest. The result is the same with or without rapidfuzz installed.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        cutoff = threshold * 100
+        candidates = [c for c in candidates if _rapidfuzz_ratio(text, c, score_cutoff=cutoff) >= cutoff]
+
+    matcher = difflib.SequenceMatcher(None, b=text)
+    for c in candidates:
+        matcher.set_seq1(c)
+        if matcher.ratio() > threshold:
+            return True
+    return False
+
+def dedupe_texts(texts: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Collapses texts that are identical up to whitespace, so each distinct text is processed once.
+    Near-identical texts are kept apart: a different figure or ticker can change the answer.
+    Returns (unique_texts, rep): texts[i] is represented by unique_texts[rep[i]].
+    """
+    position = {} # whitespace-normalized text -> index into unique_texts
+    unique_texts = []
+    rep = []
+    for text in texts:
+        key = " ".join(text.split())
+        if key not in position:
+            position[key] = len(unique_texts)
+            unique_texts.append(text)
+        rep.append(position[key])
+    return unique_texts, rep
@@ -1,17 +1,21 @@
 import sqlite3
 import concurrent.futures
 import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 
 
 import pandas as pd
 import numpy as np
 import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import time
 import re
-from typing import Optional, List, Callable, Any
-from typing import Optional, List, Callable, Any
-from src.utils import sanitize_ticker, detect_market
+from itertools import repeat
+from typing import Optional, List, Dict, Callable, Any
+from src.utils import sanitize_ticker, detect_market, TokenBucket
 import src.utils
 from src.config.settings import settings
 from src.data.news_engine import NewsEngine
@@ -26,15 +30,89 @@ from src.data_loader.providers.ccxt_provider import CcxtProvider
 
 logger = setup_logging(__name__)
 
+# Applied to every new connection: WAL persists in the file, but the rest are per-connection settings.
+# (The busy timeout comes from sqlite3.connect(timeout=settings.DEFAULT_TIMEOUT).)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA cache_size=-64000;",    # 64 MB page cache
+    "PRAGMA temp_store=MEMORY;",    # Sorts/temp indexes (e.g. GROUP BY, DISTINCT) stay in RAM
+    "PRAGMA mmap_size=268435456;",  # 256 MB memory-mapped reads for get_data
+)
+_MAX_TRACKED_CONNECTIONS = 32 # Dead threads' connections are closed once this many are open
+_FRAME_CACHE_SIZE = 16 # Cleaned get_data frames kept in memory per DataManager (LRU)
+_MAX_LOGGED_DATES = 10 # Dates listed in an aggregated FULL_VERIFY conflict log line
+
+# ohlcv is clustered on its primary key; {table} is "IF NOT EXISTS ohlcv" or a migration target
+_OHLCV_SCHEMA = '''
+    CREATE TABLE {table} (
+        ticker TEXT NOT NULL,
+        date TEXT NOT NULL,
+        open REAL,
+        high REAL,
+        low REAL,
+        close REAL,
+        volume REAL,
+        PRIMARY KEY (ticker, date)
+    ) WITHOUT ROWID
+'''
+
+# normalize_ticker rules compiled from settings.MARKET_CONFIG: (config they were built from, rules)
+_market_rules_cache = (None, None)
+
+def _market_rules(market_config: dict):
+    """
+    Returns (markets, known) for normalize_ticker:
+    - markets: [(market, compiled pattern, config)] in MARKET_CONFIG order
+    - known: {known ticker: (position of its market, normalized ticker)}, first market wins
+    Rebuilt only when settings.MARKET_CONFIG is replaced (e.g. patched in tests).
+    """
+    global _market_rules_cache
+    cached_config, rules = _market_rules_cache
+    if cached_config is market_config:
+        return rules
+    
+    markets = []
+    known = {}
+    for position, (market, config) in enumerate(market_config.items()):
+        markets.append((market, re.compile(config.get('pattern')), config))
+        suffixes = config.get('suffixes', [])
+        for symbol in config.get('known', ()):
+            known.setdefault(symbol, (position, f"{symbol}{suffixes[0]}" if suffixes else symbol))
+    rules = (markets, known)
+    _market_rules_cache = (market_config, rules)
+    return rules
+
 class DataManager:
     def __init__(self, db_path: str, news_engine: Optional[Any] = None):
         self.db_path = db_path
         self.news_engine = news_engine
+        # One keep-alive HTTP session shared by the backup providers, sized for the watchlist update pool
+        # (yfinance already shares its own curl session across Ticker objects; twstock has no session hook)
+        self._http_session = requests.Session()
+        pool_size = max(16, settings.DATA_UPDATE_WORKERS)
+        self._http_session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
         self.yf_provider = YFinanceProvider()
-        self.stooq_provider = StooqProvider()
+        self.stooq_provider = StooqProvider(session=self._http_session)
         self.twstock_provider = TwStockProvider()
-        self.ccxt_provider = CcxtProvider()
+        self.ccxt_provider = CcxtProvider(session=self._http_session)
         self._local = threading.local()
+        # Every connection handed out, as (owner thread, connection), so they can all be closed (hard_reset)
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        # Serializes OHLCV/metadata write transactions across update threads: SQLite allows one
+        # writer at a time, and queueing here avoids its busy-timeout sleep/retry loop
+        self._write_lock = threading.Lock()
+        # Paces watchlist update downloads across worker threads (replaces a fixed sleep per symbol)
+        self._rate_limiter = TokenBucket(settings.API_QPS, settings.API_BURST)
+        # normalize_ticker probe results (bare ticker -> suffixed ticker), backed by ticker_resolution
+        self._resolved_tickers = {}
+        # normalize_ticker results (input -> normalized), valid for the _market_rules they were built from
+        self._normalized = {}
+        self._normalized_rules = None
+        # get_data's cleaned OHLCV frames: (ticker, start, end) -> (database version, frame); see _load_ohlcv
+        self._frame_cache: OrderedDict = OrderedDict()
+        self._frame_cache_lock = threading.Lock()
 
     # [PERFORMANCE] Thread-Local Storage for Connection Pooling
 
@@ -44,6 +122,7 @@ class DataManager:
         Get a thread-local database connection.
         If a connection exists for this thread, reuse it.
         Otherwise, create a new one.
+        The connection is long-lived (its page cache stays warm): DataManager methods do not close it.
         """
         # Check if we have a cached connection
         conn = getattr(self._local, 'conn', None)
@@ -63,42 +142,66 @@ class DataManager:
         
         if is_closed:
             # Create new connection for this thread
-            self._local.conn = sqlite3.connect(self.db_path, timeout=settings.DEFAULT_TIMEOUT)
-            # [OPTIMIZATION] Enable WAL mode for every new connection
-            self._local.conn.execute("PRAGMA journal_mode=WAL;")
-            self._local.conn.execute("PRAGMA synchronous=NORMAL;")
+            # (check_same_thread=False only so close_connections may close it from another thread;
+            # a larger prepared-statement cache pays off now that connections are long-lived)
+            conn = sqlite3.connect(self.db_path, timeout=settings.DEFAULT_TIMEOUT, check_same_thread=False, cached_statements=256)
+            # [OPTIMIZATION] WAL mode and cache/mmap tuning for every new connection
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            
+            with self._connections_lock:
+                if len(self._connections) >= _MAX_TRACKED_CONNECTIONS:
+                    # Close connections left behind by finished threads (e.g. past update_all_tracked_symbols workers)
+                    live = []
+                    for thread, other in self._connections:
+                        if thread.is_alive():
+                            live.append((thread, other))
+                        else:
+                            other.close()
+                    self._connections = live
+                self._connections.append((threading.current_thread(), conn))
             
         return self._local.conn
 
+    @contextmanager
+    def _connection(self):
+        """
+        The thread's connection for one operation. It is kept open afterwards,
+        so a transaction left open by an error is rolled back instead of holding the write lock.
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    def close_connections(self) -> None:
+        """Closes the connections of all threads; each thread reconnects on its next get_connection."""
+        with self._connections_lock:
+            for _, conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Error closing DB connection: {e}")
+            self._connections = []
+        # Cached frames are validated against a connection that is now gone
+        with self._frame_cache_lock:
+            self._frame_cache.clear()
+
     def init_db(self) -> None:
         """Initialize the SQLite database with required tables."""
         logger.info(f"Initializing DB at {self.db_path}")
-        conn = self.get_connection()
-        
-        # [OPTIMIZATION] Enable WAL mode and synchronous=NORMAL for performance
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn = self.get_connection() # WAL / synchronous=NORMAL set by get_connection
         
         cursor = conn.cursor()
         
         # OHLCV Data Table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS ohlcv (
-                ticker TEXT,
-                date TEXT,
-                open REAL,
-                high REAL,
-                low REAL,
-                close REAL,
-                volume REAL,
-                PRIMARY KEY (ticker, date)
-            )
-        ''')
-        
-        # [OPTIMIZATION] Index for faster range queries
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_ohlcv_ticker_date ON ohlcv (ticker, date);
-        ''')
+        # [OPTIMIZATION] WITHOUT ROWID: rows live in the (ticker, date) primary-key B-tree itself,
+        # so get_data's range scan reads them already in date order (no sort, no separate index)
+        cursor.execute(_OHLCV_SCHEMA.format(table="IF NOT EXISTS ohlcv"))
+        self._migrate_ohlcv_without_rowid(conn)
         
         # Metadata Table (for tracking last update)
         cursor.execute('''
@@ -114,83 +217,188 @@ class DataManager:
                 symbol TEXT PRIMARY KEY
             )
         ''')
+
+        # Resolved market suffixes (normalize_ticker), so yfinance is probed once per ticker
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ticker_resolution (
+                ticker TEXT PRIMARY KEY,
+                resolved TEXT
+            )
+        ''')
         
         conn.commit()
-        conn.close()
+
+    def _migrate_ohlcv_without_rowid(self, conn: sqlite3.Connection) -> None:
+        """
+        Rebuilds an ohlcv table created by older versions (rowid table + idx_ohlcv_ticker_date)
+        as the WITHOUT ROWID layout. Runs once per database; later calls only read sqlite_master.
+        """
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='ohlcv'").fetchone()
+        if row is None or 'WITHOUT ROWID' in row[0].upper():
+            return
+
+        logger.info("Migrating ohlcv table to WITHOUT ROWID layout...")
+        with self._write_lock, conn: # Transaction
+            conn.execute("DROP TABLE IF EXISTS ohlcv_migrated")
+            conn.execute(_OHLCV_SCHEMA.format(table="ohlcv_migrated"))
+            # Rowid tables accept NULL primary-key columns; WITHOUT ROWID does not
+            conn.execute('''
+                INSERT OR IGNORE INTO ohlcv_migrated (ticker, date, open, high, low, close, volume)
+                SELECT ticker, date, open, high, low, close, volume FROM ohlcv
+                WHERE ticker IS NOT NULL AND date IS NOT NULL
+            ''')
+            conn.execute("DROP TABLE ohlcv") # Also drops idx_ohlcv_ticker_date
+            conn.execute("ALTER TABLE ohlcv_migrated RENAME TO ohlcv")
 
     def normalize_ticker(self, ticker: str) -> str:
         """
         Normalize ticker symbol for different markets using MARKET_CONFIG.
+        Results are memoized per input (until MARKET_CONFIG changes), except fallbacks taken
+        after a failed suffix probe, which are retried on the next call.
         """
         try:
-            # [FIX] Sanitize ticker
-            ticker = src.utils.sanitize_ticker(ticker)
-            
-            for market, config in settings.MARKET_CONFIG.items():
-                # Check known symbols first
-                known = config.get('known', set())
-                if ticker in known:
-                    suffixes = config.get('suffixes', [])
-                    if suffixes:
-                        return f"{ticker}{suffixes[0]}"
-                    return ticker
-
-                pattern = config.get('pattern')
-                suffixes = config.get('suffixes', [])
-                
-                if re.match(pattern, ticker):
-                    # [HOTFIX] Protection against US stocks being treated as Crypto
-                    # If this is CRYPTO market, and ticker is short (len<=5) and NOT known, skip it.
-                    # This prevents NVDA -> NVDA-USD.
-                    if market == 'CRYPTO' and len(ticker) <= 5 and ticker not in known:
-                        continue
-
-                    # If it matches the pattern, try suffixes
-                    if not suffixes:
-                        # If US (no suffix), we can't easily distinguish from Crypto by pattern alone
-                        # unless we check existence. 
-                        # But since US is before Crypto in dict (usually), it matches US first.
-                        # If we want to support implicit Crypto, we rely on 'known' list.
-                        return ticker
-                        
-                    for suffix in suffixes:
-                        test_ticker = f"{ticker}{suffix}"
-                        try:
-                            # Fast check with history
-                            hist = yf.Ticker(test_ticker).history(period='1d')
-                            if not hist.empty:
-                                return test_ticker
-                        except:
-                            pass
-                    
-                    # Default to first suffix if check fails but matches pattern
-                    if suffixes and config.get('default_on_fail', False):
-                        return f"{ticker}{suffixes[0]}"
+            rules = _market_rules(settings.MARKET_CONFIG)
+            if self._normalized_rules is not rules:
+                self._normalized = {}
+                self._normalized_rules = rules
             
-            return ticker
+            cached = self._normalized.get(ticker)
+            if cached is not None:
+                return cached
+            
+            # [FIX] Sanitize ticker
+            normalized, final = self._normalize(src.utils.sanitize_ticker(ticker), *rules)
+            if final:
+                self._normalized[ticker] = normalized
+            return normalized
         except Exception as e:
             logger.warning(f"Warning: normalize_ticker failed for {ticker}: {e}. Returning original.")
             return ticker
 
-    def _calc_smart_start(self, ticker: str) -> str:
+    def _normalize(self, ticker: str, markets: list, known: dict) -> tuple:
+        """
+        normalize_ticker for a sanitized ticker. Returns (normalized ticker, final), where final is
+        False when the result is a fallback after a suffix probe found nothing.
+        """
+        known_hit = known.get(ticker)
+        probe_failed = False
+        
+        for position, (market, pattern, config) in enumerate(markets):
+            # Known symbols of this market win over its pattern (O(1) lookup)
+            if known_hit and known_hit[0] == position:
+                return known_hit[1], True
+
+            suffixes = config.get('suffixes', [])
+            
+            if pattern.match(ticker):
+                # [HOTFIX] Protection against US stocks being treated as Crypto
+                # If this is CRYPTO market, and ticker is short (len<=5) and NOT known, skip it.
+                # This prevents NVDA -> NVDA-USD.
+                if market == 'CRYPTO' and len(ticker) <= 5:
+                    continue
+
+                # If it matches the pattern, try suffixes
+                if not suffixes:
+                    # If US (no suffix), we can't easily distinguish from Crypto by pattern alone
+                    # unless we check existence. 
+                    # But since US is before Crypto in dict (usually), it matches US first.
+                    # If we want to support implicit Crypto, we rely on 'known' list.
+                    return ticker, True
+                
+                # A single suffix that is the fallback anyway needs no network probe
+                if len(suffixes) == 1 and config.get('default_on_fail', False):
+                    return f"{ticker}{suffixes[0]}", True
+                    
+                resolved = self._resolve_suffix(ticker, suffixes)
+                if resolved:
+                    return resolved, True
+                probe_failed = True
+                
+                # Default to first suffix if check fails but matches pattern
+                if suffixes and config.get('default_on_fail', False):
+                    return f"{ticker}{suffixes[0]}", False
+        
+        return ticker, not probe_failed
+
+    def _resolve_suffix(self, ticker: str, suffixes: List[str]) -> Optional[str]:
+        """
+        Returns the first `ticker + suffix` yfinance has history for, or None.
+        Hits are remembered in memory and in the ticker_resolution table, so a ticker is
+        probed over the network once per database. Misses are not cached: a failed probe
+        (e.g. network down) must not pin the fallback suffix.
+        """
+        candidates = [f"{ticker}{suffix}" for suffix in suffixes]
+        
+        cached = self._resolved_tickers.get(ticker)
+        if cached in candidates:
+            return cached
+        try:
+            with self._connection() as conn:
+                row = conn.execute("SELECT resolved FROM ticker_resolution WHERE ticker=?", (ticker,)).fetchone()
+        except sqlite3.Error:
+            row = None # init_db not run yet
+        if row and row[0] in candidates:
+            self._resolved_tickers[ticker] = row[0]
+            return row[0]
+        
+        for test_ticker in candidates:
+            try:
+                # Fast check with history
+                hist = yf.Ticker(test_ticker).history(period='1d')
+                if hist.empty:
+                    continue
+            except Exception:
+                # Network/lookup failure: try the next suffix
+                continue
+            
+            self._resolved_tickers[ticker] = test_ticker
+            try:
+                with self._write_lock, self._connection() as conn, conn:
+                    conn.execute("INSERT OR REPLACE INTO ticker_resolution (ticker, resolved) VALUES (?, ?)", (ticker, test_ticker))
+            except sqlite3.Error as e:
+                logger.debug(f"Could not persist ticker resolution for {ticker}: {e}")
+            return test_ticker
+        return None
+
+    def _calc_smart_start(self, ticker: str, last_updated: Optional[Dict[str, Optional[str]]] = None) -> str:
         """
         Calculate the smart start date for updating data.
         - If no data: Returns "2000-01-01"
         - If data exists: Returns last_updated + 1 day
         - If up-to-date: Returns None (indicates no update needed)
+        `last_updated` is metadata the caller already loaded (ticker -> last_updated, None: no data);
+        tickers missing from it are queried.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT last_updated FROM metadata WHERE ticker=?", (ticker,))
-        row = cursor.fetchone()
-        conn.close()
+        if last_updated is not None and ticker in last_updated:
+            return self._smart_start_from(last_updated[ticker])
         
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT last_updated FROM metadata WHERE ticker=?", (ticker,))
+            row = cursor.fetchone()
+        
+        return self._smart_start_from(row[0] if row else None)
+
+    def _last_updated_by_symbol(self) -> Dict[str, str]:
+        """
+        last_updated of every watchlist symbol that has metadata, in one query
+        (instead of one _calc_smart_start query per symbol).
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT t.symbol, m.last_updated
+                FROM tracked_symbols t JOIN metadata m ON m.ticker = t.symbol
+            ''')
+            return {symbol: last_updated for symbol, last_updated in cursor.fetchall()}
+
+    @staticmethod
+    def _smart_start_from(last_updated: Optional[str]) -> Optional[str]:
+        """_calc_smart_start for an already known last_updated (None: no data yet)."""
         today = datetime.now().strftime('%Y-%m-%d')
         
-        if not row:
+        if not last_updated:
             return settings.DEFAULT_START_DATE
-            
-        last_updated = row[0]
         
         if last_updated >= today:
             return None # Up to date
@@ -231,7 +439,11 @@ class DataManager:
         chunk_start_years = range(year_start, year_end + 1, settings.MAX_CHUNK_YEARS)
         total_chunks = len(chunk_start_years)
         
-        all_dfs = []
+        # [OPTIMIZATION] Each chunk is written as soon as it is downloaded (no all_dfs list, concat or full row list)
+        fetched_any = False
+        stored_dates = set() # Dates written by earlier chunks keep their first version (as within a chunk)
+        last_volume = None # Volume forward fill continues across chunk boundaries
+        skipped_rows = Counter() # Rows dropped per missing column, logged once after the loop
         
         # [OPTIMIZATION] Sticky Provider Logic: Start with Primary
         current_provider = self.yf_provider
@@ -283,22 +495,45 @@ class DataManager:
                     logger.error(f"Backup provider {provider_name} failed. No further fallback.")
 
             if not df_chunk.empty:
-                all_dfs.append(df_chunk)
+                fetched_any = True
+                last_volume = self._store_chunk(df_chunk, ticker, stored_dates, last_volume, skipped_rows)
 
         if progress_callback:
             progress_callback(1.0, f"Finalizing {ticker} data...")
 
+        if skipped_rows:
+            logger.warning(f"Skipped {sum(skipped_rows.values())} rows for {ticker} due to missing columns: {dict(skipped_rows)}")
+
         
-        if not all_dfs:
+        if not fetched_any:
             logger.warning(f"No data fetched for {ticker}")
             return
 
-        # [ROBUSTNESS] Deduplication and Sorting
-        df = pd.concat(all_dfs)
+        with self._write_lock, self._connection() as conn:
+            cursor = conn.cursor()
+            # Update Metadata
+            today = datetime.now().strftime('%Y-%m-%d')
+            cursor.execute('''
+                INSERT OR REPLACE INTO metadata (ticker, last_updated)
+                VALUES (?, ?)
+            ''', (ticker, today))
+            
+            conn.commit()
+
+    def _store_chunk(self, df_chunk: pd.DataFrame, ticker: str, stored_dates: set, last_volume: Optional[float], skipped_rows: Counter) -> Optional[float]:
+        """
+        Cleans one downloaded chunk of fetch_data and writes it in a single transaction.
+        Dates in `stored_dates` (earlier chunks) are skipped; the set is updated in place.
+        A chunk missing a required column is counted in `skipped_rows` (column -> rows) instead of logged.
+        Returns the last known volume, which seeds the next chunk's forward fill.
+        Each chunk commits on its own: the write lock is never held across a provider download.
+        """
+        # [ROBUSTNESS] Duplicate dates, found with a hash pass over the index (rows keep their positions below)
+        duplicated = df_chunk.index.duplicated(keep='first')
+        
         # Ensure index is named 'date' for consistency before reset_index if possible, 
         # but better to reset first then rename.
-        df.index.name = 'date' 
-        df = df.reset_index()
+        df = df_chunk.rename_axis('date').reset_index()
         
         # Normalize columns to lowercase
         df.columns = [str(c).lower() for c in df.columns]
@@ -308,42 +543,54 @@ class DataManager:
         if 'volume' in df.columns:
             # Forward fill volume first (assume missing volume is same as previous day or 0)
             # Then fill remaining NaNs with 0
-            df['volume'] = df['volume'].ffill().fillna(0).astype(float)
+            volume = df['volume'].ffill()
+            if last_volume is not None:
+                volume = volume.fillna(last_volume)
+            if len(volume) and pd.notna(volume.iloc[-1]):
+                last_volume = float(volume.iloc[-1])
+            df['volume'] = volume.fillna(0).astype(float)
         
-        # [ROBUSTNESS] Drop duplicates based on date
-        if 'date' in df.columns:
-            df = df.drop_duplicates(subset=['date']).sort_values('date')
+        # [ROBUSTNESS] Drop duplicates based on date (no copy when there are none, the usual case)
+        if duplicated.any():
+            df = df[~duplicated]
         
-        # Efficient way:
-        data_tuples = []
-        for _, row in df.iterrows():
-            # Ensure we access the correct columns. yfinance usually gives 'Date' which becomes 'date'
-            # and 'Open', 'High' etc which become 'open', 'high'
-            try:
-                data_tuples.append((
-                    ticker, row['date'].strftime('%Y-%m-%d'), row['open'], row['high'], 
-                    row['low'], row['close'], row['volume']
-                ))
-            except KeyError as e:
-                logger.warning(f"Skipping row due to missing column: {e}")
-                continue
-            
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.executemany('''
-            INSERT OR REPLACE INTO ohlcv (ticker, date, open, high, low, close, volume)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', data_tuples)
-        
-        # Update Metadata
-        today = datetime.now().strftime('%Y-%m-%d')
-        cursor.execute('''
-            INSERT OR REPLACE INTO metadata (ticker, last_updated)
-            VALUES (?, ?)
-        ''', (ticker, today))
+        # Ensure we access the correct columns. yfinance usually gives 'Date' which becomes 'date'
+        # and 'Open', 'High' etc which become 'open', 'high'
+        try:
+            data_tuples = self._ohlcv_rows(df, ticker)
+        except KeyError as e:
+            skipped_rows[str(e)] += len(df)
+            return last_volume
         
-        conn.commit()
-        conn.close()
+        if stored_dates:
+            data_tuples = [row for row in data_tuples if row[1] not in stored_dates]
+        stored_dates.update(row[1] for row in data_tuples)
+            
+        with self._write_lock, self._connection() as conn, conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO ohlcv (ticker, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', data_tuples)
+        return last_volume
+
+    @staticmethod
+    def _ohlcv_rows(df: pd.DataFrame, ticker: str, dates: Optional[Any] = None) -> List[tuple]:
+        """
+        Builds the (ticker, 'YYYY-MM-DD', open, high, low, close, volume) insert rows column-wise
+        (one strftime pass and one tolist per column instead of a boxed Series per row).
+        `dates` (e.g. the DatetimeIndex) defaults to the 'date' column.
+        Raises KeyError if a required column is missing.
+        """
+        if dates is None:
+            dates = df['date']
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            date_strs = pd.DatetimeIndex(dates).strftime('%Y-%m-%d').tolist()
+        else:
+            date_strs = [d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d) for d in dates]
+        # tolist() yields native Python scalars, which sqlite3 binds directly
+        columns = [df[col].tolist() for col in ('open', 'high', 'low', 'close', 'volume')]
+        return list(zip(repeat(ticker), date_strs, *columns))
 
     def save_data(self, df: pd.DataFrame, ticker: str) -> None:
         """
@@ -354,43 +601,35 @@ class DataManager:
         if df.empty:
             return
 
-        # Ensure index is date
-        if 'date' not in df.columns and isinstance(df.index, pd.DatetimeIndex):
-            df = df.reset_index()
-            df.rename(columns={'index': 'date'}, inplace=True)
-            
         # Normalize columns
-        df.columns = [str(c).lower() for c in df.columns]
+        # [PERFORMANCE] Relabel (copy) only when needed; this also leaves the caller's frame untouched
+        if any(c != str(c).lower() for c in df.columns):
+            df = df.rename(columns=lambda c: str(c).lower())
+        
+        # Dates come from the 'date' column or straight from the DatetimeIndex (no reset_index copy)
+        dates = None
+        if 'date' not in df.columns and isinstance(df.index, pd.DatetimeIndex):
+            dates = df.index
         
-        data_tuples = []
-        for _, row in df.iterrows():
-            try:
-                date_str = row['date'].strftime('%Y-%m-%d') if hasattr(row['date'], 'strftime') else str(row['date'])
-                data_tuples.append((
-                    ticker, date_str, row['open'], row['high'], 
-                    row['low'], row['close'], row['volume']
-                ))
-            except KeyError as e:
-                continue
-                
-        conn = self.get_connection()
         try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.executemany('''
-                    INSERT OR REPLACE INTO ohlcv (ticker, date, open, high, low, close, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', data_tuples)
+            data_tuples = self._ohlcv_rows(df, ticker, dates)
+        except KeyError:
+            data_tuples = []
                 
-                # Update Metadata ONLY if we actually processed data
-                if len(data_tuples) > 0:
-                    today = datetime.now().strftime('%Y-%m-%d')
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO metadata (ticker, last_updated)
-                        VALUES (?, ?)
-                    ''', (ticker, today))
-        finally:
-            conn.close()
+        with self._write_lock, self._connection() as conn, conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO ohlcv (ticker, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', data_tuples)
+            
+            # Update Metadata ONLY if we actually processed data
+            if len(data_tuples) > 0:
+                today = datetime.now().strftime('%Y-%m-%d')
+                cursor.execute('''
+                    INSERT OR REPLACE INTO metadata (ticker, last_updated)
+                    VALUES (?, ?)
+                ''', (ticker, today))
 
 
     def get_data(self, ticker: str, include_sentiment: bool = False, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
@@ -398,55 +637,17 @@ class DataManager:
         # [FIX] Sanitize ticker
         ticker = sanitize_ticker(ticker)
         
-        # Default dates for SQL query range
-        # Use simple string comparison for dates as they are ISO8601 YYYY-MM-DD
-        sql_start = start_date if start_date else "1900-01-01"
-        sql_end = end_date if end_date else "2099-12-31"
-
-        conn = self.get_connection()
-        try:
-            # [OPTIMIZATION] SQL Range Query instead of loading full history
-            query = "SELECT * FROM ohlcv WHERE ticker=? AND date >= ? AND date <= ? ORDER BY date ASC"
-            df = pd.read_sql(query, conn, params=(ticker, sql_start, sql_end))
-        finally:
-            conn.close()
+        # Cleaned OHLCV (a private copy: the sentiment join below must not reach the cache)
+        df = self._load_ohlcv(ticker, start_date or None, end_date or None)
         
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.set_index('date') # Explicit assignment instead of inplace
-            
-            # [FIX] Enforce lowercase columns (Data Management Protocol)
-            # Remove TitleCase renaming and ensure all columns are lowercase
-            df.columns = [c.lower() for c in df.columns]
-            
-            # Ensure numeric columns are floats
-            cols = ['open', 'high', 'low', 'close', 'volume']
-            for c in cols:
-                if c in df.columns:
-                    df[c] = pd.to_numeric(df[c], errors='coerce')
-            
-            # [SAFETY] Clean Data: Smart Patching
-            # 1. Replace Inf with NaN
-            df = df.replace([np.inf, -np.inf], np.nan)
-            
-            # 2. Fix Volume (Missing volume -> 0.0)
-            if 'volume' in df.columns:
-                df['volume'] = df['volume'].fillna(0.0)
-            
-            # 3. Fix Price (Missing price -> ffill, then drop if still missing)
-            price_cols = [c for c in ['open', 'high', 'low', 'close'] if c in df.columns]
-            if price_cols:
-                df[price_cols] = df[price_cols].ffill()
-                df = df.dropna(subset=price_cols)
-            else:
-                # Fallback if no price columns (unlikely)
-                df = df.dropna()
-
             # [NEW] Integrate Sentiment
             if include_sentiment:
                 try:
-                    # Use injected engine or lazy load
-                    engine = self.news_engine if self.news_engine else NewsEngine()
+                    # Use injected engine or lazy load (kept for later calls: NewsEngine init is not cheap)
+                    if self.news_engine is None:
+                        self.news_engine = NewsEngine()
+                    engine = self.news_engine
                     start_date = df.index.min().strftime('%Y-%m-%d')
                     end_date = df.index.max().strftime('%Y-%m-%d')
                     
@@ -471,6 +672,91 @@ class DataManager:
                 
         return df
 
+    def _load_ohlcv(self, ticker: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        """
+        Reads and cleans the OHLCV rows of get_data (optionally limited to [start_date, end_date]).
+        Returns a copy the caller may modify.
+        [PERFORMANCE] Cleaned frames are kept in an in-memory LRU until the database changes, so a
+        ticker read again (e.g. by repeated backtests) skips the query, type coercion and ffill/dropna.
+        """
+        key = (ticker, start_date, end_date)
+        with self._connection() as conn:
+            # The data changed iff this connection wrote (total_changes) or another one committed (data_version).
+            # (The DB file's mtime is no signal: in WAL mode commits land in the -wal file.)
+            version = (conn, conn.total_changes, conn.execute("PRAGMA data_version").fetchone()[0])
+            with self._frame_cache_lock:
+                entry = self._frame_cache.get(key)
+                if entry is not None and entry[0] == version:
+                    self._frame_cache.move_to_end(key)
+                    return entry[1].copy()
+            
+            # [OPTIMIZATION] SQL Range Query instead of loading full history
+            # (the WITHOUT ROWID primary key already yields rows in date order: ORDER BY costs no sort)
+            # Dates are ISO8601 'YYYY-MM-DD' text, so string comparison is date order. Only the bounds
+            # actually given are compared: a full load does not test every row against sentinel dates.
+            query = "SELECT * FROM ohlcv WHERE ticker=?"
+            params = [ticker]
+            if start_date:
+                query += " AND date >= ?"
+                params.append(start_date)
+            if end_date:
+                query += " AND date <= ?"
+                params.append(end_date)
+            query += " ORDER BY date ASC"
+            # (dates are parsed while the frame is built)
+            df = pd.read_sql(query, conn, params=tuple(params), parse_dates=['date'])
+        
+        if df.empty:
+            return df
+        
+        # [PERFORMANCE] Move the date column into the index in place: set_index would copy every
+        # column of a full history, doubling peak memory for long-lived tickers
+        dates = df.pop('date')
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        df.index = pd.DatetimeIndex(dates, name='date')
+        
+        # [FIX] Enforce lowercase columns (Data Management Protocol)
+        # Remove TitleCase renaming and ensure all columns are lowercase
+        # (SQLite columns are normally lowercase already: only relabel when something changes)
+        lower_cols = [c.lower() for c in df.columns]
+        if lower_cols != list(df.columns):
+            df.columns = lower_cols
+        
+        # Ensure numeric columns are floats
+        # [SAFETY] Clean Data: Smart Patching
+        # 1. Replace Inf with NaN
+        # [PERFORMANCE] Only the OHLCV columns can hold an Inf: each is converted and checked with one
+        # np.isinf pass over its own buffer and written back once (no select_dtypes frame, no full-frame replace)
+        cols = ['open', 'high', 'low', 'close', 'volume']
+        for c in cols:
+            if c in df.columns:
+                values = pd.to_numeric(df[c], errors='coerce').to_numpy()
+                inf_mask = np.isinf(values)
+                if inf_mask.any():
+                    values = np.where(inf_mask, np.nan, values)
+                df[c] = values
+        
+        # 2. Fix Volume (Missing volume -> 0.0)
+        if 'volume' in df.columns:
+            df['volume'] = df['volume'].fillna(0.0)
+        
+        # 3. Fix Price (Missing price -> ffill, then drop if still missing)
+        price_cols = [c for c in ['open', 'high', 'low', 'close'] if c in df.columns]
+        if price_cols:
+            df[price_cols] = df[price_cols].ffill()
+            df = df.dropna(subset=price_cols)
+        else:
+            # Fallback if no price columns (unlikely)
+            df = df.dropna()
+
+        with self._frame_cache_lock:
+            self._frame_cache[key] = (version, df)
+            self._frame_cache.move_to_end(key)
+            while len(self._frame_cache) > _FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        return df.copy()
+
     def _get_backup_provider(self, ticker: str) -> Optional[Any]:
         """
         Get the appropriate backup provider for a ticker.
@@ -484,11 +770,16 @@ class DataManager:
             # Assume US stock or Other
             return self.stooq_provider
 
-    def update_data_if_needed(self, ticker: str, progress_callback: Optional[Callable[[float, str], None]] = None, update_mode: Optional[str] = None, start_date: Optional[str] = None) -> None:
-        """Check if data is stale and update if necessary."""
+    def update_data_if_needed(self, ticker: str, progress_callback: Optional[Callable[[float, str], None]] = None, update_mode: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, last_updated: Optional[Dict[str, Optional[str]]] = None) -> None:
+        """
+        Check if data is stale and update if necessary.
+        INCREMENTAL downloads only [max(start_date, smart start), end_date] (end_date None: today);
+        nothing is fetched when the stored data already covers that window.
+        `last_updated`: already loaded metadata for _calc_smart_start (see update_all_tracked_symbols).
+        """
         
         mode = update_mode if update_mode else settings.DATA_UPDATE_MODE
-        calc_start = self._calc_smart_start(ticker)
+        calc_start = self._calc_smart_start(ticker, last_updated)
         
         # Determine Final Start Date
         final_start = None
@@ -517,11 +808,15 @@ class DataManager:
             else:
                  final_start = calc_start
             
-            logger.info(f"Update Strategy: {mode}, User Start: {start_date}, Calculated: {calc_start}, Final: {final_start}")
+            # Stored data already reaches past the requested window
+            if final_start and end_date and final_start > end_date:
+                final_start = None
+            
+            logger.info(f"Update Strategy: {mode}, User Start: {start_date}, Calculated: {calc_start}, Final: {final_start}, End: {end_date}")
             
             if final_start:
                 logger.info(f"Updating data for {ticker} from {final_start}...")
-                self.fetch_data(ticker, start_date=final_start, progress_callback=progress_callback)
+                self.fetch_data(ticker, start_date=final_start, end_date=end_date, progress_callback=progress_callback)
             else:
                 logger.info(f"Data for {ticker} is up to date.")
                 if progress_callback:
@@ -615,81 +910,43 @@ class DataManager:
                 return
 
             # Voting Logic
-            # We iterate over conflicting rows or just all common rows?
-            # Iterating all common rows is safer but slower.
-            # Let's iterate over rows where diff > tolerance
-            
-            # Re-calculate diff mask
+            # [PERFORMANCE] Vote on all common dates at once: each comparison below is one
+            # vectorized (dates x columns) |a - b| > tolerance test instead of a per-date Python loop
             # Align all three
             common_dates_3 = common_dates.intersection(df_new_bak.index)
             
-            fixed_count = 0
-            unresolved_count = 0
+            df_pri_common = df_new_pri.loc[common_dates_3] # Also the source of the update rows
+            old_vals = df_old.loc[common_dates_3, cols_to_check].to_numpy(dtype=float)
+            pri_vals = df_pri_common[cols_to_check].to_numpy(dtype=float)
+            bak_vals = df_new_bak.loc[common_dates_3, cols_to_check].to_numpy(dtype=float)
+            tol = settings.DATA_DIFF_TOLERANCE
             
-            # Prepare a list of updates
-            updates = []
+            # Rows where some column differs (NaN never counts as a difference, as before)
+            old_ne_pri = (np.abs(old_vals - pri_vals) > tol).any(axis=1)
+            pri_ne_bak = (np.abs(pri_vals - bak_vals) > tol).any(axis=1)
+            bak_ne_old = (np.abs(bak_vals - old_vals) > tol).any(axis=1)
             
-            for date in common_dates_3:
-                row_old = df_old.loc[date]
-                row_pri = df_new_pri.loc[date]
-                row_bak = df_new_bak.loc[date]
-                
-                # Check if this row has conflict
-                row_diff = False
-                for col in cols_to_check:
-                    if abs(row_old[col] - row_pri[col]) > settings.DATA_DIFF_TOLERANCE:
-                        row_diff = True
-                        break
-                
-                if not row_diff:
-                    continue
-                    
-                # Voting
-                # Case A: New_Pri == New_Bak -> Update DB
-                pri_eq_bak = True
-                for col in cols_to_check:
-                    if abs(row_pri[col] - row_bak[col]) > settings.DATA_DIFF_TOLERANCE:
-                        pri_eq_bak = False
-                        break
-                
-                if pri_eq_bak:
-                    # Update DB with New_Pri
-                    updates.append(row_pri)
-                    fixed_count += 1
-                    continue
-                    
-                # Case B: New_Pri == Old -> Keep Old (Already in DB)
-                # Case C: New_Bak == Old -> Keep Old (Already in DB)
-                # Case D: All different -> Keep Old
-                
-                # We only need to act if we want to change DB.
-                # Since DB has Old, we only act in Case A.
-                
-                # But we should log unresolved
-                # Check if it's Case B or C to distinguish from D
-                pri_eq_old = True
-                for col in cols_to_check:
-                    if abs(row_pri[col] - row_old[col]) > settings.DATA_DIFF_TOLERANCE:
-                        pri_eq_old = False
-                        break
-                        
-                bak_eq_old = True
-                for col in cols_to_check:
-                    if abs(row_bak[col] - row_old[col]) > settings.DATA_DIFF_TOLERANCE:
-                        bak_eq_old = False
-                        break
-                        
-                if not pri_eq_old and not bak_eq_old:
-                    # Case D
-                    logger.error(f"Data Conflict Unresolved for {ticker} on {date}")
-                    unresolved_count += 1
+            # Case A: New_Pri == New_Bak -> Update DB with New_Pri
+            update_mask = old_ne_pri & ~pri_ne_bak
+            # Case B: New_Pri == Old -> Keep Old (Already in DB; not a conflict row)
+            # Case C: New_Bak == Old -> Keep Old (Already in DB)
+            # Case D: All different -> Keep Old, but log as unresolved
+            unresolved_mask = old_ne_pri & pri_ne_bak & bak_ne_old
+            
+            fixed_count = int(update_mask.sum())
+            unresolved_count = int(unresolved_mask.sum())
+            
+            # One aggregated log line instead of one per date (a bad provider can disagree on thousands)
+            if unresolved_count:
+                unresolved_dates = common_dates_3[unresolved_mask].strftime('%Y-%m-%d')
+                shown = ", ".join(unresolved_dates[:_MAX_LOGGED_DATES])
+                more = f" (+{unresolved_count - _MAX_LOGGED_DATES} more)" if unresolved_count > _MAX_LOGGED_DATES else ""
+                logger.error(f"Data Conflict Unresolved for {ticker} on {unresolved_count} dates: {shown}{more}")
             
             # Apply updates
-            if updates:
-                df_updates = pd.DataFrame(updates)
-                # [FIX] Restore index from Series names (dates)
-                df_updates.index = [s.name for s in updates]
-                df_updates.index.name = 'date'
+            if fixed_count:
+                # Boolean row slice of the aligned frame (no per-row Series, no second label lookup)
+                df_updates = df_pri_common[update_mask] # index already named 'date'
                 
                 self.save_data(df_updates, ticker)
                 
@@ -710,32 +967,32 @@ class DataManager:
         ticker = self.normalize_ticker(ticker)
         
         logger.warning(f"Purging all data for {ticker}...")
-        conn = self.get_connection()
-        cursor = conn.cursor()
         try:
-            with conn: # Transaction
+            with self._write_lock, self._connection() as conn, conn: # Transaction
+                cursor = conn.cursor()
                 cursor.execute("DELETE FROM ohlcv WHERE ticker=?", (ticker,))
                 rows_ohlcv = cursor.rowcount
                 cursor.execute("DELETE FROM metadata WHERE ticker=?", (ticker,))
                 rows_meta = cursor.rowcount
-                logger.info(f"Purged {rows_ohlcv} OHLCV rows and {rows_meta} metadata rows for {ticker}.")
+            logger.info(f"Purged {rows_ohlcv} OHLCV rows and {rows_meta} metadata rows for {ticker}.")
         except Exception as e:
             logger.error(f"Failed to purge data for {ticker}: {e}")
             raise e
-        finally:
-            conn.close()
 
     def hard_reset(self) -> None:
         """
         Hard Reset:
-        1. Close DB connection (self.get_connection returns new one, but allow garbage collection).
+        1. Close the DB connections of all threads (get_connection opens new ones).
         2. Delete SQLite DB file.
         3. Clear Sentiment Cache directory.
         4. Re-initialize DB.
         """
         logger.critical("Initiating HARD RESET. Deleting all data...")
         
-        # 1. Delete DB File
+        # 1. Delete DB File (open connections would keep writing to the unlinked file)
+        self.close_connections()
+        self._resolved_tickers.clear()
+        self._normalized = {}
         if os.path.exists(self.db_path):
             try:
                 os.remove(self.db_path)
@@ -796,34 +1053,21 @@ class DataManager:
         # [FIX] Normalize symbol (e.g., 00679B -> 00679B.TWO)
         symbol = self.normalize_ticker(symbol)
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("INSERT OR IGNORE INTO tracked_symbols (symbol) VALUES (?)", (symbol,))
-            conn.commit()
-        finally:
-            conn.close()
+        with self._write_lock, self._connection() as conn, conn:
+            conn.execute("INSERT OR IGNORE INTO tracked_symbols (symbol) VALUES (?)", (symbol,))
 
     def remove_from_watchlist(self, symbol: str) -> None:
         """Remove a symbol from the watchlist."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("DELETE FROM tracked_symbols WHERE symbol=?", (symbol,))
-            conn.commit()
-        finally:
-            conn.close()
+        with self._write_lock, self._connection() as conn, conn:
+            conn.execute("DELETE FROM tracked_symbols WHERE symbol=?", (symbol,))
 
     def get_watchlist(self) -> List[str]:
         """Get all symbols from the watchlist."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
+        with self._connection() as conn:
+            cursor = conn.cursor()
             cursor.execute("SELECT symbol FROM tracked_symbols")
             rows = cursor.fetchall()
             return [row[0] for row in rows]
-        finally:
-            conn.close()
 
     def update_all_tracked_symbols(self, progress_callback: Optional[Callable[[float, str], None]] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, update_mode: Optional[str] = None) -> None:
         """
@@ -837,42 +1081,29 @@ class DataManager:
         total = len(watchlist)
         completed = 0
         
-        # Helper function for single ticker update to be run in thread
-        def _update_single_ticker(symbol: str):
-            try:
-                # Local logging for thread
-                # Calculate start date
-                current_start_date = start_date
-                
-                if not current_start_date:
-                    smart_start = self._calc_smart_start(symbol)
-                    if not smart_start:
-                        return f"{symbol} is up-to-date."
-                    current_start_date = smart_start
-                
-                # Determine mode
-                current_mode = update_mode if update_mode else settings.DATA_UPDATE_MODE
-                
-                # Trigger update
-                # Note: We can reuse update_data_if_needed logic or call fetch_data directly.
-                # Since we calculated start_date, let's call fetch_data directly to avoid re-calc
-                # BUT logic in `update_data_if_needed` handles FULL_VERIFY vs INCREMENTAL.
-                # Let's delegate to `update_data_if_needed` but pass `update_mode` explicitly.
-                # However, `update_data_if_needed` does its own `_calc_smart_start` inside for INCREMENTAL.
-                # To avoid double calc, we can just let it handle it.
-                
-                self.update_data_if_needed(symbol, progress_callback=None, update_mode=current_mode, start_date=current_start_date)
-                return f"Updated {symbol}"
-            except Exception as e:
-                logger.error(f"Error updating {symbol}: {e}")
-                return f"Error {symbol}: {str(e)}"
+        # Smart start dates of the whole watchlist from one metadata query (None: no data yet),
+        # passed down to update_data_if_needed (_calc_smart_start) for this run only
+        known = self._last_updated_by_symbol()
+        last_updated = {symbol: known.get(symbol) for symbol in watchlist}
+        
+        # Determine mode
+        current_mode = update_mode if update_mode else settings.DATA_UPDATE_MODE
 
-        # [OPTIMIZATION] Parallel Execution
-        logger.info(f"Starting parallel update for {total} symbols with max_workers=5...")
+        # [OPTIMIZATION] Parallel Execution: downloads overlap, DB writes queue on _write_lock.
+        # Providers keep no per-request state, so the worker threads share them.
+        # Progress is counted here in the calling thread, so it needs no lock.
+        # Symbols are not batched into multi-ticker calls: every provider endpoint is per symbol
+        # (yf.download(tickers=[...]) itself issues one Yahoo chart request per ticker on its own threads),
+        # so this per-symbol fan-out saves as many round trips while keeping per-ticker failover and checks.
+        max_workers = max(1, min(settings.DATA_UPDATE_WORKERS, total))
+        logger.info(f"Starting parallel update for {total} symbols with max_workers={max_workers}...")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
-            future_to_symbol = {executor.submit(_update_single_ticker, symbol): symbol for symbol in watchlist}
+            future_to_symbol = {
+                executor.submit(self._update_one, symbol, start_date, end_date, current_mode, last_updated): symbol
+                for symbol in watchlist
+            }
             
             for future in concurrent.futures.as_completed(future_to_symbol):
                 symbol = future_to_symbol[future]
@@ -888,3 +1119,27 @@ class DataManager:
         
         logger.info("Parallel update complete.")
 
+    def _update_one(self, symbol: str, start_date: Optional[str], end_date: Optional[str], update_mode: str, last_updated: Dict[str, Optional[str]]) -> str:
+        """
+        Updates one watchlist symbol (run on update_all_tracked_symbols' worker threads).
+        Without `start_date` the smart start comes from `last_updated` (see _last_updated_by_symbol).
+        Returns a status line; errors are logged and reported, never raised.
+        """
+        try:
+            # Calculate start date
+            current_start_date = start_date
+            
+            if not current_start_date:
+                smart_start = self._smart_start_from(last_updated.get(symbol))
+                if not smart_start:
+                    return f"{symbol} is up-to-date."
+                current_start_date = smart_start
+            
+            # update_data_if_needed handles FULL_VERIFY vs INCREMENTAL, reusing the same metadata
+            # (up-to-date symbols returned above without taking a rate-limit token)
+            self._rate_limiter.acquire()
+            self.update_data_if_needed(symbol, progress_callback=None, update_mode=update_mode, start_date=current_start_date, end_date=end_date, last_updated=last_updated)
+            return f"Updated {symbol}"
+        except Exception as e:
+            logger.error(f"Error updating {symbol}: {e}")
+            return f"Error {symbol}: {str(e)}"
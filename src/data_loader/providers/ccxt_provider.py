@@ -1,7 +1,9 @@
 import ccxt
 import pandas as pd
 import logging
+import requests
 from datetime import datetime
+from typing import Optional
 from src.data_loader.providers.base import BaseDataProvider
 
 logger = logging.getLogger(__name__)
@@ -9,16 +11,20 @@ logger = logging.getLogger(__name__)
 class CcxtProvider(BaseDataProvider):
     """Data provider using CCXT (Binance) for Crypto."""
 
-    def __init__(self, exchange_id: str = 'binance'):
+    def __init__(self, exchange_id: str = 'binance', session: Optional[requests.Session] = None):
         """
         Initialize CCXT provider.
         :param exchange_id: 'binance' or 'kraken'
+        :param session: Shared HTTP session (keep-alive connection pool); ccxt creates its own if None
         """
         self.exchange_id = exchange_id
+        config = {'enableRateLimit': True}
+        if session is not None:
+            config['session'] = session
         if exchange_id == 'binance':
-            self.exchange = ccxt.binance({'enableRateLimit': True})
+            self.exchange = ccxt.binance(config)
         elif exchange_id == 'kraken':
-            self.exchange = ccxt.kraken({'enableRateLimit': True})
+            self.exchange = ccxt.kraken(config)
         else:
             raise ValueError(f"Unsupported exchange: {exchange_id}")
 
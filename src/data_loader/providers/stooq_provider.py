@@ -1,5 +1,7 @@
 import pandas_datareader.data as web
 import pandas as pd
+import requests
+from typing import Optional
 from src.data_loader.providers.base import BaseDataProvider
 import logging
 
@@ -8,13 +10,22 @@ logger = logging.getLogger(__name__)
 class StooqProvider(BaseDataProvider):
     """Data provider using Stooq via pandas-datareader."""
 
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        :param session: Shared HTTP session (keep-alive connection pool); pandas-datareader opens its own if None
+        """
+        self.session = session
+
     def fetch_history(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch historical data from Stooq.
         """
         try:
             # Stooq uses 'stooq' as source
-            df = web.DataReader(ticker, 'stooq', start=start_date, end=end_date)
+            if self.session is not None:
+                df = web.DataReader(ticker, 'stooq', start=start_date, end=end_date, session=self.session)
+            else:
+                df = web.DataReader(ticker, 'stooq', start=start_date, end=end_date)
             
             if df.empty:
                 raise ValueError(f"No data found for {ticker} from Stooq")
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-import queue
+from collections import deque
 from src.core.events import Event, OrderEvent, FillEvent
 
 class ExecutionHandler:
@@ -9,7 +9,7 @@ class ExecutionHandler:
     In a real system, this would connect to a Broker API (IB, Binance).
     Here, it acts as a simulator that fills 'MKT' orders immediately at current prices.
     """
-    def __init__(self, events_queue: queue.Queue):
+    def __init__(self, events_queue: deque):
         self.events = events_queue
 
     def execute_order(self, event: OrderEvent, current_prices: dict, timestamp: datetime, 
@@ -53,4 +53,4 @@ class ExecutionHandler:
             commission=commission
         )
         
-        self.events.put(fill_event)
+        self.events.append(fill_event)
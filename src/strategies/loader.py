@@ -1,8 +1,18 @@
 import traceback
 import re
+from functools import lru_cache
 from src.strategies.base import Strategy
 from src.config.settings import settings
 
+# Best-practice checks (warning only)
+_RELATIVE_IMPORT_RE = re.compile(r'^\s*from\s+\.', re.MULTILINE)
+_MATPLOTLIB_RE = re.compile(r'(?:import|from)\s+matplotlib')
+
+@lru_cache(maxsize=8)
+def _compile_forbidden(patterns: tuple) -> tuple:
+    """Compiles settings.FORBIDDEN_REGEXES once (keyed by content, so runtime overrides still apply)."""
+    return tuple(re.compile(p) for p in patterns)
+
 class StrategyLoadError(Exception):
     """Custom exception for errors during strategy loading."""
     pass
@@ -30,18 +40,17 @@ class StrategyLoader:
         # Static Analysis for Look-ahead Bias
         # Security Check: Look-ahead Bias Detection using Regex
         # We check for negative shifts and forward indexing which imply future data access.
-        # We check for negative shifts and forward indexing which imply future data access.
-        forbidden_regexes = settings.FORBIDDEN_REGEXES
+        forbidden_patterns = _compile_forbidden(tuple(settings.FORBIDDEN_REGEXES))
         
-        for pattern in forbidden_regexes:
-            if re.search(pattern, code_str):
-                raise StrategyLoadError(f"Security Violation: Detected potential look-ahead bias pattern '{pattern}'. Future data access is forbidden.")
+        for pattern in forbidden_patterns:
+            if pattern.search(code_str):
+                raise StrategyLoadError(f"Security Violation: Detected potential look-ahead bias pattern '{pattern.pattern}'. Future data access is forbidden.")
 
         # SSOT & Best Practices Validation (Warning Only)
         warnings = []
-        if re.search(r'^\s*from\s+\.', code_str, re.MULTILINE):
+        if _RELATIVE_IMPORT_RE.search(code_str):
              warnings.append("Relative import detected (e.g. 'from .base'). Please use absolute imports (e.g. 'from src.strategies.base').")
-        if re.search(r'import\s+matplotlib', code_str) or re.search(r'from\s+matplotlib', code_str):
+        if _MATPLOTLIB_RE.search(code_str):
              warnings.append("Visual library 'matplotlib' detected. UI logic should be separate from Strategy logic.")
         
         if warnings:
@@ -312,7 +312,7 @@ def render_data_management_page(dm):
                 
                 if os.path.exists(cache_path):
                     try:
-                        sent_df = pd.read_parquet(cache_path)
+                        sent_df = dm.news_engine.read_cache(selected_ticker)
                         if not sent_df.empty:
                             st.caption("Sentiment Score (Decayed): Polarity over time")
                             # Normalize index to datetime just in case
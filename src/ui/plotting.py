@@ -163,7 +163,10 @@ def plot_equity_curve(strategy_equity: pd.DataFrame, benchmark_equity: pd.DataFr
             start_date = x_strategy.min()
             end_date = x_strategy.max()
             # Clip benchmark to strategy period
-            bench_series = bench_series.loc[(bench_series.index >= start_date) & (bench_series.index <= end_date)]
+            if bench_series.index.is_monotonic_increasing:
+                bench_series = bench_series.loc[start_date:end_date]
+            else:
+                bench_series = bench_series.loc[(bench_series.index >= start_date) & (bench_series.index <= end_date)]
 
         # Normalize Benchmark (Long-Only) to Initial Capital
         if not bench_series.empty:
@@ -227,8 +227,12 @@ def render_strategy_creation_page(dm):
                     return
                 
                 # Filter Data
-                mask = (df.index >= pd.to_datetime(start_date)) & (df.index <= pd.to_datetime(end_date))
-                df = df.loc[mask]
+                start_ts, end_ts = pd.to_datetime(start_date), pd.to_datetime(end_date)
+                if df.index.is_monotonic_increasing:
+                    # get_data returns rows ORDER BY date: binary-searched slice instead of a full mask
+                    df = df.loc[start_ts:end_ts]
+                else:
+                    df = df.loc[(df.index >= start_ts) & (df.index <= end_ts)]
                 
                 if df.empty:
                     st.error("No data in the selected date range.")
@@ -506,7 +510,7 @@ def render_strategy_creation_page(dm):
                 mc_trade_returns = calculate_round_trip_returns(results['trades'], commission_rate=commission_rate)
                 
                 # --- Debug & Sanity Check ---
-                if mc_trade_returns:
+                if len(mc_trade_returns) > 0:
                     avg_mc_return = sum(mc_trade_returns) / len(mc_trade_returns)
                     
                     # Debug Output
@@ -525,7 +529,7 @@ def render_strategy_creation_page(dm):
                                     "This is expected if you are using small position sizing (Portfolio-Weighted Returns).")
                 # ----------------------------
                 
-                if not mc_trade_returns:
+                if len(mc_trade_returns) == 0:
                     st.warning("Not enough trades to run Monte Carlo simulation.")
                 else:
                     from src.analytics.monte_carlo import run_monte_carlo_simulation
@@ -1,17 +1,22 @@
 import sys
 import os
 import logging
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from src.config.settings import settings
 
 
 
+@lru_cache(maxsize=1024)
 def sanitize_ticker(ticker: str) -> str:
     """
     Standardize ticker format:
     - Remove leading/trailing whitespace
     - Remove single/double quotes
     - Convert to uppercase
+    Memoized: the same symbols are sanitized over and over (fetch, normalize, purge, watchlist).
     """
     if not ticker:
         return ""
@@ -23,6 +28,34 @@ def strip_quotes(text: str) -> str:
         return ""
     return text.strip().strip("'").strip('"')
 
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter: bursts of up to `capacity` calls, refilled at `rate` tokens per second.
+    A non-positive `rate` disables limiting.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Takes one token, sleeping only while the bucket is empty."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # Sleep outside the lock: other threads may refill-check meanwhile
+            time.sleep(wait)
+
 def add_project_root() -> None:
     """
     Add the project root directory to sys.path to allow absolute imports.
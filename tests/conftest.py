@@ -25,6 +25,14 @@ def mock_price_data():
     df.index.name = "date"
     return df
 
+@pytest.fixture(autouse=True)
+def no_response_cache(monkeypatch):
+    """
+    Keep tests independent: the persistent LLM response and news feed caches are off unless a test passes its own.
+    """
+    monkeypatch.setattr(settings, "LLM_RESPONSE_CACHE", False)
+    monkeypatch.setattr(settings, "NEWS_DISK_CACHE", False)
+
 @pytest.fixture
 def mock_settings(monkeypatch):
     """
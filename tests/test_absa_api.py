@@ -81,6 +81,43 @@ def test_absa_wrapper_json(mock_llm_client):
     
     assert result.get('Overall_Sentiment') == "Negative"
 
+def test_absa_trailing_braces(mock_llm_client):
+    """
+    Commentary with braces after the JSON object still parses the first object.
+    """
+    analyzer = ABSAAnalyzer(llm_client=mock_llm_client)
+    
+    json_content = json.dumps({"Overall_Sentiment": "Positive"})
+    mock_llm_client.get_completion.return_value = f"{json_content}\nNote: see {{guidance}} above."
+    
+    result = analyzer.analyze("Some text")
+    
+    assert result.get('Overall_Sentiment') == "Positive"
+    assert not result.get('Error')
+
 def test_empty_input(mock_llm_client):
     analyzer = ABSAAnalyzer(llm_client=mock_llm_client)
     assert analyzer.analyze("") == {}
+
+def test_batch_single_request(mock_llm_client):
+    """
+    Several texts are analyzed with one API call; a mismatched response falls back to per-text calls.
+    """
+    analyzer = ABSAAnalyzer(llm_client=mock_llm_client)
+    
+    mock_llm_client.get_completion.return_value = json.dumps([
+        {"Overall_Sentiment": "Positive"},
+        {"Overall_Sentiment": "Negative"}
+    ])
+    results = analyzer.analyze_batch(["Revenue up.", "Lawsuit filed."])
+    
+    assert mock_llm_client.get_completion.call_count == 1
+    assert [r['Overall_Sentiment'] for r in results] == ["Positive", "Negative"]
+    
+    # Wrong length -> one call per text
+    mock_llm_client.get_completion.reset_mock()
+    mock_llm_client.get_completion.return_value = json.dumps([{"Overall_Sentiment": "Neutral"}])
+    results = analyzer.analyze_batch(["A", "B"])
+    
+    assert mock_llm_client.get_completion.call_count == 3
+    assert len(results) == 2
@@ -80,3 +80,20 @@ def test_calculate_win_rate():
 
     # No trades
     assert calculate_win_rate(pd.Series([], dtype=float)) == 0.0
+
+def test_calculate_metrics_reuses_trade_returns():
+    from unittest.mock import patch
+    from src.analytics.performance import calculate_metrics
+    
+    dates = pd.date_range("2023-01-01", periods=4, freq="D")
+    equity_curve = pd.DataFrame({
+        'equity': [100.0, 110.0, 105.0, 120.0],
+        'position_value': [0.0, 50.0, 50.0, 0.0]
+    }, index=dates)
+    trade_returns = np.array([0.05, -0.01, 0.02])
+    
+    with patch('src.analytics.performance.calculate_round_trip_returns') as mock_rt:
+        metrics = calculate_metrics(equity_curve, [], 100.0, trade_returns=trade_returns)
+        mock_rt.assert_not_called()
+    
+    assert metrics['win_rate'] == pytest.approx(2 / 3)
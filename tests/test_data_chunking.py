@@ -45,3 +45,29 @@ class TestDataChunking:
                 # Verify arguments of the last call
                 args, kwargs = mock_instance.fetch_history.call_args_list[-1]
                 assert args[1] == "2020-01-01"
+
+    def test_chunks_stored_incrementally(self, tmp_path):
+        """
+        Case B: Each chunk is written as it arrives. The volume forward fill carries across chunks,
+        and a date repeated by a later chunk keeps its first version.
+        """
+        chunk_1 = pd.DataFrame({'Open': [1.0, 2.0], 'High': [1.0, 2.0], 'Low': [1.0, 2.0], 'Close': [1.0, 2.0],
+                                'Volume': [100.0, 200.0]}, index=pd.DatetimeIndex(['2004-12-30', '2004-12-31']))
+        chunk_2 = pd.DataFrame({'Open': [9.0, 3.0], 'High': [9.0, 3.0], 'Low': [9.0, 3.0], 'Close': [9.0, 3.0],
+                                'Volume': [float('nan'), float('nan')]}, index=pd.DatetimeIndex(['2004-12-31', '2005-01-03']))
+        
+        with patch('src.data_engine.YFinanceProvider') as MockProvider:
+            MockProvider.return_value.fetch_history.side_effect = [chunk_1, chunk_2]
+            dm = DataManager(db_path=str(tmp_path / "chunks.db"))
+            dm.init_db()
+            
+            with patch.object(settings, 'MAX_CHUNK_YEARS', 5), \
+                 patch.object(dm, 'normalize_ticker', side_effect=lambda t: t):
+                dm.fetch_data("AAPL", start_date="2000-01-01", end_date="2005-01-03")
+            
+            conn = dm.get_connection()
+            rows = conn.execute("SELECT date, close, volume FROM ohlcv WHERE ticker = 'AAPL' ORDER BY date").fetchall()
+            assert conn.execute("SELECT COUNT(*) FROM metadata WHERE ticker = 'AAPL'").fetchone()[0] == 1
+            dm.close_connections()
+        
+        assert rows == [('2004-12-30', 1.0, 100.0), ('2004-12-31', 2.0, 200.0), ('2005-01-03', 3.0, 200.0)]
@@ -7,10 +7,12 @@ from src.config.settings import settings
 class TestDataEngine:
     @pytest.fixture
     def data_manager(self, mock_settings):
-        # Use a temporary DB path from mock_settings
+        # Use a temporary DB path from mock_settings, starting from an empty file
+        mock_settings.DB_PATH.unlink(missing_ok=True)
         dm = DataManager(db_path=str(mock_settings.DB_PATH))
         dm.init_db()
-        return dm
+        yield dm
+        dm.close_connections()
 
     def test_normalize_ticker(self, data_manager):
         """
@@ -83,3 +85,195 @@ class TestDataEngine:
         # Let's check dates.
         
         assert not loaded_df.empty
+
+    def test_save_data_round_trip(self, data_manager):
+        """
+        save_data stores 'YYYY-MM-DD' dates and native values for DatetimeIndex and string-date frames alike.
+        """
+        dates = pd.date_range('2024-01-01', periods=3, freq='D')
+        df = pd.DataFrame({
+            'Open': [1.0, 2.0, 3.0], 'High': [1.5, 2.5, 3.5], 'Low': [0.5, 1.5, 2.5],
+            'Close': [1.2, 2.2, 3.2], 'Volume': np.array([100, 200, 300], dtype=np.int64)
+        }, index=dates)
+        data_manager.save_data(df, "ROUND_TRIP")
+        assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume'] # caller's frame left untouched
+        data_manager.save_data(pd.DataFrame({
+            'date': ['2024-01-04'], 'open': [4.0], 'high': [4.5], 'low': [3.5], 'close': [4.2], 'volume': [400.0]
+        }), "ROUND_TRIP")
+        
+        conn = data_manager.get_connection()
+        rows = conn.execute("SELECT date, open, close, volume FROM ohlcv WHERE ticker = 'ROUND_TRIP' ORDER BY date").fetchall()
+        conn.close()
+        assert rows == [('2024-01-01', 1.0, 1.2, 100.0), ('2024-01-02', 2.0, 2.2, 200.0),
+                        ('2024-01-03', 3.0, 3.2, 300.0), ('2024-01-04', 4.0, 4.2, 400.0)]
+
+    def test_get_data_frame_cache(self, data_manager):
+        """
+        Repeated get_data calls are served from memory until the database changes; callers get their own copy.
+        """
+        from unittest.mock import patch
+        df = pd.DataFrame({'open': [1.0], 'high': [1.0], 'low': [1.0], 'close': [1.0], 'volume': [1.0]},
+                          index=pd.DatetimeIndex(['2024-01-01']))
+        data_manager.save_data(df, "CACHED")
+        first = data_manager.get_data("CACHED")
+        first['close'] = 99.0
+        with patch('pandas.read_sql', side_effect=AssertionError("query")):
+            assert data_manager.get_data("CACHED")['close'].tolist() == [1.0]
+
+        # A write through this DataManager invalidates the cached frame
+        data_manager.save_data(df.set_axis(pd.DatetimeIndex(['2024-01-02'])), "CACHED")
+        assert len(data_manager.get_data("CACHED")) == 2
+
+        # So does a commit from another connection
+        import sqlite3
+        other = sqlite3.connect(data_manager.db_path)
+        other.execute("DELETE FROM ohlcv WHERE ticker = 'CACHED' AND date = '2024-01-02'")
+        other.commit()
+        other.close()
+        assert len(data_manager.get_data("CACHED")) == 1
+
+    def test_lazy_news_engine_reused(self, data_manager):
+        """
+        get_data(include_sentiment=True) builds the fallback NewsEngine once and reuses it.
+        """
+        from unittest.mock import patch
+        df = pd.DataFrame({'open': [1.0], 'high': [1.0], 'low': [1.0], 'close': [1.0], 'volume': [1.0]},
+                          index=pd.DatetimeIndex(['2024-01-01']))
+        data_manager.save_data(df, "SENTI")
+        with patch('src.data_engine.NewsEngine') as mock_engine_cls:
+            mock_engine_cls.return_value.get_sentiment.return_value = pd.Series(
+                [0.5], index=pd.DatetimeIndex(['2024-01-01'], name='date'), name='sentiment')
+            for _ in range(3):
+                loaded = data_manager.get_data("SENTI", include_sentiment=True)
+        assert mock_engine_cls.call_count == 1
+        assert loaded['sentiment'].tolist() == [0.5]
+
+    def test_connection_pragmas(self, data_manager):
+        """
+        Every connection carries the WAL, page cache and temp_store settings (not only the one init_db used).
+        """
+        conn = data_manager.get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2 # MEMORY
+        conn.close()
+
+    def test_ohlcv_without_rowid_migration(self, data_manager):
+        """
+        ohlcv is clustered on (ticker, date); an old rowid-layout table is rebuilt by init_db with its rows kept.
+        """
+        conn = data_manager.get_connection()
+        conn.execute("DROP TABLE ohlcv")
+        conn.execute("CREATE TABLE ohlcv (ticker TEXT, date TEXT, open REAL, high REAL, low REAL, close REAL, volume REAL, PRIMARY KEY (ticker, date))")
+        conn.execute("CREATE INDEX idx_ohlcv_ticker_date ON ohlcv (ticker, date)")
+        conn.executemany("INSERT INTO ohlcv VALUES (?, ?, 1.0, 1.0, 1.0, 1.0, 1.0)", [("OLD", "2024-01-02"), ("OLD", "2024-01-01")])
+        conn.commit()
+
+        data_manager.init_db()
+
+        schema = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='ohlcv'").fetchone()[0]
+        assert 'WITHOUT ROWID' in schema
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name='idx_ohlcv_ticker_date'").fetchone() is None
+        assert list(data_manager.get_data("OLD").index.strftime('%Y-%m-%d')) == ["2024-01-01", "2024-01-02"]
+
+        plan = " ".join(str(r[-1]) for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM ohlcv WHERE ticker=? AND date >= ? AND date <= ? ORDER BY date ASC",
+            ("OLD", "1900-01-01", "2099-12-31")))
+        assert "PRIMARY KEY" in plan and "TEMP B-TREE" not in plan
+
+    def test_connection_reused_and_released(self, data_manager):
+        """
+        Methods reuse the thread's connection instead of reconnecting; a failed operation leaves no open
+        transaction behind, and close_connections forces a fresh connection.
+        """
+        import sqlite3
+        conn = data_manager.get_connection()
+        df = pd.DataFrame({'open': [1.0], 'high': [1.0], 'low': [1.0], 'close': [1.0], 'volume': [1.0]},
+                          index=pd.DatetimeIndex(['2024-01-01']))
+        data_manager.save_data(df, "POOLED")
+        assert len(data_manager.get_data("POOLED")) == 1
+        assert data_manager.get_connection() is conn
+        
+        with pytest.raises(ValueError):
+            with data_manager._connection() as pooled:
+                pooled.execute("DELETE FROM ohlcv WHERE ticker = 'POOLED'")
+                raise ValueError("boom")
+        assert not conn.in_transaction
+        assert len(data_manager.get_data("POOLED")) == 1
+        
+        data_manager.close_connections()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert data_manager.get_connection() is not conn
+
+    def test_update_all_smart_start_single_query(self, data_manager):
+        """
+        The watchlist's smart start dates come from one metadata JOIN, not one query per symbol.
+        """
+        from datetime import datetime, timedelta
+        from unittest.mock import patch
+        today = datetime.now()
+        conn = data_manager.get_connection()
+        conn.executemany("INSERT INTO tracked_symbols (symbol) VALUES (?)", [("AAPL",), ("NVDA",), ("MSFT",)])
+        conn.executemany("INSERT INTO metadata (ticker, last_updated) VALUES (?, ?)", [
+            ("AAPL", (today - timedelta(days=2)).strftime('%Y-%m-%d')), ("NVDA", today.strftime('%Y-%m-%d'))
+        ])
+        conn.commit()
+        
+        with patch.object(data_manager, '_calc_smart_start', side_effect=AssertionError("per-symbol query")), \
+             patch.object(data_manager, 'update_data_if_needed') as mock_update:
+            data_manager.update_all_tracked_symbols(update_mode="INCREMENTAL")
+        
+        starts = {c.args[0]: c.kwargs['start_date'] for c in mock_update.call_args_list}
+        assert starts == {"AAPL": (today - timedelta(days=1)).strftime('%Y-%m-%d'), "MSFT": settings.DEFAULT_START_DATE}
+
+    def test_update_all_memoizes_metadata(self, data_manager):
+        """
+        During update_all_tracked_symbols, update_data_if_needed's _calc_smart_start is answered from the
+        watchlist metadata already loaded, which is passed down per run rather than kept on the instance.
+        """
+        from unittest.mock import patch
+        conn = data_manager.get_connection()
+        conn.executemany("INSERT INTO tracked_symbols (symbol) VALUES (?)", [("AAPL",), ("MSFT",)])
+        conn.execute("INSERT INTO metadata (ticker, last_updated) VALUES ('AAPL', '2024-01-01')")
+        conn.commit()
+        watchlist = data_manager.get_watchlist()
+        last_updated = data_manager._last_updated_by_symbol()
+
+        seen = {}
+        def fake_fetch(ticker, start_date=None, **kwargs):
+            seen[ticker] = start_date
+        # Only the two watchlist-wide reads may touch the database
+        with patch.object(data_manager, 'get_watchlist', return_value=watchlist), \
+             patch.object(data_manager, '_last_updated_by_symbol', return_value=last_updated), \
+             patch.object(data_manager, 'fetch_data', side_effect=fake_fetch), \
+             patch.object(data_manager, '_connection', side_effect=AssertionError("per-symbol query")):
+            data_manager.update_all_tracked_symbols(update_mode="INCREMENTAL", start_date="2023-06-01")
+
+        assert seen == {"AAPL": "2024-01-02", "MSFT": "2023-06-01"}
+
+    def test_update_all_runs_tickers_concurrently(self, data_manager):
+        """
+        Watchlist tickers are updated in parallel (settings.DATA_UPDATE_WORKERS) and progress reaches 1.0.
+        """
+        import threading
+        from unittest.mock import patch
+        symbols = ["AAPL", "NVDA", "MSFT"]
+        conn = data_manager.get_connection()
+        conn.executemany("INSERT INTO tracked_symbols (symbol) VALUES (?)", [(s,) for s in symbols])
+        conn.commit()
+        
+        # Every worker must be inside update_data_if_needed at the same time to pass the barrier
+        barrier = threading.Barrier(len(symbols), timeout=10)
+        passed = []
+        def fake_update(symbol, **kwargs):
+            barrier.wait()
+            passed.append(symbol)
+        
+        progress = []
+        with patch.object(settings, 'DATA_UPDATE_WORKERS', len(symbols)), \
+             patch.object(data_manager, 'update_data_if_needed', side_effect=fake_update):
+            data_manager.update_all_tracked_symbols(progress_callback=lambda p, msg: progress.append(p), start_date="2024-01-01")
+        
+        assert sorted(passed) == sorted(symbols)
+        assert progress[-1] == 1.0 and len(progress) == len(symbols)
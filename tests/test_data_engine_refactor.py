@@ -38,3 +38,18 @@ def test_sanitization_usage(data_manager):
     
     # " ' btc ' " -> "BTC-USD" (Crypto)
     assert data_manager.normalize_ticker("' btc '") == "BTC-USD"
+
+def test_market_rules_compiled_once(data_manager):
+    """
+    MARKET_CONFIG patterns are compiled once per config object and rebuilt when the config is replaced.
+    """
+    from src.data_engine import _market_rules
+    rules = _market_rules(settings.MARKET_CONFIG)
+    assert _market_rules(settings.MARKET_CONFIG) is rules
+    assert rules[1]['BTC'][1] == "BTC-USD"
+
+    mock_config = {name: dict(cfg) for name, cfg in settings.MARKET_CONFIG.items()}
+    mock_config['CRYPTO']['known'] = {'TESTCOIN'}
+    with patch.object(settings, 'MARKET_CONFIG', mock_config):
+        assert data_manager.normalize_ticker("TESTCOIN") == "TESTCOIN-USD"
+        assert _market_rules(settings.MARKET_CONFIG) is not rules
@@ -21,6 +21,7 @@ def temp_db():
     
     yield manager
     
+    manager.close_connections()
     if os.path.exists(db_path):
         try:
             os.remove(db_path)
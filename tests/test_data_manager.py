@@ -12,6 +12,7 @@ class TestBatchUpdate(unittest.TestCase):
         self.dm.init_db()
         
     def tearDown(self):
+        self.dm.close_connections()
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
 
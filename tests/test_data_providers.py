@@ -103,5 +103,18 @@ class TestDataProviders(unittest.TestCase):
             # Verify Stooq NOT called
             mock_stooq_instance.fetch_history.assert_not_called()
 
+    @patch('src.data_loader.providers.stooq_provider.web.DataReader')
+    def test_providers_share_http_session(self, mock_datareader):
+        """DataManager hands one keep-alive session to the Stooq and CCXT providers."""
+        mock_datareader.return_value = pd.DataFrame({
+            'Open': [1.0], 'High': [1.0], 'Low': [1.0], 'Close': [1.0], 'Volume': [1.0]
+        }, index=pd.to_datetime(['2023-01-02']))
+
+        dm = DataManager(db_path=":memory:")
+        dm.stooq_provider.fetch_history('AAPL', '2023-01-01', '2023-01-02')
+
+        self.assertIs(mock_datareader.call_args.kwargs['session'], dm._http_session)
+        self.assertIs(dm.ccxt_provider.exchange.session, dm._http_session)
+
 if __name__ == '__main__':
     unittest.main()
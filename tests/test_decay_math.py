@@ -101,3 +101,49 @@ class TestDecayMath:
         last_val = result.iloc[-1]
         assert abs(last_val - 0.5) < 0.05, f"Score drifted from 0.5! Got {last_val}"
 
+
+    def test_datetime64_array_input(self):
+        """
+        Case 5: A plain datetime64 array (sparse news dates) gives the same result as a DatetimeIndex.
+        """
+        dates = pd.DatetimeIndex(['2023-01-01', '2023-01-04', '2023-01-10']).as_unit('ns')
+        raw_scores = {dates[0]: 0.8, dates[1]: -0.4, dates[2]: 0.2}
+        
+        model = DecayModel(half_life_days=5.0)
+        expected = model.apply_decay(dates, raw_scores)
+        result = model.apply_decay(dates.to_numpy(dtype='datetime64[ns]'), raw_scores)
+        
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_numba_kernel_matches_pandas_ewm(self):
+        """
+        Case 6: The compiled decay kernel matches the pandas times-based EWM fallback on uneven date gaps.
+        """
+        from unittest.mock import patch
+        from src.config.settings import settings
+        
+        rng = np.random.default_rng(0)
+        dates = pd.DatetimeIndex(['2023-01-02', '2023-01-03', '2023-01-06', '2023-01-20', '2023-01-21', '2023-02-15'])
+        raw_scores = {d: s for d, s in zip(dates[::2], rng.uniform(-1.5, 1.5, 3))}
+        
+        model = DecayModel(half_life_days=3.0)
+        result = model.apply_decay(dates, raw_scores)
+        with patch.object(settings, 'SENTIMENT_NUMBA_DECAY', False):
+            expected = model.apply_decay(dates, raw_scores)
+        
+        pd.testing.assert_series_equal(result, expected, rtol=1e-12)
+
+    def test_alignment_skips_out_of_range_dates(self):
+        """
+        Case 7: News dates outside the target range are ignored; a repeated target date gets the same raw score.
+        """
+        dates = pd.date_range(start='2023-01-01', periods=4, freq='D')
+        raw_scores = {pd.Timestamp('2022-12-31'): 1.0, dates[1]: 0.6, pd.Timestamp('2023-02-01'): -1.0}
+        
+        model = DecayModel(half_life_days=5.0)
+        result = model.apply_decay(dates, raw_scores)
+        assert result.iloc[0] == 0.0
+        assert result.iloc[1] > 0.0
+        
+        repeated = model.apply_decay(dates.insert(2, dates[1]), raw_scores)
+        assert repeated.iloc[1] == result.iloc[1]
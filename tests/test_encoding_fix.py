@@ -13,7 +13,7 @@ class TestEncodingFix(unittest.TestCase):
     def setUp(self):
         self.fetcher = NewsFetcher()
 
-    @patch('src.data.news_fetcher.requests.get')
+    @patch('src.data.news_fetcher.requests.Session.get')
     def test_fetch_headlines_big5_encoding(self, mock_get):
         """
         Test that Big5 encoded content (common in Taiwan legacy sites) 
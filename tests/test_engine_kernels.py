@@ -0,0 +1,149 @@
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from src.backtest_engine import BacktestEngine
+
+def _random_market(n=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2000-01-01", periods=n, freq="D")
+    base = np.abs(100 + np.cumsum(rng.normal(0, 1, n))) + 1
+    data = pd.DataFrame({
+        "open": base * (1 + rng.normal(0, 0.01, n)),
+        "high": base,
+        "low": base,
+        "close": base,
+        "volume": [1000.0] * n
+    }, index=dates)
+    # Mix of full, fractional and ghost (< 0.01) signals
+    signals = pd.Series(rng.choice([0, 0, 0, 1, -1, 0.5, 0.005], size=n), index=dates)
+    return data, signals
+
+def _run(data, signals, use_kernel, long_only, method, target):
+    engine = BacktestEngine(initial_capital=10000, long_only=long_only, min_commission=1.0)
+    if method == "fixed_amount":
+        engine.set_position_sizing(method, amount=target)
+    else:
+        engine.set_position_sizing(method, target=target)
+    
+    if use_kernel:
+        engine.run(data, signals)
+    else:
+        with patch('src.backtest_engine._KERNEL_AVAILABLE', False):
+            engine.run(data, signals)
+    return engine
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("long_only", [False, True])
+@pytest.mark.parametrize("method,target", [("fixed_percent", 0.95), ("fixed_amount", 5000.0)])
+def test_kernel_matches_event_loop(seed, long_only, method, target):
+    """
+    The compiled kernel must reproduce the pure-Python event loop exactly (trades, equity, final state).
+    """
+    data, signals = _random_market(seed=seed)
+    
+    fast = _run(data, signals, True, long_only, method, target)
+    slow = _run(data, signals, False, long_only, method, target)
+    
+    assert len(fast.trades) == len(slow.trades)
+    assert fast.trades == slow.trades
+    pd.testing.assert_frame_equal(fast.equity_curve, slow.equity_curve)
+    assert fast.current_capital == slow.current_capital
+    assert fast.position == slow.position
+
+@pytest.mark.parametrize("long_only", [False, True])
+def test_kernel_matches_event_loop_discrete_signals(long_only):
+    """
+    Discrete signals take the float32 signal path in the kernel; results must still match exactly.
+    """
+    data, signals = _random_market(seed=3)
+    signals = signals.replace(0.005, 0.25)
+    
+    fast = _run(data, signals, True, long_only, "fixed_percent", 0.95)
+    slow = _run(data, signals, False, long_only, "fixed_percent", 0.95)
+    
+    assert fast.trades == slow.trades
+    pd.testing.assert_frame_equal(fast.equity_curve, slow.equity_curve)
+    assert fast.current_capital == slow.current_capital
+
+def test_date_window_matches_presliced_data():
+    """
+    start_date/end_date slicing must match running on pre-sliced data (signals keep their T+1 shift).
+    """
+    data, signals = _random_market(seed=4)
+    
+    windowed = BacktestEngine(initial_capital=10000)
+    windowed.run(data, signals, start_date="2001-03-01", end_date="2002-06-30")
+    
+    presliced = BacktestEngine(initial_capital=10000)
+    presliced.run(data.loc["2001-03-01":"2002-06-30"], signals)
+    
+    assert windowed.equity_curve['date'].iloc[0] == pd.Timestamp("2001-03-01")
+    assert windowed.equity_curve['date'].iloc[-1] == pd.Timestamp("2002-06-30")
+    assert windowed.trades == presliced.trades
+    pd.testing.assert_frame_equal(windowed.equity_curve, presliced.equity_curve)
+
+@pytest.mark.parametrize("long_only", [False, True])
+@pytest.mark.parametrize("method,target", [("fixed_percent", 0.95), ("fixed_amount", 5000.0)])
+def test_cython_kernel_matches_event_loop(long_only, method, target):
+    """
+    The optional Cython build of the kernel must reproduce the event loop exactly as well.
+    """
+    cy = pytest.importorskip("src.backtest._engine_kernels")
+    data, signals = _random_market(seed=6)
+    
+    with patch('src.backtest_engine.run_loop_fixed_percent', cy.run_loop_fixed_percent), \
+         patch('src.backtest_engine.run_loop_fixed_amount', cy.run_loop_fixed_amount), \
+         patch('src.backtest_engine._KERNEL_AVAILABLE', True):
+        fast = _run(data, signals, True, long_only, method, target)
+    slow = _run(data, signals, False, long_only, method, target)
+    
+    assert fast.trades == slow.trades
+    pd.testing.assert_frame_equal(fast.equity_curve, slow.equity_curve)
+    assert fast.current_capital == slow.current_capital
+    assert fast.position == slow.position
+
+def test_run_batch_matches_sequential_runs():
+    """
+    Parallel multi-instrument runs must give the same per-symbol results as individual engines.
+    """
+    data_dict, signals_dict = {}, {}
+    for seed, symbol in enumerate(["AAA", "BBB", "CCC"]):
+        data_dict[symbol], signals_dict[symbol] = _random_market(n=300, seed=seed)
+    
+    results = BacktestEngine.run_batch(
+        data_dict, signals_dict,
+        engine_kwargs={"initial_capital": 10000},
+        sizing={"method": "fixed_percent", "target": 0.5},
+        max_workers=2
+    )
+    
+    assert set(results) == set(data_dict)
+    for symbol in data_dict:
+        engine = BacktestEngine(initial_capital=10000)
+        engine.set_position_sizing("fixed_percent", target=0.5)
+        engine.run(data_dict[symbol], signals_dict[symbol])
+        
+        assert results[symbol]['trades'] == engine.trades
+        pd.testing.assert_frame_equal(results[symbol]['equity_curve'], engine.equity_curve)
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_trade_log_matches_trades(use_kernel):
+    """
+    The packed trade log and the materialized Trade records must describe the same fills.
+    """
+    data, signals = _random_market(seed=5)
+    engine = _run(data, signals, use_kernel, False, "fixed_percent", 0.95)
+    log = engine.trade_log
+    
+    assert len(log) == len(engine.trades) > 0
+    assert log.dtype.names == ('entry_date', 'entry_price', 'quantity', 'type', 'entry_equity', 'commission')
+    for rec, trade in zip(log, engine.trades):
+        assert rec['entry_date'] == trade.entry_date
+        assert rec['entry_price'] == trade.entry_price
+        assert rec['quantity'] == trade.quantity
+        assert ("BUY", "SELL")[rec['type']] == trade.type
+    
+    # A rerun resets the log
+    engine.run(data.iloc[:0], signals)
+    assert len(engine.trade_log) == 0 and engine.trades == []
@@ -65,3 +65,36 @@ def test_finbert_empty_input(mock_finbert_setup):
     analyzer = FinBERTAnalyzer()
     results = analyzer.predict([])
     assert results == []
+
+def test_finbert_onnx_backend(mock_finbert_setup, tmp_path):
+    """
+    With an ONNX model path on CPU, inference runs through the ONNX Runtime session (no PyTorch model loaded).
+    """
+    mock_tokenizer, mock_model = mock_finbert_setup
+    mock_tokenizer.from_pretrained.return_value.return_value = {
+        'input_ids': np.array([[101, 7, 102], [101, 8, 102]]),
+        'token_type_ids': np.zeros((2, 3), dtype=np.int64),
+        'attention_mask': np.ones((2, 3), dtype=np.int64),
+    }
+    onnx_file = tmp_path / "model.int8.onnx"
+    onnx_file.write_bytes(b"")
+    
+    mock_ort = MagicMock()
+    session = mock_ort.InferenceSession.return_value
+    session.get_inputs.return_value = [MagicMock(), MagicMock()]
+    session.get_inputs.return_value[0].name = 'input_ids'
+    session.get_inputs.return_value[1].name = 'attention_mask'
+    session.run.return_value = [np.array([[0.0, 10.0, 0.0], [0.0, 0.0, 10.0]], dtype=np.float32)]
+    
+    with patch('src.analytics.sentiment.finbert_analyzer.ONNXRUNTIME_AVAILABLE', True), \
+         patch('src.analytics.sentiment.finbert_analyzer.ort', mock_ort, create=True):
+        analyzer = FinBERTAnalyzer(device="cpu", onnx_path=str(onnx_file))
+        results = analyzer.predict(["Stocks are soaring!", "Stocks are crashing!"])
+    
+    mock_model.from_pretrained.assert_not_called()
+    feed = session.run.call_args[0][1]
+    assert set(feed) == {'input_ids', 'attention_mask'}
+    assert feed['input_ids'].dtype == np.int64
+    assert results[0]['Positive'] > 0.99
+    assert results[1]['Negative'] > 0.99
+    assert abs(sum(results[0].values()) - 1.0) < 1e-6
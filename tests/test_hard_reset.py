@@ -58,6 +58,7 @@ class TestHardReset(unittest.TestCase):
 
     def tearDown(self):
         # Cleanup
+        self.dm.close_connections()
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
         if os.path.exists(self.test_cache_dir):
@@ -325,5 +325,35 @@ class TestNewsFetcher(unittest.TestCase):
         # One of the similar ones should be present
         self.assertTrue('TSMC revenue jumps 10%' in titles or 'TSMC revenue surges 10%' in titles)
 
+    def test_lsh_dedup_matches_pairwise(self):
+        """Case M: LSH candidate dedup keeps the same titles as pairwise difflib, with or without rapidfuzz"""
+        from src.data import text_dedup
+        backends = [False, True] if text_dedup.RAPIDFUZZ_AVAILABLE else [False]
+        for rapidfuzz in backends:
+            with self.subTest(rapidfuzz=rapidfuzz), \
+                 patch.object(text_dedup, 'RAPIDFUZZ_AVAILABLE', rapidfuzz):
+                self._check_lsh_dedup_matches_pairwise()
+
+    def _check_lsh_dedup_matches_pairwise(self):
+        import difflib
+        import random
+        import string
+        rng = random.Random(0)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(300)]
+        titles = []
+        for _ in range(120):
+            w = rng.choices(words, k=rng.randint(5, 10))
+            titles.append(" ".join(w))
+            w[rng.randrange(len(w))] = rng.choice(words) # near-duplicate
+            titles.append(" ".join(w))
+        
+        expected = []
+        for t in titles:
+            if not any(difflib.SequenceMatcher(None, t, s).ratio() > 0.7 for s in expected):
+                expected.append(t)
+        
+        kept = self.fetcher._filter_noise([{'title': t} for t in titles], 'US')
+        self.assertEqual([e['title'] for e in kept], expected)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,13 @@
 import pytest
+import feedparser
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 from src.data.news_fetcher import NewsFetcher
 from src.config.settings import settings
 
 class TestNewsFetcherFixes:
     
-    @patch('src.data.news_fetcher.requests.get')
+    @patch('src.data.news_fetcher.requests.Session.get')
     def test_fetch_headlines_tw_encoding_fix(self, mock_get):
         """
         Test that TW headlines force Big5 encoding if not UTF-8.
@@ -34,7 +36,7 @@ class TestNewsFetcherFixes:
         # Check if the code attempted to fix encoding
         assert mock_response.encoding == 'big5', "Should verify TW encoding is forced to Big5 when default is ISO-8859-1"
         
-    @patch('src.data.news_fetcher.requests.get')
+    @patch('src.data.news_fetcher.requests.Session.get')
     def test_fetch_headlines_crypto_limit(self, mock_get):
         """
         Test that Crypto market overrides limit to 30.
@@ -100,5 +102,153 @@ class TestNewsFetcherFixes:
         headlines_us = fetcher.fetch_headlines("AAPL", "Apple", market="US")
         assert len(headlines_us) == 10, f"Expected 10 headlines for US, got {len(headlines_us)}"
 
+    def test_fetch_headlines_many_maps_each_ticker(self):
+        fetcher = NewsFetcher()
+        calls = []
+        
+        async def fake_fetch(ticker, name=None, market='US', session=None):
+            calls.append((ticker, name, market))
+            return [] if ticker == 'FAIL' else [{'title': f"{ticker} {market}"}]
+        
+        with patch.object(fetcher, 'fetch_headlines_async', side_effect=fake_fetch):
+            result = fetcher.fetch_headlines_many([('AAPL', 'Apple', 'US'), ('2330.TW', None, 'TW'), ('FAIL', None, 'US')])
+        
+        assert result == {'AAPL': [{'title': 'AAPL US'}], '2330.TW': [{'title': '2330.TW TW'}], 'FAIL': []}
+        assert sorted(calls) == sorted([('AAPL', 'Apple', 'US'), ('2330.TW', None, 'TW'), ('FAIL', None, 'US')])
+        assert fetcher.fetch_headlines_many([]) == {}
+
+    @patch('src.data.news_fetcher.requests.Session.get')
+    def test_expired_cache_revalidates_with_etag(self, mock_get):
+        """
+        After the TTL cache expires, a 304 for the stored ETag reuses the last headlines without re-parsing.
+        """
+        pub = datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        ok = MagicMock(status_code=200, encoding='utf-8', headers={'ETag': '"v1"', 'Last-Modified': pub})
+        ok.text = f"<rss><channel><item><title>Apple beats earnings</title><link>http://example.com/1</link><pubDate>{pub}</pubDate></item></channel></rss>"
+        not_modified = MagicMock(status_code=304, encoding=None, headers={})
+        mock_get.side_effect = [ok, not_modified]
+        
+        fetcher = NewsFetcher()
+        mock_parse = MagicMock(wraps=fetcher._parse_feed)
+        fetcher._parse_feed = mock_parse
+        first = fetcher.fetch_headlines("AAPL", market="US")
+        assert [h['title'] for h in first] == ['Apple beats earnings']
+        assert mock_get.call_args.kwargs['headers'] == {}
+        
+        fetcher._cache.clear() # TTL expired
+        second = fetcher.fetch_headlines("AAPL", market="US")
+        
+        assert second == first
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"', 'If-Modified-Since': pub}
+        assert mock_parse.call_count == 1
+
+    def test_parse_feed_matches_feedparser(self):
+        """
+        The streaming lxml parser yields the same title/link/summary/published as feedparser, capped at 100 items.
+        """
+        item = ("<item><title>TSMC &amp; Apple {i}</title><link>http://example.com/{i}</link>"
+                "<description>&lt;a href=\"http://example.com/{i}\"&gt;TSMC&lt;/a&gt;&amp;nbsp;Reuters</description>"
+                "<pubDate>Fri, 06 Dec 2025 10:00:00 GMT</pubDate></item>")
+        text = "<?xml version='1.0' encoding='UTF-8'?><rss><channel><title>Feed</title>" + "".join(item.format(i=i) for i in range(120)) + "</channel></rss>"
+        
+        fetcher = NewsFetcher()
+        entries = fetcher._parse_feed(text)
+        expected = feedparser.parse(text).entries[:100]
+        
+        assert len(entries) == 100
+        for got, ref in zip(entries, expected):
+            assert got['title'] == ref['title']
+            assert got['link'] == ref['link']
+            assert got['published'] == ref['published']
+            assert fetcher._clean_html(got['summary']) == fetcher._clean_html(ref['summary'])
+        
+        # Not RSS 2.0 (Atom): feedparser fallback
+        atom = "<feed xmlns='http://www.w3.org/2005/Atom'><entry><title>Atom story</title></entry></feed>"
+        assert [e['title'] for e in fetcher._parse_feed(atom)] == ['Atom story']
+
+    def test_fetch_headlines_async_matches_sync(self):
+        """
+        The aiohttp fan-out returns the same headlines as fetch_headlines and revalidates with the stored ETag.
+        """
+        import asyncio
+        import threading
+        from aiohttp import web
+        
+        pub = datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        body = (f"<rss><channel><item><title>Apple beats earnings</title><link>http://example.com/1</link><pubDate>{pub}</pubDate></item>"
+                f"<item><title>Tesla recalls cars</title><link>http://example.com/2</link><pubDate>{pub}</pubDate></item></channel></rss>")
+        seen_headers = []
+        
+        async def handler(request):
+            seen_headers.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return web.Response(status=304)
+            return web.Response(body=body.encode('utf-8'), content_type='application/rss+xml', charset='utf-8', headers={'ETag': '"v1"'})
+        
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_get('/rss', handler)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{port}/rss"
+            expected = NewsFetcher()
+            with patch.object(expected, '_build_query', return_value=url):
+                sync_headlines = expected.fetch_headlines("AAPL", market="US")
+            
+            fetcher = NewsFetcher()
+            with patch.object(fetcher, '_build_query', return_value=url):
+                result = fetcher.fetch_headlines_many([('AAPL', None, 'US'), ('TSLA', None, 'US')])
+                assert result['AAPL'] == sync_headlines
+                assert [h['title'] for h in result['TSLA']] == ['Apple beats earnings', 'Tesla recalls cars']
+                
+                fetcher._cache.clear() # TTL expired
+                assert fetcher.fetch_headlines_many([('AAPL', None, 'US')]) == {'AAPL': sync_headlines}
+            assert seen_headers[-1] == '"v1"'
+        finally:
+            asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result(timeout=10)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=10)
+
+    def test_clean_html_fast_path(self):
+        fetcher = NewsFetcher()
+        raw = '<a href="https://example.com">TSMC &amp; Apple</a>&nbsp;&nbsp;<font color="#6f6f6f">Reuters</font>'
+        assert fetcher._clean_html(raw) == 'TSMC & Apple Reuters'
+        assert fetcher._clean_html('') == ''
+        # script/style bodies are dropped (BeautifulSoup path)
+        assert fetcher._clean_html('<p>Up</p><script>var x = 1;</script><style>p {}</style> 5%') == 'Up 5%'
+
+    @patch('src.data.news_fetcher.requests.Session.get')
+    def test_disk_cache_warm_start_and_revalidation(self, mock_get, tmp_path):
+        """
+        A new fetcher (e.g. after a restart) reuses a fresh feed from the disk cache without a request,
+        and revalidates an expired one with the stored ETag.
+        """
+        from src.ai.response_cache import ResponseCache
+        disk = ResponseCache(tmp_path / "news.db")
+        
+        pub = datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        ok = MagicMock(status_code=200, encoding='utf-8', headers={'ETag': '"v1"'})
+        ok.text = f"<rss><channel><item><title>Apple beats earnings</title><link>http://example.com/1</link><pubDate>{pub}</pubDate></item></channel></rss>"
+        mock_get.side_effect = [ok, MagicMock(status_code=304, encoding=None, headers={})]
+        
+        first = NewsFetcher(disk_cache=disk).fetch_headlines("AAPL", market="US")
+        assert mock_get.call_count == 1
+        
+        # Restart within the TTL: no request at all
+        assert NewsFetcher(disk_cache=disk).fetch_headlines("AAPL", market="US") == first
+        assert mock_get.call_count == 1
+        
+        # Restart after the TTL: conditional GET, 304 reuses the stored headlines
+        with patch('src.data.news_fetcher.time.time', return_value=datetime.now().timestamp() + 600):
+            assert NewsFetcher(disk_cache=disk).fetch_headlines("AAPL", market="US") == first
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -44,6 +44,7 @@ class TestPerformanceV2(unittest.TestCase):
         conn1 = dm.get_connection()
         conn2 = dm.get_connection()
         self.assertEqual(id(conn1), id(conn2), "Same thread should reuse connection")
+        dm.close_connections()
 
     def test_backtest_performance(self):
         """
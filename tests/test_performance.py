@@ -24,7 +24,7 @@ class TestPerformance(unittest.TestCase):
 
     def tearDown(self):
         if hasattr(self, 'dm'):
-            self.dm.get_connection().close()
+            self.dm.close_connections()
         if os.path.exists(self.test_db_path):
             try:
                 os.remove(self.test_db_path)
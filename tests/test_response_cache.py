@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from src.ai.response_cache import ResponseCache
+from src.ai.translator import TextTranslator
+from src.data.sentiment_processor import SentimentAnalyzer
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "llm_cache.db")
+
+def test_cache_roundtrip(cache):
+    key = ResponseCache.make_key("translation", "營收創新高")
+    assert key == ResponseCache.make_key("translation", "營收創新高")
+    assert key != ResponseCache.make_key("sentiment", "營收創新高")
+    
+    assert cache.get_many([key]) == {}
+    cache.set_many({key: "Revenue hits record high"})
+    assert cache.get_many([key, "missing"]) == {key: "Revenue hits record high"}
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "llm_cache.db", max_entries=2)
+    cache.set_many({"a": 1})
+    cache.set_many({"b": 2})
+    assert cache.get_many(["a"]) == {"a": 1} # "a" is now more recent than "b"
+    cache.set_many({"c": 3})
+    
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+def test_translator_sends_only_misses(cache):
+    llm = MagicMock()
+    translator = TextTranslator(llm_client=llm, cache=cache)
+    
+    llm.generate_strategy_code.return_value = "Revenue hits record high"
+    assert translator.translate_batch(["營收創新高"]) == ["Revenue hits record high"]
+    
+    llm.generate_strategy_code.return_value = "Foreign investors bought over TSMC"
+    results = translator.translate_batch(["外資買超台積電", "營收創新高"])
+    
+    assert results == ["Foreign investors bought over TSMC", "Revenue hits record high"]
+    prompt = llm.generate_strategy_code.call_args[0][0]
+    assert "外資買超台積電" in prompt and "營收創新高" not in prompt
+
+def test_translator_failures_not_cached(cache):
+    llm = MagicMock()
+    translator = TextTranslator(llm_client=llm, cache=cache)
+    
+    llm.generate_strategy_code.side_effect = Exception("API down")
+    assert translator.translate_batch(["營收創新高"]) == ["營收創新高"]
+    
+    llm.generate_strategy_code.side_effect = None
+    llm.generate_strategy_code.return_value = "Revenue hits record high"
+    assert translator.translate_batch(["營收創新高"]) == ["Revenue hits record high"]
+
+def test_sentiment_scores_cached_per_day(cache):
+    with patch('src.data.sentiment_processor.FinBERTAnalyzer') as mock_finbert_cls, \
+         patch('src.data.sentiment_processor.ABSAAnalyzer'):
+        mock_finbert = mock_finbert_cls.return_value
+        mock_finbert.predict.return_value = [{'Neutral': 0.5, 'Positive': 0.4, 'Negative': 0.1}]
+        
+        analyzer = SentimentAnalyzer(cache=cache)
+        news = [{'title': 'Soft News', 'summary': 'Margins steady'}]
+        first = analyzer.analyze_news_batched({'d1': news}, "AAPL")
+        again = analyzer.analyze_news_batched({'d2': list(news)}, "AAPL")
+        other_ticker = analyzer.analyze_news_batched({'d1': news}, "MSFT")
+    
+    assert first['d1'] == pytest.approx(0.6 * 0.3)
+    assert again['d2'] == first['d1']
+    # Same news for the same ticker is scored once
+    assert mock_finbert.predict.call_count == 2
+    assert other_ticker['d1'] == first['d1']
+
+def test_sentiment_cache_key_tracks_scoring_settings(cache, monkeypatch):
+    from src.config.settings import settings
+    with patch('src.data.sentiment_processor.FinBERTAnalyzer') as mock_finbert_cls, \
+         patch('src.data.sentiment_processor.ABSAAnalyzer'):
+        mock_finbert = mock_finbert_cls.return_value
+        mock_finbert.predict.return_value = [{'Neutral': 0.5, 'Positive': 0.4, 'Negative': 0.1}]
+        
+        analyzer = SentimentAnalyzer(cache=cache)
+        news = [{'title': 'Soft News', 'summary': 'Margins steady'}]
+        analyzer.analyze_news(news, "AAPL")
+        monkeypatch.setattr(settings, "SENTIMENT_FILTER_THRESHOLD", settings.SENTIMENT_FILTER_THRESHOLD + 0.1)
+        analyzer.analyze_news(news, "AAPL")
+    
+    # A threshold change invalidates the cached score
+    assert mock_finbert.predict.call_count == 2
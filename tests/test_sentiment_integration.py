@@ -71,3 +71,113 @@ def test_integration_all_noise(mock_pipeline):
     # ABSA should NOT be called
     mock_absa.analyze_batch.assert_not_called()
     assert score == 0.0
+
+def test_integration_batched_across_dates(mock_pipeline):
+    mock_finbert, mock_absa = mock_pipeline
+    
+    # Day 1: strong positive (goes to ABSA) + noise; Day 2: weak negative (FinBERT only)
+    mock_finbert.predict.return_value = [
+        {'Neutral': 0.1, 'Positive': 0.8, 'Negative': 0.1},
+        {'Neutral': 0.9, 'Positive': 0.05, 'Negative': 0.05},
+        {'Neutral': 0.5, 'Positive': 0.1, 'Negative': 0.4}
+    ]
+    
+    analyzer = SentimentAnalyzer()
+    scores = analyzer.analyze_news_batched({
+        'd1': [{'title': 'Good News', 'summary': 'Profits up'}, {'title': 'Boring News', 'summary': 'Nothing happened'}],
+        'd2': [{'title': 'Soft News', 'summary': 'Margins dip'}],
+        'd3': []
+    }, "AAPL")
+    
+    # One FinBERT pass and one ABSA batch for all dates
+    assert mock_finbert.predict.call_count == 1
+    assert len(mock_finbert.predict.call_args[0][0]) == 3
+    assert mock_absa.analyze_batch.call_count == 1
+    assert len(mock_absa.analyze_batch.call_args[0][0]) == 1
+    
+    assert scores['d1'] == pytest.approx((0.6 * 0.7 + 0.4 * 1.0) * 1.2)
+    assert scores['d2'] == pytest.approx(0.6 * -0.3)
+    assert scores['d3'] == 0.0
+
+def test_integration_many_tickers_one_pass(mock_pipeline):
+    mock_finbert, mock_absa = mock_pipeline
+    
+    # AAPL: strong positive (goes to ABSA) + noise; MSFT: weak negative (FinBERT only)
+    mock_finbert.predict.return_value = [
+        {'Neutral': 0.1, 'Positive': 0.8, 'Negative': 0.1},
+        {'Neutral': 0.9, 'Positive': 0.05, 'Negative': 0.05},
+        {'Neutral': 0.5, 'Positive': 0.1, 'Negative': 0.4}
+    ]
+    
+    analyzer = SentimentAnalyzer()
+    scores = analyzer.analyze_news_many([
+        ("AAPL", [{'title': 'Good News', 'summary': 'Profits up'}, {'title': 'Boring News', 'summary': 'Nothing happened'}]),
+        ("MSFT", [{'title': 'Soft News', 'summary': 'Margins dip'}]),
+        ("TSLA", [])
+    ])
+    
+    # One FinBERT pass and one ABSA batch for all tickers
+    assert mock_finbert.predict.call_count == 1
+    assert len(mock_finbert.predict.call_args[0][0]) == 3
+    assert mock_absa.analyze_batch.call_count == 1
+    
+    assert scores == {
+        "AAPL": pytest.approx((0.6 * 0.7 + 0.4 * 1.0) * 1.2),
+        "MSFT": pytest.approx(0.6 * -0.3),
+        "TSLA": 0.0
+    }
+
+def test_integration_shared_headline_sent_to_absa_once(mock_pipeline):
+    mock_finbert, mock_absa = mock_pipeline
+    
+    # The same strong headline tagged to two tickers
+    mock_finbert.predict.return_value = [
+        {'Neutral': 0.1, 'Positive': 0.8, 'Negative': 0.1},
+        {'Neutral': 0.1, 'Positive': 0.8, 'Negative': 0.1}
+    ]
+    shared = {'title': 'Chip stocks rally', 'summary': 'Demand up'}
+    
+    analyzer = SentimentAnalyzer()
+    scores = analyzer.analyze_news_many([("NVDA", [shared]), ("AMD", [shared])])
+    
+    assert mock_absa.analyze_batch.call_args[0][0] == ['Chip stocks rally. Demand up']
+    expected = (0.6 * 0.7 + 0.4 * 1.0) * 1.2
+    assert scores == {"NVDA": pytest.approx(expected), "AMD": pytest.approx(expected)}
+
+def test_integration_whitespace_variant_scored_once(mock_pipeline):
+    mock_finbert, mock_absa = mock_pipeline
+    
+    mock_finbert.predict.return_value = [{'Neutral': 0.1, 'Positive': 0.8, 'Negative': 0.1}]
+    a = {'title': 'Fed raises rates by 25bp', 'summary': 'The central bank lifted its benchmark rate again.'}
+    b = {'title': 'Fed raises  rates by 25bp', 'summary': 'The central bank lifted its benchmark rate again.'}
+    
+    analyzer = SentimentAnalyzer()
+    scores = analyzer.analyze_news_many([("SPY", [a]), ("QQQ", [b])])
+    
+    # One FinBERT text and one ABSA text for the shared article
+    assert len(mock_finbert.predict.call_args[0][0]) == 1
+    assert len(mock_absa.analyze_batch.call_args[0][0]) == 1
+    assert scores["SPY"] == scores["QQQ"] == pytest.approx((0.6 * 0.7 + 0.4 * 1.0) * 1.2)
+
+def test_integration_near_identical_articles_scored_separately(mock_pipeline):
+    mock_finbert, mock_absa = mock_pipeline
+    
+    mock_finbert.predict.return_value = [
+        {'Neutral': 0.1, 'Positive': 0.8, 'Negative': 0.1},
+        {'Neutral': 0.1, 'Positive': 0.1, 'Negative': 0.8}
+    ]
+    mock_absa.analyze_batch.return_value = [
+        {'Overall_Sentiment': 'Positive', 'Positive_Aspect': [], 'Negative_Aspect': []},
+        {'Overall_Sentiment': 'Negative', 'Positive_Aspect': [], 'Negative_Aspect': []}
+    ]
+    # Differ only in a figure: each must be scored on its own text
+    a = {'title': 'Fed raises rates by 25bp as inflation stays sticky', 'summary': 'Benchmark rate lifted again.'}
+    b = {'title': 'Fed raises rates by 75bp as inflation stays sticky', 'summary': 'Benchmark rate lifted again.'}
+    
+    analyzer = SentimentAnalyzer()
+    scores = analyzer.analyze_news_many([("SPY", [a]), ("QQQ", [b])])
+    
+    assert len(mock_finbert.predict.call_args[0][0]) == 2
+    assert len(mock_absa.analyze_batch.call_args[0][0]) == 2
+    assert scores["SPY"] == pytest.approx(0.6 * 0.7 + 0.4 * 1.0)
+    assert scores["QQQ"] == pytest.approx(0.6 * -0.7 + 0.4 * -1.0)
@@ -1,5 +1,5 @@
 import pytest
-from src.config.settings import settings
+from src.config.settings import settings, get_settings
 
 def test_settings_expansion_existence():
     """
@@ -34,3 +34,10 @@ def test_settings_expansion_values():
     # DEFAULT_TIMEOUT
     assert isinstance(settings.DEFAULT_TIMEOUT, float), "DEFAULT_TIMEOUT should be a float"
     assert settings.DEFAULT_TIMEOUT == 30.0, "DEFAULT_TIMEOUT should be 30.0"
+
+def test_get_settings_is_cached_singleton():
+    """
+    Case C: get_settings() parses once per process and returns the module singleton
+    """
+    assert get_settings() is settings
+    assert get_settings() is get_settings()
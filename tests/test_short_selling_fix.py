@@ -1,5 +1,6 @@
 import pytest
 import collections
+import numpy as np
 from src.analytics.performance import calculate_round_trip_returns
 
 # Mock Trade Object
@@ -94,3 +95,32 @@ def test_short_selling_with_commission():
     
     assert len(returns) == 1
     assert returns[0] == pytest.approx(0.00981)
+
+def test_fragmented_fills_fit_preallocated_buffer():
+    """
+    Many small BUY lots closed by one large SELL that also flips short.
+    Every lot produces a return, so the output must not overflow the 2*N buffer.
+    """
+    trades = [MockTrade('BUY', 100.0, 1.0, entry_equity=1000.0) for _ in range(5)]
+    trades.append(MockTrade('SELL', 110.0, 6.0, entry_equity=1000.0))  # Close 5 longs, open 1 short
+    trades.append(MockTrade('BUY', 100.0, 1.0, entry_equity=1000.0))   # Cover short
+    
+    returns = calculate_round_trip_returns(trades, commission_rate=0.0)
+    
+    assert isinstance(returns, np.ndarray)
+    assert len(returns) == 6
+    assert returns == pytest.approx([0.01] * 6)
+
+def test_legacy_zero_price_lot_emits_no_return():
+    """
+    Legacy trades without entry_equity fall back to price-based returns.
+    A zero-priced lot cannot produce a return and must not leave a slot in the output.
+    """
+    trades = [
+        MockTrade('BUY', 0.0, 1.0, entry_equity=0.0),
+        MockTrade('SELL', 110.0, 1.0, entry_equity=0.0)
+    ]
+    
+    returns = calculate_round_trip_returns(trades, commission_rate=0.0)
+    
+    assert len(returns) == 0
@@ -2,6 +2,7 @@
 import os
 import shutil
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -81,3 +82,133 @@ def test_smart_update_no_file(news_engine):
     news_engine.fetcher.fetch_headlines.return_value = []
     news_engine.update_cache_smart(TEST_TICKER, days_threshold=3)
     news_engine.fetcher.fetch_headlines.assert_called_once()
+
+def test_cache_appends_and_migrates_legacy_file(news_engine):
+    """
+    Case 4: Writes are appended as partitions; the latest write wins for overlapping dates.
+    A single-file cache from older versions is migrated on the next write.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{TEST_TICKER}.parquet")
+    legacy = pd.DataFrame({'sentiment': [0.5, 0.1]}, index=pd.to_datetime(['2023-12-31', '2024-01-01']))
+    legacy.to_parquet(cache_path)
+    
+    update = pd.Series([0.9, 0.3], index=pd.to_datetime(['2024-01-01', '2024-01-02']), name='sentiment')
+    news_engine._write_cache(cache_path, update)
+    
+    assert os.path.isdir(cache_path)
+    
+    cached = news_engine._read_cache(cache_path)['sentiment']
+    assert cached.tolist() == pytest.approx([0.5, 0.9, 0.3])
+    assert news_engine.read_cache(TEST_TICKER, start=pd.Timestamp('2024-01-01'))['sentiment'].tolist() == pytest.approx([0.9, 0.3])
+    
+    window = news_engine.get_sentiment(TEST_TICKER, '2024-01-01', '2024-01-02')
+    assert window.tolist() == pytest.approx([0.9, 0.3])
+    news_engine.fetcher.fetch_headlines.assert_not_called()
+
+def test_oversized_news_split_by_date(news_engine):
+    """
+    Case 5: News over the LLM input budget is analyzed in per-date chunks on the shared pool.
+    """
+    news_engine.fetcher.fetch_headlines.return_value = [
+        {'title': 'a' * 50, 'published': 'Mon, 01 Jan 2024 10:00:00 GMT'},
+        {'title': 'b' * 50, 'published': 'Tue, 02 Jan 2024 10:00:00 GMT'},
+    ]
+    news_engine.analyzer.analyze_news_batched.side_effect = lambda chunk, ticker: {d: 0.5 for d in chunk}
+    news_engine.decay_model.apply_decay.side_effect = lambda dates, raw: pd.Series(raw).reindex(dates)
+    
+    with patch('src.data.news_engine.settings.LLM_MAX_INPUT_CHARS', 60):
+        series = news_engine._fetch_and_analyze(TEST_TICKER)
+    
+    assert news_engine.analyzer.analyze_news_batched.call_count == 2
+    assert series.tolist() == [0.5, 0.5]
+
+def test_legacy_cache_read_once_on_miss(news_engine):
+    """
+    Case 6: A cache miss on a single-file cache decodes it once (load check), not again for the merge.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{TEST_TICKER}.parquet")
+    pd.DataFrame({'sentiment': [0.5]}, index=pd.to_datetime(['2024-01-01'])).to_parquet(cache_path)
+    
+    fresh = pd.Series([0.2, 0.4], index=pd.to_datetime(['2024-01-01', '2024-01-02']), name='sentiment')
+    with patch.object(news_engine, '_fetch_and_analyze', return_value=fresh), \
+         patch('src.data.news_engine.pd.read_parquet', wraps=pd.read_parquet) as read_parquet:
+        news_engine.get_sentiment(TEST_TICKER, '2024-01-01', '2024-01-02')
+    
+    assert read_parquet.call_count == 1
+    assert news_engine._read_cache(cache_path)['sentiment'].tolist() == pytest.approx([0.5, 0.4])
+
+def test_failed_migration_keeps_legacy_cache(news_engine):
+    """
+    Case 6b: Migration writes to a temp directory first; a failed write leaves the legacy file intact.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{TEST_TICKER}.parquet")
+    pd.DataFrame({'sentiment': [0.5]}, index=pd.to_datetime(['2024-01-01'])).to_parquet(cache_path)
+    
+    update = pd.Series([0.9], index=pd.to_datetime(['2024-01-02']), name='sentiment')
+    append = news_engine._append_partition
+    calls = []
+    def append_then_fail(path, frame):
+        calls.append(path)
+        if len(calls) > 1:
+            raise OSError("disk full")
+        append(path, frame)
+    
+    with patch.object(news_engine, '_append_partition', side_effect=append_then_fail):
+        with pytest.raises(OSError):
+            news_engine._write_cache(cache_path, update)
+    
+    assert calls[0] != cache_path
+    
+    assert os.path.isfile(cache_path)
+    assert pd.read_parquet(cache_path)['sentiment'].tolist() == pytest.approx([0.5])
+    assert os.listdir(CACHE_DIR) == [f"{TEST_TICKER}.parquet"]
+
+def test_repeated_reads_served_from_memory(news_engine):
+    """
+    Case 7: Repeated lookups reuse the decoded cache until a write changes its mtime.
+    """
+    cache_path = news_engine._get_cache_path(TEST_TICKER)
+    news_engine._write_cache(cache_path, pd.Series([0.1, 0.2], index=pd.to_datetime(['2024-01-01', '2024-01-02']), name='sentiment'))
+    
+    with patch.object(news_engine, '_read_cache', wraps=news_engine._read_cache) as read_cache:
+        first = news_engine.get_sentiment(TEST_TICKER, '2024-01-01', '2024-01-02')
+        second = news_engine.get_sentiment(TEST_TICKER, '2024-01-02', '2024-01-02')
+        assert read_cache.call_count == 1
+        
+        news_engine._write_cache(cache_path, pd.Series([0.3], index=pd.to_datetime(['2024-01-03']), name='sentiment'))
+        third = news_engine.get_sentiment(TEST_TICKER, '2024-01-01', '2024-01-03')
+        assert read_cache.call_count == 2
+    
+    assert first.tolist() == pytest.approx([0.1, 0.2])
+    assert second.tolist() == pytest.approx([0.2])
+    assert third.tolist() == pytest.approx([0.1, 0.2, 0.3])
+    news_engine.fetcher.fetch_headlines.assert_not_called()
+
+def test_no_news_returns_float32_zeros(news_engine):
+    """
+    Case 8: Without news the requested range is neutral, stored as float32.
+    """
+    news_engine.fetcher.fetch_headlines.return_value = []
+    series = news_engine._fetch_and_analyze(TEST_TICKER, '2024-01-01', '2024-01-10')
+    
+    assert series.dtype == np.float32
+    assert len(series) == 10 and (series == 0.0).all()
+
+def test_smart_update_overrides_but_range_fill_does_not(news_engine):
+    """
+    Case 9: Fresh smart-update scores replace cached days (keep='last');
+    a get_sentiment range fill only adds the days the cache lacks.
+    """
+    cache_path = news_engine._get_cache_path(TEST_TICKER)
+    news_engine._write_cache(cache_path, pd.Series([0.5, 0.5], index=pd.to_datetime(['2024-01-01', '2024-01-02']), name='sentiment'))
+    
+    rescored = pd.Series([-0.5], index=pd.to_datetime(['2024-01-02']), name='sentiment')
+    with patch.object(news_engine, '_fetch_and_analyze', return_value=rescored):
+        news_engine.update_cache_smart(TEST_TICKER, days_threshold=0)
+    
+    filled = pd.Series([0.0, 0.0, 0.0], index=pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03']), name='sentiment')
+    with patch.object(news_engine, '_fetch_and_analyze', return_value=filled):
+        returned = news_engine.get_sentiment(TEST_TICKER, '2024-01-01', '2024-01-03')
+    
+    assert returned.tolist() == [0.0, 0.0, 0.0]
+    assert news_engine._read_cache(cache_path)['sentiment'].tolist() == pytest.approx([0.5, -0.5, 0.0])
@@ -21,6 +21,7 @@ class TestSystemSimulation(unittest.TestCase):
         self.loader = StrategyLoader()
 
     def tearDown(self):
+        self.dm.close_connections()
         if os.path.exists(self.test_db):
             try:
                 os.remove(self.test_db)
@@ -124,7 +125,7 @@ class TestSystemSimulation(unittest.TestCase):
         print(f"Round Trip Returns: {round_trip_returns}")
         
         # 2. Monte Carlo
-        if round_trip_returns:
+        if len(round_trip_returns) > 0:
             mc_results = run_monte_carlo_simulation(round_trip_returns, n_simulations=100, initial_capital=100000)
             self.assertIn('curves', mc_results)
             self.assertIn('var_95_amount', mc_results)
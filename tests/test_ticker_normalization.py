@@ -50,3 +50,33 @@ class TestTickerNormalization:
         """Case C: Already Suffixed - Should return as is"""
         result = data_manager.normalize_ticker("006208.TW")
         assert result == "006208.TW"
+
+    def test_normalize_ticker_resolution_cached(self, tmp_path):
+        """Suffix probes are stored in ticker_resolution: a new DataManager on the same DB does not probe again"""
+        db_path = str(tmp_path / "market.db")
+        dm = DataManager(db_path=db_path)
+        dm.init_db()
+        with patch('src.data_engine.yf.Ticker') as mock_ticker:
+            # Only the .TWO listing has history
+            mock_ticker.side_effect = lambda t: MagicMock(**{'history.return_value': pd.DataFrame({'Close': [100]} if t.endswith('.TWO') else {})})
+            assert dm.normalize_ticker("6547") == "6547.TWO"
+            assert dm.normalize_ticker("6547") == "6547.TWO"
+            assert mock_ticker.call_count == 2 # .TW miss + .TWO hit, once
+        dm.close_connections()
+
+        fresh = DataManager(db_path=db_path)
+        with patch('src.data_engine.yf.Ticker', side_effect=AssertionError("network probe")):
+            assert fresh.normalize_ticker("6547") == "6547.TWO"
+        fresh.close_connections()
+
+    def test_normalize_ticker_memoized_except_failed_probe(self, data_manager):
+        """Results are memoized per input; a fallback after a failed probe is retried on the next call"""
+        with patch.object(data_manager, '_resolve_suffix', return_value=None) as mock_resolve:
+            assert data_manager.normalize_ticker("9999") == "9999.TW"
+            assert data_manager.normalize_ticker("9999") == "9999.TW"
+            assert mock_resolve.call_count == 2
+
+        with patch.object(data_manager, '_resolve_suffix', return_value="9999.TWO") as mock_resolve:
+            assert data_manager.normalize_ticker("9999") == "9999.TWO"
+            assert data_manager.normalize_ticker("9999") == "9999.TWO"
+            assert mock_resolve.call_count == 1
@@ -53,3 +53,31 @@ def test_add_project_root():
     # So we just assert that the root is indeed in sys.path after calling.
     
     assert str(project_root) in sys.path or str(project_root).lower() in [p.lower() for p in sys.path]
+
+def test_token_bucket_rate_limit():
+    from unittest.mock import patch
+    from src.utils import TokenBucket
+
+    # Fake clock: sleeping advances time instead of blocking
+    clock = [100.0]
+    sleeps = []
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    with patch('src.utils.time.monotonic', side_effect=lambda: clock[0]), \
+         patch('src.utils.time.sleep', side_effect=fake_sleep):
+        bucket = TokenBucket(rate=2.0, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        assert sleeps == [] # Burst is served immediately
+        bucket.acquire()
+        assert sleeps == [pytest.approx(0.5)] # Then one token per 1/rate seconds
+
+        clock[0] += 10.0 # Idle time refills at most `capacity` tokens
+        for _ in range(3):
+            bucket.acquire()
+        assert len(sleeps) == 2
+
+    # A non-positive rate disables limiting
+    TokenBucket(rate=0, capacity=1).acquire()
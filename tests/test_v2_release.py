@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 from datetime import datetime
-from queue import Queue
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 from src.core.events import EventType, SignalEvent
@@ -15,7 +15,7 @@ def test_architecture_event_driven():
     """
     engine = BacktestEngine()
     assert hasattr(engine, 'events'), "BacktestEngine must have 'events' queue"
-    assert isinstance(engine.events, Queue), "events must be an instance of Queue"
+    assert isinstance(engine.events, deque), "events must be a deque (single-threaded event bus)"
     
     # Test Event Processing Loop Logic (Simplified trace)
     # We can inject an event and see if it is processed
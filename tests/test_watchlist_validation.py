@@ -10,6 +10,7 @@ class TestWatchlistValidation(unittest.TestCase):
         self.dm.init_db()
 
     def tearDown(self):
+        self.dm.close_connections()
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
 